@@ -10,12 +10,16 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from g_nfl import CUR_WEEK
-from g_nfl.modelling.utils import get_week_spreads
+from g_nfl.utils.async_database import load_week_data
+from g_nfl.utils.backend import get_backend_name
 from g_nfl.utils.config import CUR_SEASON, SURVIVOR_USED_TEAMS
+from g_nfl.utils.slate import build_week_slate
 from g_nfl.utils.web_app import (
-    get_all_lines_data,
+    build_lines_frame,
+    count_picks,
     get_team_logo,
-    load_existing_picks,
+    load_pick_state,
+    partition_picks,
     save_picks_data,
 )
 
@@ -62,6 +66,10 @@ if "picks" in st.session_state:
     st.session_state.picks = cleaned_picks
 
 
+# Regular and best bet picks allowed per week
+MAX_PICKS = 6
+
+
 def get_next_pick_state(current_pick, team_name, current_picks):
     """Get the next state when clicking a team button
 
@@ -128,6 +136,675 @@ def get_button_label(team_name, pick_type):
         return team_name
 
 
+def apply_pick_state(pick_state, picker):
+    """Put a partitioned pick state (see `load_pick_state`) in session state"""
+    st.session_state.picks = pick_state["picks"]
+    st.session_state.survivor_pick = pick_state["survivor_pick"]
+    st.session_state.underdog_pick = pick_state["underdog_pick"]
+    st.session_state.mnf_pick = pick_state["mnf_pick"]
+
+    total_picks = count_picks(pick_state)
+    if total_picks > 0:
+        st.info(f"✅ Loaded {total_picks} existing picks for {picker}")
+
+
+def toggle_pick(game, team_name):
+    """Button callback: cycle the pick for `team_name` in `game`
+
+    Runs before the rerun, so the click is rendered in a single pass.
+    """
+    if game.is_mnf:
+        # MNF pick logic
+        toggle_special_pick("mnf_pick", team_name)
+        return
+
+    # Regular game pick logic
+    current_pick = st.session_state.picks.get(game.game_id, {})
+    if isinstance(current_pick, str):
+        # Handle legacy format
+        current_pick = {"team_picked": current_pick, "pick_type": "regular"}
+
+    next_state = get_next_pick_state(current_pick, team_name, st.session_state.picks)
+    if next_state is None:
+        # Remove the pick
+        st.session_state.picks.pop(game.game_id, None)
+    else:
+        # Add spread info
+        next_state["spread"] = game.spread_line
+        st.session_state.picks[game.game_id] = next_state
+    st.session_state.pick_status_stale = True
+
+
+def toggle_special_pick(state_key, team_name):
+    """Button callback: select or unselect a survivor/underdog/MNF pick"""
+    if st.session_state[state_key] == team_name:
+        st.session_state[state_key] = None
+    else:
+        st.session_state[state_key] = team_name
+    st.session_state.pick_status_stale = True
+
+
+def clear_picks():
+    """Button callback: clear all picks"""
+    st.session_state.picks = {}
+    st.session_state.survivor_pick = None
+    st.session_state.underdog_pick = None
+    st.session_state.mnf_pick = None
+    st.session_state.pick_status_stale = True
+    st.toast("✅ All picks cleared!")
+
+
+def has_picks():
+    """Whether any regular, survivor, underdog or MNF pick is selected"""
+    return bool(
+        st.session_state.picks
+        or st.session_state.survivor_pick
+        or st.session_state.underdog_pick
+        or st.session_state.mnf_pick
+    )
+
+
+def board_layout():
+    """Pick state that changes more than the clicked row or section
+
+    Reaching the pick limit disables the buttons of every other row, and the
+    first pick shows the save buttons.
+    """
+    return (len(st.session_state.picks) >= MAX_PICKS, has_picks())
+
+
+def refresh_pick_status(status_slots, slate, picker):
+    """Redraw the pick counts and summary after a click in a fragment
+
+    Fragments only re-run themselves, so the counts and summary are drawn into
+    placeholders outside the fragments, from the fragment that was clicked.
+    A click that changes the board layout re-runs the whole page instead.
+    """
+    if not st.session_state.pop("pick_status_stale", False):
+        return
+    if board_layout() != st.session_state.get("board_layout"):
+        st.rerun()
+    render_pick_status(status_slots, slate, picker)
+
+
+@st.fragment
+def render_game_row(game, slate, picker, status_slots):
+    """Render one game: logos, pick buttons and lines
+
+    Runs as a fragment, so a pick click only re-runs this row.
+    """
+    game_id = game.game_id
+    is_mnf = game.is_mnf
+
+    if is_mnf:
+        # MNF game uses separate state
+        mnf_selected_team = st.session_state.mnf_pick
+        home_selected = mnf_selected_team == game.home_team
+        away_selected = mnf_selected_team == game.away_team
+        current_pick = None
+        home_pick_type = "mnf" if home_selected else None
+        away_pick_type = "mnf" if away_selected else None
+        max_picks_reached = False  # MNF doesn't count toward 6-pick limit
+    else:
+        # Regular game logic
+        max_picks_reached = len(st.session_state.picks) >= MAX_PICKS
+
+        current_pick = st.session_state.picks.get(game_id, {})
+        if isinstance(current_pick, str):
+            # Handle legacy format
+            current_pick = {
+                "team_picked": current_pick,
+                "pick_type": "regular",
+            }
+
+        home_selected = current_pick.get("team_picked") == game.home_team
+        away_selected = current_pick.get("team_picked") == game.away_team
+
+        # Regular game pick types
+        home_pick_type = (
+            current_pick.get("pick_type", "regular") if home_selected else None
+        )
+        away_pick_type = (
+            current_pick.get("pick_type", "regular") if away_selected else None
+        )
+
+    # Create compact mobile-responsive layout: logo, button, lines, button, logo
+    # Use smaller columns and fixed-width buttons
+    cols = st.columns([0.5, 2, 1.5, 2, 0.5])
+
+    # Away team (left side)
+    away_disabled = (
+        (max_picks_reached and not away_selected) or home_selected or not picker
+    )
+    button_type = get_button_style(away_selected, away_pick_type, away_disabled)
+
+    # Add MNF emoji if this is MNF game
+    if is_mnf:
+        button_label = f"🌙 {game.away_team}"
+    else:
+        button_label = get_button_label(game.away_team, away_pick_type)
+
+    away_logo = get_team_logo(game.away_team)
+
+    with cols[0]:
+        # Away team logo (hidden on very small screens via CSS)
+        if away_logo:
+            st.markdown(
+                f'<img src="{away_logo}" width="30" class="team-logo">',
+                unsafe_allow_html=True,
+            )
+
+    with cols[1]:
+        # Away team button
+        st.button(
+            button_label,
+            key=f"away_{game_id}",
+            type=button_type,
+            disabled=away_disabled,
+            use_container_width=True,
+            on_click=toggle_pick,
+            args=(game, game.away_team),
+        )
+
+    with cols[2]:
+        # Lines in the middle
+        pool_spread = game.pool_spread
+        if pool_spread is not None:
+            pool_text = f"{pool_spread:+g}"
+        else:
+            pool_text = "TBD"
+
+        if game.market_spread is not None:
+            market_spread_text = f"{game.market_spread:+g}"
+        else:
+            market_spread_text = "N/A"
+
+        if game.market_total is not None:
+            market_total_text = f"{game.market_total:g}"
+        else:
+            market_total_text = "N/A"
+
+        # Display lines with progressive hiding based on screen width
+        # Build HTML with CSS classes for responsive hiding
+        lines_html = f'<div style="font-size: 0.875rem; white-space: nowrap;">'
+
+        # Always show pool spread (bold)
+        lines_html += f"<strong>{pool_text}</strong>"
+
+        # Market spread - hide if pool is available and screen is narrow
+        if pool_spread is not None:
+            # Has pool spread - can hide market on narrow screens
+            lines_html += f'<span class="hide-on-narrow"> / {market_spread_text}</span>'
+        else:
+            # No pool spread - always show market
+            lines_html += f" / {market_spread_text}"
+
+        # Total - hide first on narrow screens
+        lines_html += f'<span class="hide-on-medium"> / {market_total_text}</span>'
+
+        lines_html += "</div>"
+        st.markdown(lines_html, unsafe_allow_html=True)
+
+    # Home team (right side)
+    home_disabled = (
+        (max_picks_reached and not home_selected) or away_selected or not picker
+    )
+    button_type = get_button_style(home_selected, home_pick_type, home_disabled)
+
+    # Add MNF emoji if this is MNF game
+    if is_mnf:
+        button_label = f"🌙 {game.home_team}"
+    else:
+        button_label = get_button_label(game.home_team, home_pick_type)
+
+    home_logo = get_team_logo(game.home_team)
+
+    with cols[3]:
+        # Home team button
+        st.button(
+            button_label,
+            key=f"home_{game_id}",
+            type=button_type,
+            disabled=home_disabled,
+            use_container_width=True,
+            on_click=toggle_pick,
+            args=(game, game.home_team),
+        )
+
+    with cols[4]:
+        # Home team logo (hidden on very small screens via CSS)
+        if home_logo:
+            st.markdown(
+                f'<img src="{home_logo}" width="30" class="team-logo">',
+                unsafe_allow_html=True,
+            )
+
+    # Use a thinner divider
+    st.markdown("---")
+
+    refresh_pick_status(status_slots, slate, picker)
+
+
+@st.fragment
+def render_survivor_section(slate, picker, status_slots):
+    """Render the survivor pool picker, re-run on its own as a fragment"""
+    # Survivor Section (Favorites)
+    st.markdown("### 💀 Survivor Pool")
+    st.markdown("Pick ONE favorite (lowest spread) for the week")
+
+    # Get used teams (shared list for everyone)
+    used_teams = SURVIVOR_USED_TEAMS
+
+    # Show used teams if any exist
+    if used_teams:
+        st.info(f"🚫 Already used: {', '.join(sorted(used_teams))}")
+
+    # Favorites sorted by spread (most negative = biggest favorite)
+    favorites = slate.favorites(exclude=used_teams)
+
+    # Display favorites
+    for fav_data in favorites:
+        survivor_selected = st.session_state.survivor_pick == fav_data["team"]
+
+        # Hide row if a different team is selected
+        if st.session_state.survivor_pick is not None and not survivor_selected:
+            continue
+
+        survivor_disabled = not picker
+
+        col1, col2 = st.columns([4, 1])
+
+        with col1:
+            team_logo = get_team_logo(fav_data["team"])
+
+            if team_logo:
+                col_logo, col_info = st.columns([1, 6])
+                with col_logo:
+                    st.image(team_logo, width=35)
+                with col_info:
+                    st.markdown(
+                        f"**{fav_data['team']}** ({fav_data['spread']:+.1f}) vs {fav_data['opponent']}"
+                    )
+            else:
+                st.markdown(
+                    f"**{fav_data['team']}** ({fav_data['spread']:+.1f}) vs {fav_data['opponent']}"
+                )
+
+        with col2:
+            button_type = "primary" if survivor_selected else "secondary"
+            button_text = (
+                f"💀 {fav_data['team']}" if survivor_selected else fav_data["team"]
+            )
+            st.button(
+                button_text,
+                key=f"survivor_{fav_data['game_id']}_{fav_data['team']}",
+                type=button_type,
+                disabled=survivor_disabled,
+                use_container_width=True,
+                on_click=toggle_special_pick,
+                args=("survivor_pick", fav_data["team"]),
+            )
+
+    st.markdown("---")
+
+    refresh_pick_status(status_slots, slate, picker)
+
+
+@st.fragment
+def render_underdog_section(slate, picker, status_slots):
+    """Render the underdog pool picker, re-run on its own as a fragment"""
+    # Underdog Section
+    st.markdown("### 🐶 Underdog Pool")
+    st.markdown("Pick ONE underdog (highest spread) for the week")
+
+    # Underdogs sorted by spread (most positive = biggest underdog)
+    underdogs = slate.underdogs()
+
+    # Display underdogs
+    for dog_data in underdogs:
+        underdog_selected = st.session_state.underdog_pick == dog_data["team"]
+
+        # Hide row if a different team is selected
+        if st.session_state.underdog_pick is not None and not underdog_selected:
+            continue
+
+        underdog_disabled = not picker
+
+        col1, col2 = st.columns([4, 1])
+
+        with col1:
+            team_logo = get_team_logo(dog_data["team"])
+
+            if team_logo:
+                col_logo, col_info = st.columns([1, 6])
+                with col_logo:
+                    st.image(team_logo, width=35)
+                with col_info:
+                    st.markdown(
+                        f"**{dog_data['team']}** (+{dog_data['spread']:.1f}) vs {dog_data['opponent']}"
+                    )
+            else:
+                st.markdown(
+                    f"**{dog_data['team']}** (+{dog_data['spread']:.1f}) vs {dog_data['opponent']}"
+                )
+
+        with col2:
+            button_type = "primary" if underdog_selected else "secondary"
+            button_text = (
+                f"🐶 {dog_data['team']}" if underdog_selected else dog_data["team"]
+            )
+            st.button(
+                button_text,
+                key=f"underdog_{dog_data['game_id']}_{dog_data['team']}",
+                type=button_type,
+                disabled=underdog_disabled,
+                use_container_width=True,
+                on_click=toggle_special_pick,
+                args=("underdog_pick", dog_data["team"]),
+            )
+
+    st.markdown("---")
+
+    refresh_pick_status(status_slots, slate, picker)
+
+
+def get_picks_text(slate, picker):
+    """Picks of the picker as copyable text, None without picks"""
+    # Show picks summary
+    if has_picks() and picker:
+        # Build structured picks list with opponent info
+        best_bets = []
+        regular_picks = []
+        mnf_pick_line = None
+        survivor_pick_line = None
+        underdog_pick_line = None
+
+        # Process regular/best bet picks
+        for game_id, pick_data in st.session_state.picks.items():
+            game = slate.game(game_id)
+            if game is not None:
+                # Handle both old and new pick formats
+                if isinstance(pick_data, str):
+                    team = pick_data
+                    pick_type = "regular"
+                else:
+                    team = pick_data.get("team_picked", "")
+                    pick_type = pick_data.get("pick_type", "regular")
+
+                # Format: TEAM (SPREAD) at/vs OPPONENT
+                pick_line = game.pick_line(team)
+
+                # Add emoji prefix for best bets
+                if pick_type == "best_bet":
+                    best_bets.append(f"⭐️ {pick_line}")
+                else:
+                    regular_picks.append(pick_line)
+
+        # Process MNF pick
+        mnf_game = slate.game_for_team(st.session_state.mnf_pick)
+        if mnf_game is not None:
+            mnf_pick_line = f"🌙 {mnf_game.pick_line(st.session_state.mnf_pick)}"
+
+        # Process Survivor pick
+        survivor_game = slate.game_for_team(st.session_state.survivor_pick)
+        if survivor_game is not None:
+            survivor_pick_line = (
+                f"💀 {survivor_game.pick_line(st.session_state.survivor_pick)}"
+            )
+
+        # Process Underdog pick
+        underdog_game = slate.game_for_team(st.session_state.underdog_pick)
+        if underdog_game is not None:
+            underdog_pick_line = (
+                f"🐶 {underdog_game.pick_line(st.session_state.underdog_pick)}"
+            )
+
+        # Combine in order: Best Bets, Regular Picks, MNF, Survivor, Underdog
+        picks_display = []
+        picks_display.extend(best_bets)
+        picks_display.extend(regular_picks)
+        if mnf_pick_line:
+            picks_display.append(mnf_pick_line)
+        if survivor_pick_line:
+            picks_display.append(survivor_pick_line)
+        if underdog_pick_line:
+            picks_display.append(underdog_pick_line)
+
+        if picks_display:
+            # Create picks text with header
+            picks_header = f"{picker}'s Week {st.session_state.current_week} Picks"
+            picks_body = "\n".join(picks_display)
+            return f"{picks_header}\n\n{picks_body}"
+    return None
+
+
+def render_pick_status(status_slots, slate, picker):
+    """Draw the current pick counts and the pick summary into their placeholders"""
+    counts_slot, summary_slot = status_slots
+
+    # Show current pick counts
+    if has_picks():
+        total_regular = len(st.session_state.picks)
+        has_survivor = "✅" if st.session_state.survivor_pick else "⬜"
+        has_underdog = "✅" if st.session_state.underdog_pick else "⬜"
+        has_mnf = "✅" if st.session_state.mnf_pick else "⬜"
+
+        counts_slot.info(
+            f"**Current Picks**: {total_regular}/{MAX_PICKS} regular • {has_survivor} survivor • {has_underdog} underdog • {has_mnf} MNF"
+        )
+    else:
+        counts_slot.empty()
+
+    picks_text = get_picks_text(slate, picker)
+    if picks_text:
+        with summary_slot.container():
+            st.markdown("---")
+            st.markdown("### 📋 Pick Summary")
+
+            # Display picks in a code block for easy copying
+            st.code(picks_text, language=None)
+    else:
+        summary_slot.empty()
+
+
+@st.fragment
+def render_pick_actions(slate, picker, status_slots):
+    """Save and clear buttons, re-run on their own as a fragment"""
+    picks_text = get_picks_text(slate, picker)
+    if picks_text:
+        st.markdown("---")
+
+        # Action buttons
+        col1, col2, col3 = st.columns([2, 1, 2])
+
+        with col1:
+            # Save button with clipboard copy
+            save_button_clicked = st.button(
+                "💾 Save Picks",
+                type="primary",
+                help="Save your picks to the database and copy to clipboard",
+                key="save_picks_btn",
+            )
+
+            if save_button_clicked:
+                if not picker:
+                    st.error("⚠️ Please select a picker before submitting")
+                elif (
+                    st.session_state.picks
+                    or st.session_state.survivor_pick
+                    or st.session_state.underdog_pick
+                    or st.session_state.mnf_pick
+                ):
+                    # Create combined picks dict - maintain original structure but allow multi-pick save
+                    # Clean up any malformed keys in session state first
+                    cleaned_picks = {}
+                    for key, value in st.session_state.picks.items():
+                        # Only keep properly formatted game_id keys (season_week_away_home format)
+                        if (
+                            key.count("_") >= 3
+                            and not key.endswith("_best")
+                            and not key.endswith("_regular")
+                        ):
+                            cleaned_picks[key] = value
+
+                    # Update session state with cleaned data
+                    st.session_state.picks = cleaned_picks
+                    all_picks = dict(cleaned_picks)  # Copy regular picks
+
+                    # Add survivor pick using actual game ID
+                    survivor_game = slate.game_for_team(st.session_state.survivor_pick)
+                    if survivor_game is not None:
+                        # Use special key for survivor pick to allow combo with regular pick
+                        all_picks[f"survivor_{survivor_game.game_id}"] = {
+                            "team_picked": st.session_state.survivor_pick,
+                            "pick_type": "survivor",
+                            "spread": survivor_game.spread_line,
+                            "game_id": survivor_game.game_id,
+                        }
+
+                    # Add underdog pick using actual game ID
+                    underdog_game = slate.game_for_team(st.session_state.underdog_pick)
+                    if underdog_game is not None:
+                        # Use special key for underdog pick to allow combo with regular pick
+                        all_picks[f"underdog_{underdog_game.game_id}"] = {
+                            "team_picked": st.session_state.underdog_pick,
+                            "pick_type": "underdog",
+                            "spread": underdog_game.spread_line,
+                            "game_id": underdog_game.game_id,
+                        }
+
+                    # Add MNF pick using actual game ID (last game in list)
+                    if st.session_state.mnf_pick and slate.mnf_game:
+                        mnf_game = slate.mnf_game
+                        # Use special key for MNF pick to allow combo with regular pick
+                        all_picks[f"mnf_{mnf_game.game_id}"] = {
+                            "team_picked": st.session_state.mnf_pick,
+                            "pick_type": "mnf",
+                            "spread": mnf_game.spread_line,
+                            "game_id": mnf_game.game_id,
+                        }
+
+                    # Debug: show what we're trying to save
+                    # with st.expander(
+                    #     "🔍 Debug: Show picks data being saved", expanded=False
+                    # ):
+                    #     st.write("**Session State Picks:**")
+                    #     st.json(dict(st.session_state.picks))
+                    #     st.write("**Special Picks:**")
+                    #     st.write(f"Survivor: {st.session_state.survivor_pick}")
+                    #     st.write(f"Underdog: {st.session_state.underdog_pick}")
+                    #     st.write(f"MNF: {st.session_state.mnf_pick}")
+                    #     st.write("**Combined All Picks:**")
+                    #     st.json(
+                    #         {
+                    #             "season": st.session_state.current_season,
+                    #             "week": st.session_state.current_week,
+                    #             "picker": picker,
+                    #             "picks": all_picks,
+                    #         }
+                    #     )
+
+                    # Add more debugging for the save process
+                    # st.write(
+                    #     f"**Attempting to save {len(all_picks)} picks...**"
+                    # )
+
+                    result = save_picks_data(
+                        st.session_state.current_season,
+                        st.session_state.current_week,
+                        all_picks,
+                        picker,
+                    )
+
+                    # Debug the result
+                    # st.write(f"**Save result:** `{repr(result)}`")
+
+                    if result and not result.startswith("ERROR:"):
+                        st.success(f"✅ {result}")
+
+                        # Copy picks to clipboard using JavaScript
+                        clipboard_html = f"""
+                        <script>
+                            navigator.clipboard.writeText(`{picks_text}`).then(function() {{
+                                console.log('Picks copied to clipboard!');
+                            }}, function(err) {{
+                                console.error('Could not copy text: ', err);
+                            }});
+                        </script>
+                        """
+                        st.markdown(clipboard_html, unsafe_allow_html=True)
+                        st.info("📋 Picks copied to clipboard!")
+                    elif result and result.startswith("ERROR:"):
+                        st.error(
+                            f"❌ Failed to save picks: {result[7:]}"
+                        )  # Remove "ERROR: " prefix
+                    elif result is None:
+                        st.error(
+                            "❌ Failed to save picks: save_picks_data returned None"
+                        )
+                    else:
+                        st.error(
+                            f"❌ Failed to save picks: Unexpected result type: {type(result)} - {result}"
+                        )
+                else:
+                    st.warning("⚠️ No picks to save")
+
+        with col3:
+            st.button(
+                "🗑️ Clear All",
+                type="secondary",
+                help="Clear all your picks",
+                on_click=clear_picks,
+            )
+
+    refresh_pick_status(status_slots, slate, picker)
+
+
+def render_pick_board(slate, picker):
+    """Pick grid, special picks and summary
+
+    Every game row, special pick section and the save buttons are separate
+    fragments, so a pick click only re-runs the row or section it was made
+    in. That fragment then redraws the pick counts and summary, which sit in
+    placeholders outside the fragments. A click that changes other rows too
+    (reaching the pick limit, the first pick) re-runs the whole page.
+    """
+    counts_slot = st.empty()
+    board = st.container()
+    summary_slot = st.empty()
+    status_slots = (counts_slot, summary_slot)
+
+    with board:
+        # Create centered container with limited width
+        col_spacer1, col_content, col_spacer2 = st.columns([1, 8, 1])
+
+        with col_content:
+            # Header row
+            header_col1, header_col2, header_col3 = st.columns([2, 2, 2])
+            with header_col1:
+                st.markdown("**🏃 Away Team**")
+            with header_col2:
+                st.markdown("**📊 Lines (Pool / Market / Total)**")
+            with header_col3:
+                st.markdown("**🏠 Home Team**")
+            st.markdown("---")
+
+            # Render regular/best bet games (including MNF)
+            for game in slate:
+                with st.container():
+                    render_game_row(game, slate, picker, status_slots)
+
+            render_survivor_section(slate, picker, status_slots)
+            render_underdog_section(slate, picker, status_slots)
+
+    render_pick_actions(slate, picker, status_slots)
+
+    # Full run: draw the status once and remember the layout it was drawn for
+    st.session_state.pop("pick_status_stale", None)
+    render_pick_status(status_slots, slate, picker)
+    st.session_state.board_layout = board_layout()
+
+
 st.title("🎯 Make Picks")
 
 # Sidebar info
@@ -396,90 +1073,58 @@ if (
         "last_picker" not in st.session_state or st.session_state.last_picker != picker
     )
 ):
-    # Load all picks from database
-    from g_nfl.utils.database import PicksDatabase
-
-    db = PicksDatabase()
-    all_picks_list = db.get_picks(
-        st.session_state.current_season, st.session_state.current_week, picker
+    # Cached per (season, week, picker) - no rerun needed, the page below
+    # renders from the session state set here
+    apply_pick_state(
+        load_pick_state(
+            st.session_state.current_season, st.session_state.current_week, picker
+        ),
+        picker,
     )
-
-    # Separate picks by type
-    regular_picks = {}
-    survivor_pick = None
-    underdog_pick = None
-    mnf_pick = None
-
-    for pick in all_picks_list:
-        game_id = pick["game_id"]
-        pick_type = pick.get("pick_type", "regular")
-        team_picked = pick["team_picked"]
-
-        if pick_type in ["regular", "best_bet"]:
-            regular_picks[game_id] = {
-                "team_picked": team_picked,
-                "pick_type": pick_type,
-                "spread": pick.get("spread"),
-            }
-        elif pick_type == "survivor":
-            survivor_pick = team_picked
-        elif pick_type == "underdog":
-            underdog_pick = team_picked
-        elif pick_type == "mnf":
-            mnf_pick = team_picked
-
-    st.session_state.picks = regular_picks
-    st.session_state.survivor_pick = survivor_pick
-    st.session_state.underdog_pick = underdog_pick
-    st.session_state.mnf_pick = mnf_pick
     st.session_state.last_picker = picker
-
-    total_picks = (
-        len(regular_picks)
-        + (1 if survivor_pick else 0)
-        + (1 if underdog_pick else 0)
-        + (1 if mnf_pick else 0)
+    st.session_state.last_week_season_picker = (
+        st.session_state.current_week,
+        st.session_state.current_season,
+        picker,
     )
-    if total_picks > 0:
-        st.info(f"✅ Loaded {total_picks} existing picks for {picker}")
-    st.rerun()
 
 if load_button or "games_data" not in st.session_state:
     try:
         with st.spinner("Loading NFL games data..."):
             # Always use database data (deployment-ready)
             try:
-                # Check environment variables
-                import os
-
-                from g_nfl.utils.database import MarketLinesDatabase
-
-                supabase_url = os.getenv("SUPABASE_URL")
-                supabase_key = os.getenv("SUPABASE_ANON_KEY")
-
-                # Try streamlit secrets as fallback
-                if not supabase_url or not supabase_key:
-                    try:
-                        if not supabase_url:
-                            supabase_url = st.secrets["SUPABASE_URL"]
-                        if not supabase_key:
-                            supabase_key = st.secrets["SUPABASE_ANON_KEY"]
-                        st.info("✅ Found credentials in Streamlit secrets")
-                    except:
-                        st.error("❌ Missing environment variables and secrets")
-                        st.markdown(
-                            """
-                        **Required environment variables:**
-                        - `SUPABASE_URL`: Your Supabase project URL
-                        - `SUPABASE_ANON_KEY`: Your Supabase anon/public key
+                # Only the Supabase backend needs credentials
+                if get_backend_name() == "supabase":
+                    # Check environment variables
+                    import os
+
+                    supabase_url = os.getenv("SUPABASE_URL")
+                    supabase_key = os.getenv("SUPABASE_ANON_KEY")
+
+                    # Try streamlit secrets as fallback
+                    if not supabase_url or not supabase_key:
+                        try:
+                            if not supabase_url:
+                                supabase_url = st.secrets["SUPABASE_URL"]
+                            if not supabase_key:
+                                supabase_key = st.secrets["SUPABASE_ANON_KEY"]
+                            st.info("✅ Found credentials in Streamlit secrets")
+                        except:
+                            st.error("❌ Missing environment variables and secrets")
+                            st.markdown(
+                                """
+                            **Required environment variables:**
+                            - `SUPABASE_URL`: Your Supabase project URL
+                            - `SUPABASE_ANON_KEY`: Your Supabase anon/public key
 
-                        Set these in your Streamlit Cloud app settings under 'Secrets management'.
-                        """
-                        )
-                        st.stop()
+                            Set these in your Streamlit Cloud app settings under 'Secrets management'.
+                            """
+                            )
+                            st.stop()
 
-                market_db = MarketLinesDatabase()
-                market_lines = market_db.get_market_lines(season, week)
+                # Market lines, pool spreads and picks are fetched concurrently
+                week_data = load_week_data(season, week, picker)
+                market_lines = week_data["market_lines"]
             except Exception as db_error:
                 st.error(f"❌ Database error: {str(db_error)}")
                 st.markdown(f"**Error details:** {type(db_error).__name__}")
@@ -533,10 +1178,17 @@ if load_button or "games_data" not in st.session_state:
             st.session_state.current_season = season
             st.session_state.data_source = data_source
 
-            # Load market lines and pool spreads
-            lines_data = get_all_lines_data(season, week)
+            # Combine market lines and pool spreads
+            lines_data = build_lines_frame(
+                market_lines, week_data["pool_spreads"]
+            ).to_dict("index")
             st.session_state.lines_data = lines_data
 
+            # Resolve spreads, MNF game and team lookups once per load
+            st.session_state.slate = build_week_slate(
+                season, week, games_df, lines_data
+            )
+
             # Debug: show lines data structure
             # with st.expander("🔍 Debug: Show lines data", expanded=False):
             #     st.write("**Games DataFrame game IDs:**")
@@ -557,56 +1209,17 @@ if load_button or "games_data" not in st.session_state:
                 or st.session_state.last_week_season_picker != (week, season, picker)
             ):
                 if picker:  # Only load picks if a picker is selected
-                    # Load all picks from database
-                    from g_nfl.utils.database import PicksDatabase
-
-                    db = PicksDatabase()
-                    all_picks_list = db.get_picks(season, week, picker)
-
-                    # Separate picks by type
-                    regular_picks = {}
-                    survivor_pick = None
-                    underdog_pick = None
-                    mnf_pick = None
-
-                    for pick in all_picks_list:
-                        game_id = pick["game_id"]
-                        pick_type = pick.get("pick_type", "regular")
-                        team_picked = pick["team_picked"]
-
-                        if pick_type in ["regular", "best_bet"]:
-                            regular_picks[game_id] = {
-                                "team_picked": team_picked,
-                                "pick_type": pick_type,
-                                "spread": pick.get("spread"),
-                            }
-                        elif pick_type == "survivor":
-                            survivor_pick = team_picked
-                        elif pick_type == "underdog":
-                            underdog_pick = team_picked
-                        elif pick_type == "mnf":
-                            mnf_pick = team_picked
-
-                    st.session_state.picks = regular_picks
-                    st.session_state.survivor_pick = survivor_pick
-                    st.session_state.underdog_pick = underdog_pick
-                    st.session_state.mnf_pick = mnf_pick
-
-                    total_picks = (
-                        len(regular_picks)
-                        + (1 if survivor_pick else 0)
-                        + (1 if underdog_pick else 0)
-                        + (1 if mnf_pick else 0)
+                    # Picks were fetched alongside the lines
+                    pick_state = load_pick_state(
+                        season, week, picker, week_data["picks"]
                     )
-                    if total_picks > 0:
-                        st.info(f"✅ Loaded {total_picks} existing picks for {picker}")
                 else:
-                    st.session_state.picks = {}
-                    st.session_state.survivor_pick = None
-                    st.session_state.underdog_pick = None
-                    st.session_state.mnf_pick = None
+                    pick_state = partition_picks([])
+                apply_pick_state(pick_state, picker)
 
                 st.session_state.last_week_season_picker = (week, season, picker)
+                # Picks for this picker are loaded, skip the picker-change path
+                st.session_state.last_picker = picker
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         st.stop()
@@ -614,8 +1227,20 @@ if load_button or "games_data" not in st.session_state:
 
 if "games_data" in st.session_state:
     games_df = st.session_state.games_data
+    slate = st.session_state.get("slate")
+    if slate is None or (slate.season, slate.week) != (
+        st.session_state.current_season,
+        st.session_state.current_week,
+    ):
+        slate = build_week_slate(
+            st.session_state.current_season,
+            st.session_state.current_week,
+            games_df,
+            st.session_state.get("lines_data", {}),
+        )
+        st.session_state.slate = slate
 
-    if not games_df.empty:
+    if len(slate):
         # Show instruction if no picker selected
         if not picker:
             st.warning("👆 Please select your name above to start making picks")
@@ -625,828 +1250,12 @@ if "games_data" in st.session_state:
         st.markdown("---")
         st.markdown(f"### 🏈 Week {st.session_state.current_week} Games")
 
-        # Show current pick counts
-        if (
-            st.session_state.picks
-            or st.session_state.survivor_pick
-            or st.session_state.underdog_pick
-            or st.session_state.mnf_pick
-        ):
-            total_regular = len(st.session_state.picks)
-            has_survivor = "✅" if st.session_state.survivor_pick else "⬜"
-            has_underdog = "✅" if st.session_state.underdog_pick else "⬜"
-            has_mnf = "✅" if st.session_state.mnf_pick else "⬜"
-
-            st.info(
-                f"**Current Picks**: {total_regular}/6 regular • {has_survivor} survivor • {has_underdog} underdog • {has_mnf} MNF"
-            )
-
-        # Create centered container with limited width
-        col_spacer1, col_content, col_spacer2 = st.columns([1, 8, 1])
-
-        with col_content:
-            # Header row
-            header_col1, header_col2, header_col3 = st.columns([2, 2, 2])
-            with header_col1:
-                st.markdown("**🏃 Away Team**")
-            with header_col2:
-                st.markdown("**📊 Lines (Pool / Market / Total)**")
-            with header_col3:
-                st.markdown("**🏠 Home Team**")
-            st.markdown("---")
-
-            # Prepare games with spread data for sorting
-            games_with_spreads = []
-            for game_index, (_, game) in enumerate(games_df.iterrows()):
-                game_id = game.name
-                is_mnf = game_index == len(games_df) - 1
-
-                # Get spread (pool preferred, fallback to market)
-                lines = st.session_state.get("lines_data", {}).get(game_id, {})
-                pool_spread = lines.get("pool_spread")
-                market_spread = lines.get("market_spread")
-                if market_spread is None and pd.notna(game["spread_line"]):
-                    market_spread = game["spread_line"]
-
-                effective_spread = (
-                    pool_spread if pool_spread is not None else market_spread
-                )
-
-                games_with_spreads.append(
-                    {
-                        "game": game,
-                        "game_id": game_id,
-                        "game_index": game_index,
-                        "is_mnf": is_mnf,
-                        "spread": effective_spread,
-                    }
-                )
-
-            # Render regular/best bet games (including MNF)
-            for game_data in games_with_spreads:
-                game = game_data["game"]
-                game_id = game_data["game_id"]
-                is_mnf = game_data["is_mnf"]
-
-                with st.container():
-                    if is_mnf:
-                        # MNF game uses separate state
-                        mnf_selected_team = st.session_state.mnf_pick
-                        home_selected = mnf_selected_team == game["home_team"]
-                        away_selected = mnf_selected_team == game["away_team"]
-                        current_pick = None
-                        home_pick_type = "mnf" if home_selected else None
-                        away_pick_type = "mnf" if away_selected else None
-                        max_picks_reached = (
-                            False  # MNF doesn't count toward 6-pick limit
-                        )
-                    else:
-                        # Regular game logic
-                        max_picks_reached = len(st.session_state.picks) >= 6
-                        game_has_selection = game_id in st.session_state.picks
-
-                        current_pick = st.session_state.picks.get(game_id, {})
-                        if isinstance(current_pick, str):
-                            # Handle legacy format
-                            current_pick = {
-                                "team_picked": current_pick,
-                                "pick_type": "regular",
-                            }
-
-                        home_selected = (
-                            current_pick.get("team_picked") == game["home_team"]
-                        )
-                        away_selected = (
-                            current_pick.get("team_picked") == game["away_team"]
-                        )
-
-                        # Regular game pick types
-                        home_pick_type = (
-                            current_pick.get("pick_type", "regular")
-                            if home_selected
-                            else None
-                        )
-                        away_pick_type = (
-                            current_pick.get("pick_type", "regular")
-                            if away_selected
-                            else None
-                        )
-
-                    # Create compact mobile-responsive layout: logo, button, lines, button, logo
-                    # Use smaller columns and fixed-width buttons
-                    cols = st.columns([0.5, 2, 1.5, 2, 0.5])
-
-                    # Away team (left side)
-                    away_disabled = (
-                        (max_picks_reached and not away_selected)
-                        or home_selected
-                        or not picker
-                    )
-                    button_type = get_button_style(
-                        away_selected, away_pick_type, away_disabled
-                    )
-
-                    # Add MNF emoji if this is MNF game
-                    if is_mnf:
-                        button_label = f"🌙 {game['away_team']}"
-                    else:
-                        button_label = get_button_label(
-                            game["away_team"], away_pick_type
-                        )
-
-                    away_logo = get_team_logo(game["away_team"])
-
-                    with cols[0]:
-                        # Away team logo (hidden on very small screens via CSS)
-                        if away_logo:
-                            st.markdown(
-                                f'<img src="{away_logo}" width="30" class="team-logo">',
-                                unsafe_allow_html=True,
-                            )
-
-                    with cols[1]:
-                        # Away team button
-                        if st.button(
-                            button_label,
-                            key=f"away_{game_id}",
-                            type=button_type,
-                            disabled=away_disabled,
-                            use_container_width=True,
-                        ):
-                            if is_mnf:
-                                # MNF pick logic
-                                if away_selected:
-                                    st.session_state.mnf_pick = None
-                                else:
-                                    st.session_state.mnf_pick = game["away_team"]
-                            else:
-                                # Regular game pick logic
-                                next_state = get_next_pick_state(
-                                    current_pick,
-                                    game["away_team"],
-                                    st.session_state.picks,
-                                )
-                                if next_state is None:
-                                    # Remove the pick
-                                    if game_id in st.session_state.picks:
-                                        del st.session_state.picks[game_id]
-                                else:
-                                    # Add spread info
-                                    next_state["spread"] = game.get("spread_line")
-                                    st.session_state.picks[game_id] = next_state
-                            st.rerun()
-
-                    with cols[2]:
-                        # Lines in the middle
-                        lines = st.session_state.get("lines_data", {}).get(game_id, {})
-
-                        # Pool spread
-                        pool_spread = lines.get("pool_spread")
-                        if pool_spread is not None:
-                            pool_text = f"{pool_spread:+g}"
-                        else:
-                            pool_text = "TBD"
-
-                        # Market spread (fallback to nfl_data)
-                        market_spread = lines.get("market_spread")
-                        if market_spread is None and pd.notna(game["spread_line"]):
-                            market_spread = game["spread_line"]
-
-                        if market_spread is not None:
-                            market_spread_text = f"{market_spread:+g}"
-                        else:
-                            market_spread_text = "N/A"
-
-                        # Market total (fallback to nfl_data)
-                        market_total = lines.get("market_total")
-                        if market_total is None and pd.notna(game["total_line"]):
-                            market_total = game["total_line"]
-
-                        if market_total is not None:
-                            market_total_text = f"{market_total:g}"
-                        else:
-                            market_total_text = "N/A"
-
-                        # Display lines with progressive hiding based on screen width
-                        # Build HTML with CSS classes for responsive hiding
-                        lines_html = (
-                            f'<div style="font-size: 0.875rem; white-space: nowrap;">'
-                        )
-
-                        # Always show pool spread (bold)
-                        lines_html += f"<strong>{pool_text}</strong>"
-
-                        # Market spread - hide if pool is available and screen is narrow
-                        if pool_spread is not None:
-                            # Has pool spread - can hide market on narrow screens
-                            lines_html += f'<span class="hide-on-narrow"> / {market_spread_text}</span>'
-                        else:
-                            # No pool spread - always show market
-                            lines_html += f" / {market_spread_text}"
-
-                        # Total - hide first on narrow screens
-                        lines_html += f'<span class="hide-on-medium"> / {market_total_text}</span>'
-
-                        lines_html += "</div>"
-                        st.markdown(lines_html, unsafe_allow_html=True)
-
-                    # Home team (right side)
-                    home_disabled = (
-                        (max_picks_reached and not home_selected)
-                        or away_selected
-                        or not picker
-                    )
-                    button_type = get_button_style(
-                        home_selected, home_pick_type, home_disabled
-                    )
-
-                    # Add MNF emoji if this is MNF game
-                    if is_mnf:
-                        button_label = f"🌙 {game['home_team']}"
-                    else:
-                        button_label = get_button_label(
-                            game["home_team"], home_pick_type
-                        )
-
-                    home_logo = get_team_logo(game["home_team"])
-
-                    with cols[3]:
-                        # Home team button
-                        if st.button(
-                            button_label,
-                            key=f"home_{game_id}",
-                            type=button_type,
-                            disabled=home_disabled,
-                            use_container_width=True,
-                        ):
-                            if is_mnf:
-                                # MNF pick logic
-                                if home_selected:
-                                    st.session_state.mnf_pick = None
-                                else:
-                                    st.session_state.mnf_pick = game["home_team"]
-                            else:
-                                # Regular game pick logic
-                                next_state = get_next_pick_state(
-                                    current_pick,
-                                    game["home_team"],
-                                    st.session_state.picks,
-                                )
-                                if next_state is None:
-                                    # Remove the pick
-                                    if game_id in st.session_state.picks:
-                                        del st.session_state.picks[game_id]
-                                else:
-                                    # Add spread info
-                                    next_state["spread"] = game.get("spread_line")
-                                    st.session_state.picks[game_id] = next_state
-                            st.rerun()
-
-                    with cols[4]:
-                        # Home team logo (hidden on very small screens via CSS)
-                        if home_logo:
-                            st.markdown(
-                                f'<img src="{home_logo}" width="30" class="team-logo">',
-                                unsafe_allow_html=True,
-                            )
-
-                    # Use a thinner divider
-                    st.markdown("---")
-
-            # Survivor Section (Favorites)
-            st.markdown("### 💀 Survivor Pool")
-            st.markdown("Pick ONE favorite (lowest spread) for the week")
-
-            # Get used teams (shared list for everyone)
-            used_teams = SURVIVOR_USED_TEAMS
-
-            # Show used teams if any exist
-            if used_teams:
-                st.info(f"🚫 Already used: {', '.join(sorted(used_teams))}")
-
-            # Sort games by spread (most negative = biggest favorite)
-            favorites = []
-            for game_data in games_with_spreads:
-                if game_data["spread"] is not None:
-                    game = game_data["game"]
-                    spread = game_data["spread"]
-                    game_id = game_data["game_id"]
-
-                    # Determine favorite (negative spread = away favorite, positive = home favorite)
-                    if spread < 0:
-                        favorite_team = game["away_team"]
-                        opponent_team = game["home_team"]
-                        favorite_spread = spread
-                    else:
-                        favorite_team = game["home_team"]
-                        opponent_team = game["away_team"]
-                        favorite_spread = -spread
-
-                    # Skip teams that have already been used for survivor picks
-                    if favorite_team in used_teams:
-                        continue
-
-                    favorites.append(
-                        {
-                            "team": favorite_team,
-                            "opponent": opponent_team,
-                            "spread": favorite_spread,
-                            "game_id": game_id,
-                            "game": game,
-                        }
-                    )
-
-            # Sort by spread (most negative first = biggest favorite)
-            favorites.sort(key=lambda x: x["spread"])
-
-            # Display favorites
-            for fav_data in favorites:
-                survivor_selected = st.session_state.survivor_pick == fav_data["team"]
-
-                # Hide row if a different team is selected
-                if st.session_state.survivor_pick is not None and not survivor_selected:
-                    continue
-
-                survivor_disabled = not picker
-
-                col1, col2 = st.columns([4, 1])
-
-                with col1:
-                    team_logo = get_team_logo(fav_data["team"])
-
-                    if team_logo:
-                        col_logo, col_info = st.columns([1, 6])
-                        with col_logo:
-                            st.image(team_logo, width=35)
-                        with col_info:
-                            st.markdown(
-                                f"**{fav_data['team']}** ({fav_data['spread']:+.1f}) vs {fav_data['opponent']}"
-                            )
-                    else:
-                        st.markdown(
-                            f"**{fav_data['team']}** ({fav_data['spread']:+.1f}) vs {fav_data['opponent']}"
-                        )
-
-                with col2:
-                    button_type = "primary" if survivor_selected else "secondary"
-                    button_text = (
-                        f"💀 {fav_data['team']}"
-                        if survivor_selected
-                        else fav_data["team"]
-                    )
-                    if st.button(
-                        button_text,
-                        key=f"survivor_{fav_data['game_id']}_{fav_data['team']}",
-                        type=button_type,
-                        disabled=survivor_disabled,
-                        use_container_width=True,
-                    ):
-                        if survivor_selected:
-                            st.session_state.survivor_pick = None
-                        else:
-                            st.session_state.survivor_pick = fav_data["team"]
-                        st.rerun()
-
-            st.markdown("---")
-
-            # Underdog Section
-            st.markdown("### 🐶 Underdog Pool")
-            st.markdown("Pick ONE underdog (highest spread) for the week")
-
-            # Sort games by spread (most positive = biggest underdog)
-            underdogs = []
-            for game_data in games_with_spreads:
-                if game_data["spread"] is not None:
-                    game = game_data["game"]
-                    spread = game_data["spread"]
-                    game_id = game_data["game_id"]
-
-                    # Determine underdog (negative spread = home underdog, positive = away underdog)
-                    if spread < 0:
-                        underdog_team = game["home_team"]
-                        opponent_team = game["away_team"]
-                        underdog_spread = -spread  # Flip to positive
-                    else:
-                        underdog_team = game["away_team"]
-                        opponent_team = game["home_team"]
-                        underdog_spread = spread
-
-                    underdogs.append(
-                        {
-                            "team": underdog_team,
-                            "opponent": opponent_team,
-                            "spread": underdog_spread,
-                            "game_id": game_id,
-                            "game": game,
-                        }
-                    )
-
-            # Sort by spread (most positive first = biggest underdog)
-            underdogs.sort(key=lambda x: x["spread"], reverse=True)
-
-            # Display underdogs
-            for dog_data in underdogs:
-                underdog_selected = st.session_state.underdog_pick == dog_data["team"]
-
-                # Hide row if a different team is selected
-                if st.session_state.underdog_pick is not None and not underdog_selected:
-                    continue
-
-                underdog_disabled = not picker
-
-                col1, col2 = st.columns([4, 1])
-
-                with col1:
-                    team_logo = get_team_logo(dog_data["team"])
-
-                    if team_logo:
-                        col_logo, col_info = st.columns([1, 6])
-                        with col_logo:
-                            st.image(team_logo, width=35)
-                        with col_info:
-                            st.markdown(
-                                f"**{dog_data['team']}** (+{dog_data['spread']:.1f}) vs {dog_data['opponent']}"
-                            )
-                    else:
-                        st.markdown(
-                            f"**{dog_data['team']}** (+{dog_data['spread']:.1f}) vs {dog_data['opponent']}"
-                        )
-
-                with col2:
-                    button_type = "primary" if underdog_selected else "secondary"
-                    button_text = (
-                        f"🐶 {dog_data['team']}"
-                        if underdog_selected
-                        else dog_data["team"]
-                    )
-                    if st.button(
-                        button_text,
-                        key=f"underdog_{dog_data['game_id']}_{dog_data['team']}",
-                        type=button_type,
-                        disabled=underdog_disabled,
-                        use_container_width=True,
-                    ):
-                        if underdog_selected:
-                            st.session_state.underdog_pick = None
-                        else:
-                            st.session_state.underdog_pick = dog_data["team"]
-                        st.rerun()
-
-            st.markdown("---")
-
-        # Show picks summary
-        if (
-            st.session_state.picks
-            or st.session_state.survivor_pick
-            or st.session_state.underdog_pick
-            or st.session_state.mnf_pick
-        ) and picker:
-            st.markdown("---")
-            st.markdown("### 📋 Pick Summary")
-
-            # Build structured picks list with opponent info
-            best_bets = []
-            regular_picks = []
-            mnf_pick_line = None
-            survivor_pick_line = None
-            underdog_pick_line = None
-
-            # Process regular/best bet picks
-            for game_id, pick_data in st.session_state.picks.items():
-                if game_id in games_df.index:
-                    game = games_df.loc[game_id]
-
-                    # Handle both old and new pick formats
-                    if isinstance(pick_data, str):
-                        team = pick_data
-                        pick_type = "regular"
-                    else:
-                        team = pick_data.get("team_picked", "")
-                        pick_type = pick_data.get("pick_type", "regular")
-
-                    # Determine opponent and location
-                    if team == game["away_team"]:
-                        opponent = game["home_team"]
-                        location = "at"
-                    else:
-                        opponent = game["away_team"]
-                        location = "vs"
-
-                    # Show spread - flip for home teams
-                    if pd.notna(game["spread_line"]):
-                        base_spread = game["spread_line"]
-                        # If picked team is home team, flip the spread
-                        if team == game["home_team"]:
-                            display_spread = -base_spread
-                        else:
-                            display_spread = base_spread
-                        spread = f"({display_spread:+.1f})"
-                    else:
-                        spread = ""
-
-                    # Format: TEAM (SPREAD) at/vs OPPONENT
-                    pick_line = f"{team} {spread} {location} {opponent}"
-
-                    # Add emoji prefix for best bets
-                    if pick_type == "best_bet":
-                        best_bets.append(f"⭐️ {pick_line}")
-                    else:
-                        regular_picks.append(pick_line)
-
-            # Process MNF pick
-            if st.session_state.mnf_pick:
-                # Find the MNF game to get opponent
-                for game_id, game in games_df.iterrows():
-                    if st.session_state.mnf_pick in [
-                        game["away_team"],
-                        game["home_team"],
-                    ]:
-                        team = st.session_state.mnf_pick
-                        if team == game["away_team"]:
-                            opponent = game["home_team"]
-                            location = "at"
-                        else:
-                            opponent = game["away_team"]
-                            location = "vs"
-
-                        # Show spread
-                        if pd.notna(game["spread_line"]):
-                            base_spread = game["spread_line"]
-                            if team == game["home_team"]:
-                                display_spread = -base_spread
-                            else:
-                                display_spread = base_spread
-                            spread = f"({display_spread:+.1f})"
-                        else:
-                            spread = ""
-
-                        mnf_pick_line = f"🌙 {team} {spread} {location} {opponent}"
-                        break
-
-            # Process Survivor pick
-            if st.session_state.survivor_pick:
-                # Find the game to get opponent
-                for game_id, game in games_df.iterrows():
-                    if st.session_state.survivor_pick in [
-                        game["away_team"],
-                        game["home_team"],
-                    ]:
-                        team = st.session_state.survivor_pick
-                        if team == game["away_team"]:
-                            opponent = game["home_team"]
-                            location = "at"
-                        else:
-                            opponent = game["away_team"]
-                            location = "vs"
-
-                        # Show spread
-                        if pd.notna(game["spread_line"]):
-                            base_spread = game["spread_line"]
-                            if team == game["home_team"]:
-                                display_spread = -base_spread
-                            else:
-                                display_spread = base_spread
-                            spread = f"({display_spread:+.1f})"
-                        else:
-                            spread = ""
-
-                        survivor_pick_line = f"💀 {team} {spread} {location} {opponent}"
-                        break
-
-            # Process Underdog pick
-            if st.session_state.underdog_pick:
-                # Find the game to get opponent
-                for game_id, game in games_df.iterrows():
-                    if st.session_state.underdog_pick in [
-                        game["away_team"],
-                        game["home_team"],
-                    ]:
-                        team = st.session_state.underdog_pick
-                        if team == game["away_team"]:
-                            opponent = game["home_team"]
-                            location = "at"
-                        else:
-                            opponent = game["away_team"]
-                            location = "vs"
-
-                        # Show spread
-                        if pd.notna(game["spread_line"]):
-                            base_spread = game["spread_line"]
-                            if team == game["home_team"]:
-                                display_spread = -base_spread
-                            else:
-                                display_spread = base_spread
-                            spread = f"({display_spread:+.1f})"
-                        else:
-                            spread = ""
-
-                        underdog_pick_line = f"🐶 {team} {spread} {location} {opponent}"
-                        break
-
-            # Combine in order: Best Bets, Regular Picks, MNF, Survivor, Underdog
-            picks_display = []
-            picks_display.extend(best_bets)
-            picks_display.extend(regular_picks)
-            if mnf_pick_line:
-                picks_display.append(mnf_pick_line)
-            if survivor_pick_line:
-                picks_display.append(survivor_pick_line)
-            if underdog_pick_line:
-                picks_display.append(underdog_pick_line)
-
-            if picks_display:
-                # Create picks text with header
-                picks_header = f"{picker}'s Week {st.session_state.current_week} Picks"
-                picks_body = "\n".join(picks_display)
-                picks_text = f"{picks_header}\n\n{picks_body}"
-
-                # Display picks in a code block for easy copying
-                st.code(picks_text, language=None)
-
-                st.markdown("---")
-
-                # Action buttons
-                col1, col2, col3 = st.columns([2, 1, 2])
-
-                with col1:
-                    # Save button with clipboard copy
-                    save_button_clicked = st.button(
-                        "💾 Save Picks",
-                        type="primary",
-                        help="Save your picks to the database and copy to clipboard",
-                        key="save_picks_btn",
-                    )
-
-                    if save_button_clicked:
-                        if not picker:
-                            st.error("⚠️ Please select a picker before submitting")
-                        elif (
-                            st.session_state.picks
-                            or st.session_state.survivor_pick
-                            or st.session_state.underdog_pick
-                            or st.session_state.mnf_pick
-                        ):
-                            # Create combined picks dict - maintain original structure but allow multi-pick save
-                            # Clean up any malformed keys in session state first
-                            cleaned_picks = {}
-                            for key, value in st.session_state.picks.items():
-                                # Only keep properly formatted game_id keys (season_week_away_home format)
-                                if (
-                                    key.count("_") >= 3
-                                    and not key.endswith("_best")
-                                    and not key.endswith("_regular")
-                                ):
-                                    cleaned_picks[key] = value
-
-                            # Update session state with cleaned data
-                            st.session_state.picks = cleaned_picks
-                            all_picks = dict(cleaned_picks)  # Copy regular picks
-
-                            # Add survivor pick using actual game ID
-                            if st.session_state.survivor_pick:
-                                # Find the game ID for the survivor pick
-                                survivor_game_id = None
-                                survivor_spread = None
-                                for _, game in games_df.iterrows():
-                                    if (
-                                        game["away_team"]
-                                        == st.session_state.survivor_pick
-                                        or game["home_team"]
-                                        == st.session_state.survivor_pick
-                                    ):
-                                        survivor_game_id = game.name
-                                        survivor_spread = game.get("spread_line")
-                                        break
-
-                                if survivor_game_id:
-                                    # Use special key for survivor pick to allow combo with regular pick
-                                    all_picks[f"survivor_{survivor_game_id}"] = {
-                                        "team_picked": st.session_state.survivor_pick,
-                                        "pick_type": "survivor",
-                                        "spread": survivor_spread,
-                                        "game_id": survivor_game_id,
-                                    }
-
-                            # Add underdog pick using actual game ID
-                            if st.session_state.underdog_pick:
-                                # Find the game ID for the underdog pick
-                                underdog_game_id = None
-                                underdog_spread = None
-                                for _, game in games_df.iterrows():
-                                    if (
-                                        game["away_team"]
-                                        == st.session_state.underdog_pick
-                                        or game["home_team"]
-                                        == st.session_state.underdog_pick
-                                    ):
-                                        underdog_game_id = game.name
-                                        underdog_spread = game.get("spread_line")
-                                        break
-
-                                if underdog_game_id:
-                                    # Use special key for underdog pick to allow combo with regular pick
-                                    all_picks[f"underdog_{underdog_game_id}"] = {
-                                        "team_picked": st.session_state.underdog_pick,
-                                        "pick_type": "underdog",
-                                        "spread": underdog_spread,
-                                        "game_id": underdog_game_id,
-                                    }
-
-                            # Add MNF pick using actual game ID (last game in list)
-                            if st.session_state.mnf_pick:
-                                # Find the MNF game (last game) and its spread
-                                if len(games_df) > 0:
-                                    mnf_game = games_df.iloc[-1]  # Last game is MNF
-                                    mnf_game_id = mnf_game.name  # Use actual game ID
-
-                                    # Use special key for MNF pick to allow combo with regular pick
-                                    all_picks[f"mnf_{mnf_game_id}"] = {
-                                        "team_picked": st.session_state.mnf_pick,
-                                        "pick_type": "mnf",
-                                        "spread": mnf_game.get("spread_line"),
-                                        "game_id": mnf_game_id,
-                                    }
-
-                            # Debug: show what we're trying to save
-                            # with st.expander(
-                            #     "🔍 Debug: Show picks data being saved", expanded=False
-                            # ):
-                            #     st.write("**Session State Picks:**")
-                            #     st.json(dict(st.session_state.picks))
-                            #     st.write("**Special Picks:**")
-                            #     st.write(f"Survivor: {st.session_state.survivor_pick}")
-                            #     st.write(f"Underdog: {st.session_state.underdog_pick}")
-                            #     st.write(f"MNF: {st.session_state.mnf_pick}")
-                            #     st.write("**Combined All Picks:**")
-                            #     st.json(
-                            #         {
-                            #             "season": st.session_state.current_season,
-                            #             "week": st.session_state.current_week,
-                            #             "picker": picker,
-                            #             "picks": all_picks,
-                            #         }
-                            #     )
-
-                            # Add more debugging for the save process
-                            # st.write(
-                            #     f"**Attempting to save {len(all_picks)} picks...**"
-                            # )
-
-                            result = save_picks_data(
-                                st.session_state.current_season,
-                                st.session_state.current_week,
-                                all_picks,
-                                picker,
-                            )
-
-                            # Debug the result
-                            # st.write(f"**Save result:** `{repr(result)}`")
-
-                            if result and not result.startswith("ERROR:"):
-                                st.success(f"✅ {result}")
-
-                                # Copy picks to clipboard using JavaScript
-                                clipboard_html = f"""
-                                <script>
-                                    navigator.clipboard.writeText(`{picks_text}`).then(function() {{
-                                        console.log('Picks copied to clipboard!');
-                                    }}, function(err) {{
-                                        console.error('Could not copy text: ', err);
-                                    }});
-                                </script>
-                                """
-                                st.markdown(clipboard_html, unsafe_allow_html=True)
-                                st.info("📋 Picks copied to clipboard!")
-                            elif result and result.startswith("ERROR:"):
-                                st.error(
-                                    f"❌ Failed to save picks: {result[7:]}"
-                                )  # Remove "ERROR: " prefix
-                            elif result is None:
-                                st.error(
-                                    "❌ Failed to save picks: save_picks_data returned None"
-                                )
-                            else:
-                                st.error(
-                                    f"❌ Failed to save picks: Unexpected result type: {type(result)} - {result}"
-                                )
-                        else:
-                            st.warning("⚠️ No picks to save")
-
-                with col3:
-                    if st.button(
-                        "🗑️ Clear All", type="secondary", help="Clear all your picks"
-                    ):
-                        st.session_state.picks = {}
-                        st.session_state.survivor_pick = None
-                        st.session_state.underdog_pick = None
-                        st.session_state.mnf_pick = None
-                        st.success("✅ All picks cleared!")
-                        st.rerun()
+        render_pick_board(slate, picker)
 
         # Footer info
         st.markdown("---")
         st.caption(
-            f"📊 Showing {len(games_df)} games for Week {st.session_state.current_week} • Season {season}"
+            f"📊 Showing {len(slate)} games for Week {st.session_state.current_week} • Season {season}"
         )
     else:
         st.warning("No games found for the selected week and season.")
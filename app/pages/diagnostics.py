@@ -0,0 +1,66 @@
+import os
+import sys
+
+import pandas as pd
+import streamlit as st
+
+# Add both parent directory and src directory to path for Streamlit Cloud compatibility
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from g_nfl.utils import instrumentation
+from g_nfl.utils.backend import get_backend_name
+from g_nfl.utils.singleflight import single_flight_stats
+
+st.set_page_config(page_title="Diagnostics - no-homers", layout="wide")
+
+st.title("🩺 Database Diagnostics")
+
+st.caption(
+    f"Backend: **{get_backend_name()}** · slow-query threshold: "
+    f"**{instrumentation.slow_query_ms:.0f} ms** (GNFL_SLOW_QUERY_MS). "
+    "Statistics cover this server process since it started or was reset."
+)
+
+if not instrumentation.enabled:
+    st.warning("Query statistics are turned off (GNFL_QUERY_STATS=0)")
+elif not instrumentation.measure_payload:
+    st.caption("Payload sizes are not measured, set GNFL_QUERY_PAYLOAD=1 to see them")
+
+col1, col2, col3 = st.columns([1, 1, 1])
+
+flights = single_flight_stats()
+with col1:
+    st.metric("Coalesced reads run", flights["calls"])
+with col2:
+    st.metric("Reads shared in flight", flights["shared"])
+with col3:
+    if st.button("🔄 Reset statistics"):
+        instrumentation.reset_stats()
+        st.rerun()
+
+st.subheader("Query latency")
+
+stats = instrumentation.query_stats()
+if stats.empty:
+    st.info("No database calls recorded yet")
+else:
+    st.dataframe(
+        stats,
+        use_container_width=True,
+        column_config={
+            "p50_ms": st.column_config.NumberColumn("p50 (ms)", format="%.1f"),
+            "p95_ms": st.column_config.NumberColumn("p95 (ms)", format="%.1f"),
+            "max_ms": st.column_config.NumberColumn("max (ms)", format="%.1f"),
+            "avg_rows": st.column_config.NumberColumn("avg rows", format="%.1f"),
+            "payload_kb": st.column_config.NumberColumn("payload (KB)", format="%.1f"),
+        },
+    )
+
+st.subheader("Slow queries")
+
+slow = instrumentation.slow_queries()
+if not slow:
+    st.info("No slow queries recorded")
+else:
+    st.dataframe(pd.DataFrame(slow), use_container_width=True, hide_index=True)
@@ -0,0 +1,131 @@
+import os
+import sys
+
+import pandas as pd
+import streamlit as st
+
+# Add both parent directory and src directory to path for Streamlit Cloud compatibility
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from g_nfl.modelling.scoring import score_picks, season_leaderboard, weekly_points
+from g_nfl.modelling.utils import ScoresUnavailableError, get_season_results
+from g_nfl.utils.config import CUR_SEASON
+from g_nfl.utils.database import PicksDatabase, PoolSpreadsDatabase
+
+st.set_page_config(page_title="Leaderboard - no-homers", layout="wide")
+
+st.title("🏆 Season Leaderboard")
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_scored_picks(season: int) -> pd.DataFrame:
+    """Score every pick of a season in one pass (cached for 10 minutes)"""
+    picks = pd.DataFrame(PicksDatabase().get_season_picks(season))
+    if picks.empty:
+        return picks
+
+    pool_spreads = pd.DataFrame(PoolSpreadsDatabase().get_season_pool_spreads(season))
+    results = get_season_results(season)
+    return score_picks(picks, results, pool_spreads)
+
+
+# Add controls for selecting season
+col_spacer1, col_controls, col_spacer2 = st.columns([2, 6, 2])
+
+with col_controls:
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        season = st.selectbox(
+            "Select Season",
+            list(range(2020, CUR_SEASON + 1)),
+            index=len(list(range(2020, CUR_SEASON + 1))) - 1,
+            key="leaderboard_season",
+        )
+
+    with col2:
+        st.write("")  # Add some vertical spacing
+        if st.button("🔄 Refresh Scores", key="refresh_leaderboard_btn"):
+            load_scored_picks.clear()
+
+try:
+    with st.spinner("Scoring picks..."):
+        scored = load_scored_picks(season)
+except ScoresUnavailableError as e:
+    st.warning(f"⚠️ Final scores are unavailable, picks can't be scored: {e}")
+    st.stop()
+except Exception as e:
+    st.error(f"Error loading picks data: {str(e)}")
+    st.stop()
+
+if scored.empty:
+    st.info(f"No picks found for the {season} season")
+    st.stop()
+
+if not scored["final"].any():
+    st.info("No final scores yet for the picked games")
+    st.stop()
+
+final_weeks = sorted(scored.loc[scored["final"], "week"].unique())
+st.success(
+    f"✅ Scored {int(scored['final'].sum())} picks through Week {max(final_weeks)}"
+)
+
+# Season standings
+st.subheader("📊 Standings")
+st.caption(
+    "Regular/MNF cover = 1 point, Best bet cover = 2 points, Push = half | "
+    "Survivor win = 1 point | Underdog win = spread"
+)
+
+leaderboard = season_leaderboard(scored)
+standings_df = pd.DataFrame(
+    {
+        "Picker": leaderboard.index,
+        "Total": leaderboard["total"].to_numpy(),
+        "Record": [
+            f"{covers}-{losses}-{pushes}"
+            for covers, losses, pushes in zip(
+                leaderboard["covers"], leaderboard["losses"], leaderboard["pushes"]
+            )
+        ],
+        "Spread": (
+            leaderboard["regular"] + leaderboard["best_bet"] + leaderboard["mnf"]
+        ).to_numpy(),
+        "Survivor": leaderboard["survivor"].to_numpy(),
+        "Underdog": leaderboard["underdog"].to_numpy(),
+        "Per Week": leaderboard["points_per_week"].to_numpy(),
+    }
+)
+
+st.dataframe(
+    standings_df,
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        "Picker": st.column_config.TextColumn("Picker", width="medium"),
+        "Total": st.column_config.NumberColumn("Total", format="%.1f"),
+        "Record": st.column_config.TextColumn("Record (W-L-P)"),
+        "Spread": st.column_config.NumberColumn("Spread", format="%.1f"),
+        "Survivor": st.column_config.NumberColumn("Survivor", format="%.0f"),
+        "Underdog": st.column_config.NumberColumn("Underdog", format="%.1f"),
+        "Per Week": st.column_config.NumberColumn("Per Week", format="%.2f"),
+    },
+)
+
+st.markdown("---")
+
+# Week by week points
+st.subheader("📅 Points by Week")
+
+weekly_df = weekly_points(scored[scored["final"]]).reindex(leaderboard.index)
+st.dataframe(
+    weekly_df.rename(columns=lambda week: f"Wk {week}"), use_container_width=True
+)
+
+# Numeric week index keeps the x axis in week order
+st.line_chart(weekly_df.T.cumsum())
+st.caption("Cumulative points by week")
+
+st.caption("📊 Picks data loaded from Supabase database, scores from nflverse")
@@ -238,18 +238,34 @@ if (
 
         if submitted:
             try:
-                # Save to database
+                # Save only the spreads that differ from the loaded state
                 pool_db = PoolSpreadsDatabase()
-                saved_count = pool_db.save_pool_spreads(
+                report = pool_db.save_changed_pool_spreads(
                     st.session_state.current_manage_season,
                     st.session_state.current_manage_week,
                     updated_spreads,
+                    current={
+                        game_id: (spread if pd.notna(spread) else None)
+                        for game_id, spread in games_df["pool_spread"].items()
+                    },
                 )
 
-                st.success(f"✅ Successfully saved {saved_count} pool spreads!")
-
-                # Refresh the data
-                st.rerun()
+                changes = {
+                    game_id: change
+                    for game_id, change in report.items()
+                    if change["status"] != "unchanged"
+                }
+                if changes:
+                    # Keep the cached state in sync instead of reloading the week
+                    for game_id, change in changes.items():
+                        games_df.loc[game_id, "pool_spread"] = change["new"]
+
+                    st.success(f"✅ Successfully saved {len(changes)} pool spreads!")
+                    for game_id, change in changes.items():
+                        old = "—" if change["old"] is None else f"{change['old']:+.1f}"
+                        st.caption(f"{game_id}: {old} → {change['new']:+.1f}")
+                else:
+                    st.info("No pool spreads changed")
 
             except Exception as e:
                 st.error(f"❌ Error saving spreads: {e}")
@@ -9,8 +9,14 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
 from g_nfl import CUR_WEEK
-from g_nfl.modelling.utils import get_week_spreads
 from g_nfl.utils.config import CUR_SEASON
+from g_nfl.utils.consensus import (
+    build_pick_matrix,
+    game_consensus,
+    pick_symbols,
+    team_consensus,
+    team_consensus_from_rows,
+)
 from g_nfl.utils.database import PicksDatabase
 from g_nfl.utils.teams import standardize_teams
 from g_nfl.utils.web_app import get_picks_data, get_team_logo
@@ -68,15 +74,18 @@ with col_controls:
         st.write("")  # Add some vertical spacing
         load_picks_button = st.button("Load Picks", key="load_picks_btn")
 
-# Load picks data
-if load_picks_button or "picks_data" not in st.session_state:
+# Load the week's consensus and games, a few dozen precomputed rows
+if load_picks_button or "consensus_view" not in st.session_state:
     try:
-        with st.spinner("Loading picks data..."):
-            # Always load all pickers (no filter)
-            picks_data = get_picks_data(season, week, None)
-            st.session_state.picks_data = picks_data
+        with st.spinner("Loading consensus..."):
+            # Precomputed consensus rows (see consensus_schema.sql)
+            st.session_state.consensus_view = PicksDatabase().get_weekly_consensus(
+                season, week
+            )
             st.session_state.current_view_season = season
             st.session_state.current_view_week = week
+            # Individual picks of the previous week, reloaded when shown
+            st.session_state.pop("picks_data", None)
 
             # Load pool spreads from database instead of nfl_data_py
             try:
@@ -126,21 +135,174 @@ if load_picks_button or "picks_data" not in st.session_state:
         st.error(f"Error loading picks data: {str(e)}")
         st.stop()
 
-# Display picks if data is loaded
-if "picks_data" in st.session_state and st.session_state.picks_data:
-    picks_data = st.session_state.picks_data
-    games_df = st.session_state.get("games_data_view", pd.DataFrame())
+view_week = st.session_state.current_view_week
+consensus_rows = st.session_state.consensus_view
+games_df = st.session_state.get("games_data_view", pd.DataFrame())
+
+# Consensus side of every game, from the consensus rows alone
+game_data = []
+if not games_df.empty:
+    consensus_df = game_consensus(games_df, team_consensus_from_rows(consensus_rows))
+
+    for game in consensus_df.to_dict("records"):
+        # Get team names from game data (already standardized in database)
+        away_team = game["away_team"]
+        home_team = game["home_team"]
+        spread_line = game.get("spread_line", None)
+        if pd.isna(spread_line):
+            spread_line = None
+
+        net_score = game["net_score"]
+        consensus_team = game["consensus_team"]
+        consensus_points = game["consensus_points"]
+        consensus_best_bets = game["consensus_best_bets"]
+        is_consensus_home = game["is_consensus_home"]
+
+        # Format game matchup with consensus team first
+        # Note: spread_line from database is the AWAY team spread
+        # Negative = away team favored, Positive = home team favored
+        if consensus_team == "EVEN":
+            # If even, use traditional away at home format
+            if spread_line is not None:
+                # Spread is already for away team, use as-is
+                if spread_line > 0:
+                    matchup = f"{away_team} (+{spread_line}) at {home_team}"
+                elif spread_line < 0:
+                    matchup = f"{away_team} ({spread_line}) at {home_team}"
+                else:
+                    matchup = f"{away_team} at {home_team}"
+            else:
+                matchup = f"{away_team} at {home_team}"
+        else:
+            # Put consensus team first
+            if is_consensus_home:
+                # Home team is consensus - use "vs"
+                other_team = away_team
+                if spread_line is not None:
+                    # Spread is for away team, flip for home team
+                    home_spread = -spread_line
+                    if home_spread > 0:
+                        matchup = f"{consensus_team} (+{home_spread}) vs {other_team}"
+                    elif home_spread < 0:
+                        matchup = f"{consensus_team} ({home_spread}) vs {other_team}"
+                    else:
+                        matchup = f"{consensus_team} vs {other_team}"
+                else:
+                    matchup = f"{consensus_team} vs {other_team}"
+            else:
+                # Away team is consensus - use "at"
+                other_team = home_team
+                if spread_line is not None:
+                    # Spread is already for away team, use as-is
+                    if spread_line > 0:
+                        matchup = f"{consensus_team} (+{spread_line}) at {other_team}"
+                    elif spread_line < 0:
+                        matchup = f"{consensus_team} ({spread_line}) at {other_team}"
+                    else:
+                        matchup = f"{consensus_team} at {other_team}"
+                else:
+                    matchup = f"{consensus_team} at {other_team}"
+
+        game_data.append(
+            {
+                "matchup": matchup,
+                "away_team": away_team,
+                "home_team": home_team,
+                "consensus_team": consensus_team,
+                "consensus_points": consensus_points,
+                "consensus_best_bets": consensus_best_bets,
+                "net_score": net_score,
+                "spread_line": spread_line,
+            }
+        )
+
+if consensus_rows and game_data:
+    # Display the regular picks table
+    st.subheader("🏆 Picks by Game (Ranked by Consensus)")
+    st.caption(
+        "Regular pick = 1 point, Best bet = 2 points | Consensus team shown first | TEAM picks excluded from consensus"
+    )
+
+    # Create DataFrame for easier display
+    display_df = pd.DataFrame(
+        [
+            {
+                "Game": game["matchup"],
+                "Total Picks": (
+                    game["consensus_points"] if game["consensus_team"] != "EVEN" else 0
+                ),
+                "Best Bets": (
+                    game["consensus_best_bets"]
+                    if game["consensus_team"] != "EVEN"
+                    else 0
+                ),
+                "Net Picks": (
+                    game["net_score"] if game["consensus_team"] != "EVEN" else 0
+                ),
+            }
+            for game in game_data
+        ]
+    )
 
-    st.success(
-        f"✅ Loaded {len(picks_data)} picks for Week {st.session_state.current_view_week}"
+    # Display as streamlit dataframe with custom formatting
+    st.dataframe(
+        display_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Game": st.column_config.TextColumn("Game", width="large"),
+            "Total Picks": st.column_config.NumberColumn("Total Picks", width="small"),
+            "Best Bets": st.column_config.NumberColumn("Best Bets", width="small"),
+            "Net Picks": st.column_config.NumberColumn("Net Picks", width="small"),
+        },
+    )
+elif consensus_rows:
+    st.warning("Games data not available. Showing team consensus instead.")
+    st.subheader("🏆 Team Picks Ranked by Points")
+    st.caption(
+        "Regular pick = 1 point, Best bet = 2 points | TEAM picks excluded from points"
+    )
+    teams_df = (
+        team_consensus_from_rows(consensus_rows)
+        .sort_values("points", ascending=False)
+        .reset_index()
     )
+    st.dataframe(
+        teams_df.rename(
+            columns={"team": "Team", "points": "Points", "best_bets": "Best Bets"}
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
+else:
+    st.info(f"No picks found for Week {view_week}")
+
+st.markdown("---")
+
+# Every pick of the week, only fetched when the per-picker tables are shown
+show_individual = st.toggle(
+    "Show individual picks",
+    key="view_individual_picks",
+    help="Loads every pick of the week to show each picker's picks",
+)
+if show_individual and "picks_data" not in st.session_state:
+    try:
+        with st.spinner("Loading picks data..."):
+            st.session_state.picks_data = get_picks_data(
+                st.session_state.current_view_season, view_week, None
+            )
+    except Exception as e:
+        st.error(f"Error loading picks data: {str(e)}")
+        st.stop()
+
+picks_data = st.session_state.get("picks_data") if show_individual else None
+
+if picks_data:
+    st.success(f"✅ Loaded {len(picks_data)} picks for Week {view_week}")
 
     # Get all unique pickers
     all_pickers = sorted(list(set(pick["picker"] for pick in picks_data)))
 
-    # Create a filtered list excluding "TEAM" for consensus calculations
-    consensus_pickers = [p for p in all_pickers if p != "TEAM"]
-
     # Separate picks by type
     regular_picks = [
         p for p in picks_data if p.get("pick_type") not in ["survivor", "underdog"]
@@ -157,33 +319,16 @@ if "picks_data" in st.session_state and st.session_state.picks_data:
         st.subheader(f"{emoji} {title}")
         st.caption(description)
 
-        # Get teams for this pick type
-        teams_in_picks = sorted(
-            list(set(pick["team_picked"] for pick in pick_data_list))
+        # Team-picker matrix, teams sorted alphabetically
+        symbols = pick_symbols(
+            build_pick_matrix(pick_data_list, all_pickers),
+            best_bet="✅",
+            empty="",
         )
-
-        # Create team-picker matrix
-        team_data = []
-        for team in teams_in_picks:
-            row_data = {"Team": team}
-
-            for picker in all_pickers:
-                # Find picks for this team by this picker
-                team_picks = [
-                    p
-                    for p in pick_data_list
-                    if p["team_picked"] == team and p["picker"] == picker
-                ]
-
-                if team_picks:
-                    row_data[picker] = "✅"
-                else:
-                    row_data[picker] = ""
-
-            team_data.append(row_data)
-
-        # Sort alphabetically by team name
-        team_data.sort(key=lambda x: x["Team"])
+        team_data = [
+            {"Team": team, **row}
+            for team, row in zip(symbols.index, symbols.to_dict("records"))
+        ]
 
         # Add header row
         header_cols = st.columns([0.5, 2] + [1] * len(all_pickers))
@@ -238,200 +383,12 @@ if "picks_data" in st.session_state and st.session_state.picks_data:
 
     # Create regular picks table by game with net scores
     if regular_picks:
-        # Get games data if available
-        if not games_df.empty:
-            # Create game-based view
-            game_data = []
-
-            for _, game in games_df.iterrows():
-                # Get team names from game data (already standardized in database)
-                away_team = game["away_team"]
-                home_team = game["home_team"]
-                spread_line = game.get("spread_line", None)
-
-                # Calculate points for each team (excluding "TEAM" picks)
-                away_points = 0
-                home_points = 0
-                away_best_bets = 0
-                home_best_bets = 0
-
-                for picker in consensus_pickers:
-                    # Check away team picks
-                    away_team_picks = [
-                        p
-                        for p in regular_picks
-                        if p["team_picked"] == away_team and p["picker"] == picker
-                    ]
-
-                    if away_team_picks:
-                        has_best_bet = any(
-                            pick.get("pick_type") == "best_bet"
-                            for pick in away_team_picks
-                        )
-                        if has_best_bet:
-                            away_points += 2
-                            away_best_bets += 1
-                        else:
-                            away_points += 1
-
-                    # Check home team picks
-                    home_team_picks = [
-                        p
-                        for p in regular_picks
-                        if p["team_picked"] == home_team and p["picker"] == picker
-                    ]
-
-                    if home_team_picks:
-                        has_best_bet = any(
-                            pick.get("pick_type") == "best_bet"
-                            for pick in home_team_picks
-                        )
-                        if has_best_bet:
-                            home_points += 2
-                            home_best_bets += 1
-                        else:
-                            home_points += 1
-
-                # Calculate net score (positive = home favored, negative = away favored)
-                net_score = home_points - away_points
-
-                # Determine consensus team and total picks for that team
-                if net_score > 0:
-                    consensus_team = home_team
-                    consensus_points = home_points
-                    consensus_best_bets = home_best_bets
-                    is_consensus_home = True
-                elif net_score < 0:
-                    consensus_team = away_team
-                    consensus_points = away_points
-                    consensus_best_bets = away_best_bets
-                    is_consensus_home = False
-                else:
-                    consensus_team = "EVEN"
-                    consensus_points = 0
-                    consensus_best_bets = 0
-                    is_consensus_home = None
-
-                # Format game matchup with consensus team first
-                # Note: spread_line from database is the AWAY team spread
-                # Negative = away team favored, Positive = home team favored
-                if consensus_team == "EVEN":
-                    # If even, use traditional away at home format
-                    if spread_line is not None:
-                        # Spread is already for away team, use as-is
-                        if spread_line > 0:
-                            matchup = f"{away_team} (+{spread_line}) at {home_team}"
-                        elif spread_line < 0:
-                            matchup = f"{away_team} ({spread_line}) at {home_team}"
-                        else:
-                            matchup = f"{away_team} at {home_team}"
-                    else:
-                        matchup = f"{away_team} at {home_team}"
-                else:
-                    # Put consensus team first
-                    if is_consensus_home:
-                        # Home team is consensus - use "vs"
-                        other_team = away_team
-                        if spread_line is not None:
-                            # Spread is for away team, flip for home team
-                            home_spread = -spread_line
-                            if home_spread > 0:
-                                matchup = (
-                                    f"{consensus_team} (+{home_spread}) vs {other_team}"
-                                )
-                            elif home_spread < 0:
-                                matchup = (
-                                    f"{consensus_team} ({home_spread}) vs {other_team}"
-                                )
-                            else:
-                                matchup = f"{consensus_team} vs {other_team}"
-                        else:
-                            matchup = f"{consensus_team} vs {other_team}"
-                    else:
-                        # Away team is consensus - use "at"
-                        other_team = home_team
-                        if spread_line is not None:
-                            # Spread is already for away team, use as-is
-                            if spread_line > 0:
-                                matchup = (
-                                    f"{consensus_team} (+{spread_line}) at {other_team}"
-                                )
-                            elif spread_line < 0:
-                                matchup = (
-                                    f"{consensus_team} ({spread_line}) at {other_team}"
-                                )
-                            else:
-                                matchup = f"{consensus_team} at {other_team}"
-                        else:
-                            matchup = f"{consensus_team} at {other_team}"
-
-                game_data.append(
-                    {
-                        "matchup": matchup,
-                        "away_team": away_team,
-                        "home_team": home_team,
-                        "consensus_team": consensus_team,
-                        "consensus_points": consensus_points,
-                        "consensus_best_bets": consensus_best_bets,
-                        "net_score": abs(net_score),
-                        "spread_line": spread_line,
-                    }
-                )
-
-            # Sort by absolute value of net score (strongest consensus first)
-            game_data.sort(key=lambda x: x["net_score"], reverse=True)
-
-            # Display the regular picks table
-            st.subheader("🏆 Picks by Game (Ranked by Consensus)")
-            st.caption(
-                "Regular pick = 1 point, Best bet = 2 points | Consensus team shown first | TEAM picks excluded from consensus"
-            )
-
-            # Create DataFrame for easier display
-            display_df = pd.DataFrame(
-                [
-                    {
-                        "Game": game["matchup"],
-                        "Total Picks": (
-                            game["consensus_points"]
-                            if game["consensus_team"] != "EVEN"
-                            else 0
-                        ),
-                        "Best Bets": (
-                            game["consensus_best_bets"]
-                            if game["consensus_team"] != "EVEN"
-                            else 0
-                        ),
-                        "Net Picks": (
-                            game["net_score"] if game["consensus_team"] != "EVEN" else 0
-                        ),
-                    }
-                    for game in game_data
-                ]
-            )
-
-            # Display as streamlit dataframe with custom formatting
-            st.dataframe(
-                display_df,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "Game": st.column_config.TextColumn("Game", width="large"),
-                    "Total Picks": st.column_config.NumberColumn(
-                        "Total Picks", width="small"
-                    ),
-                    "Best Bets": st.column_config.NumberColumn(
-                        "Best Bets", width="small"
-                    ),
-                    "Net Picks": st.column_config.NumberColumn(
-                        "Net Picks", width="small"
-                    ),
-                },
-            )
-
-            # Add spacing
-            st.markdown("---")
+        # Team x picker pick points (0 = none, 1 = regular, 2 = best bet)
+        pick_matrix = build_pick_matrix(regular_picks, all_pickers)
+        pick_marks = pick_symbols(pick_matrix)
+        picked_teams = set(pick_matrix.index[pick_matrix.sum(axis=1) > 0])
 
+        if game_data:
             # Display detailed picker table
             st.subheader("📋 Individual Picks by Game")
             st.caption("✅ = Regular pick | ⭐ = Best bet | Includes TEAM picks")
@@ -482,25 +439,11 @@ if "picks_data" in st.session_state and st.session_state.picks_data:
                 else:
                     first_team_display = f"{first_team}"
 
-                first_row = {"Team": first_team_display}
-                first_team_has_picks = False
-                for picker in all_pickers:
-                    team_picks = [
-                        p
-                        for p in regular_picks
-                        if p["team_picked"] == first_team and p["picker"] == picker
-                    ]
-                    if team_picks:
-                        has_best_bet = any(
-                            pick.get("pick_type") == "best_bet" for pick in team_picks
-                        )
-                        first_row[picker] = "⭐" if has_best_bet else "✅"
-                        first_team_has_picks = True
-                    else:
-                        first_row[picker] = "—"
                 # Only add row if someone picked this team
-                if first_team_has_picks:
-                    picker_table_data.append(first_row)
+                if first_team in picked_teams:
+                    picker_table_data.append(
+                        {"Team": first_team_display, **pick_marks.loc[first_team]}
+                    )
 
                 # Create row for second team
                 if spread_line is not None:
@@ -524,25 +467,11 @@ if "picks_data" in st.session_state and st.session_state.picks_data:
                 else:
                     second_team_display = f"{second_team}"
 
-                second_row = {"Team": second_team_display}
-                second_team_has_picks = False
-                for picker in all_pickers:
-                    team_picks = [
-                        p
-                        for p in regular_picks
-                        if p["team_picked"] == second_team and p["picker"] == picker
-                    ]
-                    if team_picks:
-                        has_best_bet = any(
-                            pick.get("pick_type") == "best_bet" for pick in team_picks
-                        )
-                        second_row[picker] = "⭐" if has_best_bet else "✅"
-                        second_team_has_picks = True
-                    else:
-                        second_row[picker] = "—"
                 # Only add row if someone picked this team
-                if second_team_has_picks:
-                    picker_table_data.append(second_row)
+                if second_team in picked_teams:
+                    picker_table_data.append(
+                        {"Team": second_team_display, **pick_marks.loc[second_team]}
+                    )
 
             # Create DataFrame for picker table
             picker_df = pd.DataFrame(picker_table_data)
@@ -565,40 +494,13 @@ if "picks_data" in st.session_state and st.session_state.picks_data:
         else:
             # Fallback to team view if no games data available
             st.warning("Games data not available. Showing team-based view instead.")
-            all_teams = sorted(list(set(pick["team_picked"] for pick in regular_picks)))
+            team_points = team_consensus(pick_matrix)["points"]
+            team_marks = pick_symbols(pick_matrix, empty="")
 
-            # Create team-picker matrix with points
+            # Create team-picker matrix with points (TEAM picks excluded)
             team_data = []
-            for team in all_teams:
-                row_data = {"Team": team}
-                total_points = 0
-
-                for picker in all_pickers:
-                    # Find picks for this team by this picker
-                    team_picks = [
-                        p
-                        for p in regular_picks
-                        if p["team_picked"] == team and p["picker"] == picker
-                    ]
-
-                    if team_picks:
-                        # Determine display symbol and points
-                        has_best_bet = any(
-                            pick.get("pick_type") == "best_bet" for pick in team_picks
-                        )
-
-                        if has_best_bet:
-                            row_data[picker] = "⭐"
-                            # Only count points for non-TEAM pickers
-                            if picker != "TEAM":
-                                total_points += 2
-                        else:
-                            row_data[picker] = "✅"
-                            # Only count points for non-TEAM pickers
-                            if picker != "TEAM":
-                                total_points += 1
-                    else:
-                        row_data[picker] = ""
+            for team, row in zip(team_marks.index, team_marks.to_dict("records")):
+                total_points = int(team_points[team])
 
                 # Get team logo and format team name with points
                 team_logo_url = get_team_logo(team)
@@ -607,7 +509,7 @@ if "picks_data" in st.session_state and st.session_state.picks_data:
                 else:
                     team_display = team
 
-                row_data["Team"] = team_display
+                row_data = {"Team": team_display, **row}
                 row_data["Team_Logo"] = (
                     team_logo_url  # Store logo URL for potential use
                 )
@@ -716,11 +618,8 @@ if "picks_data" in st.session_state and st.session_state.picks_data:
     with col5:
         st.metric("Active Pickers", unique_pickers)
 
-elif "picks_data" in st.session_state and not st.session_state.picks_data:
-    st.info(f"No picks found for Week {week}")
-
-else:
-    st.info("👆 Click 'Load Picks' to view picks for the selected week")
+elif show_individual:
+    st.info(f"No picks found for Week {view_week}")
 
 # Add a note about the data source
 st.caption("📊 Picks data loaded from Supabase database")
@@ -0,0 +1,68 @@
+-- Precomputed weekly pick consensus for the View Picks page
+-- Run this in your Supabase SQL editor after picks_schema.sql and update_picks_schema.sql
+
+-- Consensus points per team for every game of a week
+-- Regular/MNF pick = 1 point, best bet = 2 points, TEAM picks excluded
+CREATE TABLE IF NOT EXISTS weekly_consensus (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    game_id TEXT NOT NULL,
+    team VARCHAR(10) NOT NULL,
+    points INTEGER NOT NULL DEFAULT 0,
+    best_bets INTEGER NOT NULL DEFAULT 0,
+    pickers INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (season, week, game_id, team)
+);
+
+-- Recompute the consensus rows of one week from the picks table
+-- Called after every save_picks, so only the saved week is rebuilt
+CREATE OR REPLACE FUNCTION refresh_weekly_consensus(p_season INTEGER, p_week INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    row_count INTEGER;
+BEGIN
+    DELETE FROM weekly_consensus WHERE season = p_season AND week = p_week;
+
+    INSERT INTO weekly_consensus (season, week, game_id, team, points, best_bets, pickers, updated_at)
+    SELECT
+        p_season,
+        p_week,
+        game_id,
+        team_picked,
+        SUM(points),
+        COUNT(*) FILTER (WHERE points = 2),
+        COUNT(*),
+        NOW()
+    FROM (
+        -- A picker counts once per team, with their best pick on it
+        SELECT
+            picker,
+            game_id,
+            team_picked,
+            MAX(CASE WHEN pick_type = 'best_bet' THEN 2 ELSE 1 END) AS points
+        FROM picks
+        WHERE season = p_season
+          AND week = p_week
+          AND picker <> 'TEAM'
+          AND COALESCE(pick_type, 'regular') NOT IN ('survivor', 'underdog')
+        GROUP BY picker, game_id, team_picked
+    ) picker_points
+    GROUP BY game_id, team_picked;
+
+    GET DIAGNOSTICS row_count = ROW_COUNT;
+    RETURN row_count;
+END;
+$$;
+
+-- Backfill every week that already has picks
+SELECT refresh_weekly_consensus(season, week)
+FROM (SELECT DISTINCT season, week FROM picks WHERE week IS NOT NULL) weeks;
+
+-- Enable RLS (optional)
+ALTER TABLE weekly_consensus ENABLE ROW LEVEL SECURITY;
+
+-- Allow all operations for now (adjust based on your auth needs)
+CREATE POLICY "Enable all operations for weekly_consensus" ON weekly_consensus FOR ALL USING (true);
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Script to measure the import time of the g_nfl modules used at startup.
+
+Each module is imported in a fresh interpreter with `python -X importtime`.
+The report shows the total cost of the import and the heaviest packages it
+pulls in. With --check the script fails when a module is over its time budget
+or imports a package it should only load lazily (e.g. matplotlib for logos),
+so it can guard against import-time regressions in CI.
+"""
+
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..")
+SRC_PATH = os.path.join(PROJECT_ROOT, "src")
+
+# Time budget (ms) and packages that must not be imported, per module.
+# Budgets include pandas/supabase where the module really needs them.
+BUDGETS = {
+    "g_nfl": {"budget_ms": 20, "forbidden": ["pandas", "numpy"]},
+    "g_nfl.utils.config": {"budget_ms": 20, "forbidden": ["pandas"]},
+    "g_nfl.utils.logos": {
+        "budget_ms": 150,
+        "forbidden": ["matplotlib", "PIL", "nfl_data_py"],
+    },
+    "g_nfl.visualisation.plots": {
+        "budget_ms": 800,
+        "forbidden": ["matplotlib.pyplot", "plotly", "adjustText"],
+    },
+    "g_nfl.modelling.metrics": {"budget_ms": 800, "forbidden": ["statsmodels"]},
+    "g_nfl.modelling.utils": {"budget_ms": 800, "forbidden": ["nfl_data_py"]},
+    "g_nfl.utils.web_app": {"budget_ms": 1500, "forbidden": ["nfl_data_py"]},
+    "g_nfl.utils.async_database": {"budget_ms": 1500, "forbidden": ["nfl_data_py"]},
+    "g_nfl.utils.slate": {"budget_ms": 1500, "forbidden": ["nfl_data_py"]},
+}
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """(module, self time in us) of every import in -X importtime output"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, module = line[len("import time:") :].split("|")
+        imports.append((module.strip(), int(self_us)))
+    return imports
+
+
+def run_importtime(statement: str) -> Tuple[Optional[List[Tuple[str, int]]], str]:
+    """Run a statement in a fresh interpreter with -X importtime
+
+    Returns:
+        Tuple of the parsed imports (None if the statement failed) and the
+        last line of stderr (the error, if any)
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_PATH)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+    )
+    last_line = result.stderr.strip().splitlines()[-1] if result.stderr else ""
+    if result.returncode != 0:
+        return None, last_line
+    return parse_importtime(result.stderr), last_line
+
+
+def benchmark_module(
+    module: str, startup: Set[str], repeat: int
+) -> Optional[Dict[str, object]]:
+    """Import a module `repeat` times and keep the fastest run
+
+    Args:
+        module: Dotted module name
+        startup: Modules imported by the interpreter itself, not counted
+        repeat: Number of fresh interpreters to try
+
+    Returns:
+        Dictionary with total_ms, modules (set of imported modules) and
+        packages (self ms by top-level package), or None with an error
+    """
+    best = None
+    for _ in range(repeat):
+        imports, error = run_importtime(f"import {module}")
+        if imports is None:
+            return {"error": error}
+
+        imports = [(name, us) for name, us in imports if name not in startup]
+        total_ms = sum(us for _, us in imports) / 1000
+        if best is None or total_ms < best["total_ms"]:
+            packages = defaultdict(float)
+            for name, us in imports:
+                packages[name.split(".")[0]] += us / 1000
+            best = {
+                "total_ms": total_ms,
+                "modules": {name for name, _ in imports},
+                "packages": dict(packages),
+            }
+    return best
+
+
+def check_module(module: str, result: Dict[str, object]) -> List[str]:
+    """Budget and forbidden import violations of a benchmarked module"""
+    budget = BUDGETS.get(module)
+    if budget is None:
+        return []
+
+    problems = []
+    if result["total_ms"] > budget["budget_ms"]:
+        problems.append(
+            f"{result['total_ms']:.0f} ms is over the {budget['budget_ms']} ms budget"
+        )
+    for forbidden in budget["forbidden"]:
+        if any(
+            name == forbidden or name.startswith(forbidden + ".")
+            for name in result["modules"]
+        ):
+            problems.append(f"imports {forbidden}, which should be imported lazily")
+    return problems
+
+
+def main():
+    """Main function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Measure g_nfl import times and guard against regressions"
+    )
+    parser.add_argument(
+        "--modules",
+        type=str,
+        default=",".join(BUDGETS),
+        help="Comma-separated modules to import (default: all budgeted modules)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Imports per module, the fastest is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="Heaviest packages shown per module (default: 5)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with an error if a module is over budget or imports a lazy package",
+    )
+
+    args = parser.parse_args()
+    modules = [module.strip() for module in args.modules.split(",") if module.strip()]
+
+    startup_imports, error = run_importtime("pass")
+    if startup_imports is None:
+        print(f"Error starting the interpreter: {error}")
+        sys.exit(1)
+    startup = {name for name, _ in startup_imports}
+
+    failures = []
+    print(f"{'module':<32} {'total':>10}  heaviest packages")
+    for module in modules:
+        result = benchmark_module(module, startup, args.repeat)
+        if "error" in result:
+            # Optional dependencies missing here are reported, not failed
+            print(f"{module:<32} {'skipped':>10}  {result['error']}")
+            continue
+
+        heaviest = sorted(result["packages"].items(), key=lambda x: -x[1])[: args.top]
+        packages = ", ".join(f"{name} {ms:.0f}" for name, ms in heaviest)
+        print(f"{module:<32} {result['total_ms']:>7.0f} ms  {packages}")
+
+        for problem in check_module(module, result):
+            failures.append(f"{module}: {problem}")
+
+    if failures:
+        print("\nImport regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\nAll modules within their import budgets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Script to sync the picks, market_lines and pool_spreads tables into local
+Parquet files for notebook analysis. Only rows written since the last sync
+are fetched unless --full is given.
+"""
+
+import os
+import sys
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.g_nfl.utils.replica import DEFAULT_REPLICA_PATH, REPLICA_TABLES, sync_replica
+
+
+def main():
+    """Main function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Sync database tables into a local Parquet replica"
+    )
+    parser.add_argument(
+        "--tables",
+        type=str,
+        default=",".join(REPLICA_TABLES),
+        help="Comma-separated tables to sync (default: all)",
+    )
+    parser.add_argument(
+        "--path",
+        type=str,
+        default=str(DEFAULT_REPLICA_PATH),
+        help="Replica directory",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-read the whole tables instead of only new rows",
+    )
+
+    args = parser.parse_args()
+    tables = [table.strip() for table in args.tables.split(",") if table.strip()]
+
+    try:
+        reports = sync_replica(tables, args.path, full=args.full)
+    except Exception as e:
+        print(f"Error syncing replica: {e}")
+        sys.exit(1)
+
+    print(f"Replica synced to {args.path}:")
+    for table, report in reports.items():
+        print(
+            f"  - {table}: {report['fetched']} rows fetched, "
+            f"{report['rows']} rows total (up to {report['watermark']})"
+        )
+
+
+if __name__ == "__main__":
+    main()
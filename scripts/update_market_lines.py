@@ -6,63 +6,72 @@ This should be run locally where nfl_data_py is available.
 
 import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Add the project root to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from src.g_nfl.modelling.utils import get_week_spreads
+from src.g_nfl.modelling.utils import get_season_spreads
 from src.g_nfl.utils.config import CUR_SEASON
 from src.g_nfl.utils.database import MarketLinesDatabase
 
 
-def fetch_and_store_market_lines(season: int, week: int) -> bool:
-    """Fetch market lines and store in database
+def fetch_and_store_market_lines(
+    season: int, weeks: List[int], dry_run: bool = False
+) -> bool:
+    """Fetch market lines for several weeks and store only the changes
+
+    The schedule is downloaded once for the whole season and diffed against the
+    stored lines, then every changed row is written in a single upsert.
 
     Args:
         season: NFL season year
-        week: Week number
+        weeks: Week numbers to update
+        dry_run: If True, print the diff without writing to the database
 
     Returns:
         True if successful
     """
     try:
-        print(f"Fetching market lines for {season} Week {week}...")
+        print(f"Fetching market lines for {season} Weeks {format_weeks(weeks)}...")
 
-        # Get spreads and totals from nfl_data
-        games_df = get_week_spreads(week, season)
+        # Get spreads and totals from nfl_data (single schedule download)
+        games_df = get_season_spreads(season, weeks)
 
         if games_df.empty:
-            print(f"No games found for {season} Week {week}")
+            print(f"No games found for {season} Weeks {format_weeks(weeks)}")
             return False
 
-        # Convert to dictionary format for database storage
-        lines = {}
-        for game_id, game in games_df.iterrows():
-            lines[game_id] = {
-                "spread": game.get("spread_line"),
-                "total": game.get("total_line"),
-            }
+        # Convert to {week: {game_id: line}} format for database storage
+        lines: Dict[int, Dict[str, Dict[str, Any]]] = {week: {} for week in weeks}
+        for game_id, week, spread, total in zip(
+            games_df.index,
+            games_df["week"],
+            games_df["spread_line"],
+            games_df["total_line"],
+        ):
+            lines[int(week)][game_id] = {"spread": spread, "total": total}
 
-        print(f"Found {len(lines)} games with market lines")
+        print(f"Found {len(games_df)} games with market lines")
 
-        # Store in database
+        # Diff against the database and store the changes
         db = MarketLinesDatabase()
-        saved_count = db.save_market_lines(season, week, lines)
-
-        print(f"Successfully saved {saved_count} market lines to database")
+        report = db.sync_market_lines(season, lines, dry_run=dry_run)
 
         # Print summary
-        spreads_count = sum(
-            1 for line in lines.values() if line.get("spread") is not None
-        )
-        totals_count = sum(
-            1 for line in lines.values() if line.get("total") is not None
-        )
-
-        print(f"Summary:")
-        print(f"  - Games with spreads: {spreads_count}")
-        print(f"  - Games with totals: {totals_count}")
+        print("Dry run - no changes written:" if dry_run else "Summary:")
+        print(f"  - New games: {len(report['added'])}")
+        print(f"  - Changed lines: {len(report['changed'])}")
+        print(f"  - Unchanged lines: {len(report['unchanged'])}")
+        for row in report["added"] + report["changed"]:
+            print(
+                f"    Week {row['week']} {row['game_id']}: "
+                f"spread={row['spread']} total={row['total']}"
+            )
+        if report["stale"]:
+            print(f"  - Stored games no longer in schedule: {len(report['stale'])}")
+            for week, game_id in report["stale"]:
+                print(f"    Week {week} {game_id}")
 
         return True
 
@@ -71,6 +80,19 @@ def fetch_and_store_market_lines(season: int, week: int) -> bool:
         return False
 
 
+def format_weeks(weeks: List[int]) -> str:
+    """Format a list of weeks for printing, e.g. '1-18', '3' or '1-3, 5'"""
+    runs: List[List[int]] = []
+    for week in sorted(set(weeks)):
+        if runs and week == runs[-1][-1] + 1:
+            runs[-1].append(week)
+        else:
+            runs.append([week])
+    return ", ".join(
+        str(run[0]) if len(run) == 1 else f"{run[0]}-{run[-1]}" for run in runs
+    )
+
+
 def main():
     """Main function"""
     import argparse
@@ -79,10 +101,15 @@ def main():
     parser.add_argument(
         "--season", type=int, default=CUR_SEASON, help="NFL season year"
     )
-    parser.add_argument("--week", type=int, required=True, help="Week number")
+    parser.add_argument("--week", type=int, help="Week number")
     parser.add_argument(
         "--weeks", type=str, help="Week range (e.g., '1-18' or '1,3,5')"
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which lines would change without writing them",
+    )
 
     args = parser.parse_args()
 
@@ -95,20 +122,15 @@ def main():
         else:
             # Comma-separated format: 1,3,5
             weeks = [int(w.strip()) for w in args.weeks.split(",")]
-
-        success_count = 0
-        for week in weeks:
-            if fetch_and_store_market_lines(args.season, week):
-                success_count += 1
-            print()  # Add spacing between weeks
-
-        print(f"Successfully updated {success_count}/{len(weeks)} weeks")
-
-    else:
+    elif args.week is not None:
         # Single week
-        success = fetch_and_store_market_lines(args.season, args.week)
-        if not success:
-            sys.exit(1)
+        weeks = [args.week]
+    else:
+        parser.error("one of --week or --weeks is required")
+
+    success = fetch_and_store_market_lines(args.season, weeks, dry_run=args.dry_run)
+    if not success:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -20,3 +20,19 @@ __all__ = [
     "AVG_POINTS",
     "SPREAD_STDEV",
 ]
+
+# Subpackages are imported on first attribute access (g_nfl.modelling, ...),
+# so `import g_nfl` for the constants above never loads pandas or matplotlib
+_SUBPACKAGES = ("fantasy", "modelling", "scraping", "utils", "visualisation")
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBPACKAGES))
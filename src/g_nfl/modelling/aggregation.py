@@ -0,0 +1,247 @@
+"""Composite power ratings from every picker's ratings
+
+The stacked ratings of `get_all_power_ratings` (indexed by picker, week and
+team) are turned into a dense picker x week x team array, and a whole season
+is aggregated at once along the picker axis:
+
+- mean, median and trimmed mean of the pickers' ratings
+- a confidence-weighted mean, weighting each picker by the inverse of their
+  squared error against the market lines (or by given weights)
+- dispersion: standard deviation, spread (max - min) and number of pickers
+
+Pickers without a rating for a week or team are NaN and ignored.
+
+`picker_market_bias` compares the lines each picker's ratings imply with the
+market `spread_line` of every game, using the nfl_data convention of
+`guess_the_lines_ovr`: lines are home minus away, positive when the home team
+is favored.
+"""
+
+import warnings
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from g_nfl.utils.config import HFA
+
+# Rating column used for lines, as in guess_the_lines_ovr
+RATING_COLUMN = "net_gpf"
+
+COMPOSITE_METHODS = ["mean", "median", "trimmed_mean", "weighted_mean"]
+
+
+class RatingsCube(NamedTuple):
+    """Dense ratings array and the labels of its axes"""
+
+    values: np.ndarray  # (picker, week, team)
+    pickers: List[str]
+    weeks: List[int]
+    teams: List[str]
+
+
+def ratings_cube(stacked: pd.DataFrame, column: str = RATING_COLUMN) -> RatingsCube:
+    """Reshape stacked ratings into a picker x week x team array
+
+    Args:
+        stacked: Ratings indexed by (picker, week, team), see
+            `get_all_power_ratings`
+        column: Rating column to aggregate
+
+    Returns:
+        RatingsCube with NaN where a picker has no rating
+    """
+    ratings = stacked[column].astype(float)
+    index = ratings.index.remove_unused_levels()
+    pickers, weeks, teams = (list(level) for level in index.levels)
+
+    values = np.full((len(pickers), len(weeks), len(teams)), np.nan)
+    values[tuple(index.codes)] = ratings.to_numpy()
+    return RatingsCube(values, pickers, weeks, teams)
+
+
+def _trimmed_mean(values: np.ndarray, proportion: float) -> np.ndarray:
+    """Mean along axis 0 after cutting `proportion` of each end, NaN-aware"""
+    count = np.sum(~np.isnan(values), axis=0)
+    cut = np.floor(count * proportion).astype(int)
+
+    # NaNs sort last, so the valid values of each cell come first
+    ranked = np.sort(values, axis=0)
+    position = np.arange(values.shape[0]).reshape(-1, *([1] * (values.ndim - 1)))
+    keep = (position >= cut) & (position < count - cut)
+
+    with np.errstate(invalid="ignore"):
+        return np.where(keep, ranked, 0).sum(axis=0) / keep.sum(axis=0)
+
+
+def _weighted_mean(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Mean along axis 0 weighted by picker, ignoring missing ratings"""
+    weights = np.broadcast_to(
+        weights.reshape(-1, *([1] * (values.ndim - 1))), values.shape
+    )
+    weights = np.where(np.isnan(values), 0, weights)
+    with np.errstate(invalid="ignore"):
+        return np.nansum(values * weights, axis=0) / weights.sum(axis=0)
+
+
+def composite_ratings(
+    cube: RatingsCube,
+    weights: Optional[Union[Dict[str, float], pd.Series]] = None,
+    trim: float = 0.2,
+) -> pd.DataFrame:
+    """Aggregate the pickers' ratings of every week and team at once
+
+    Args:
+        cube: Ratings array, see `ratings_cube`
+        weights: Confidence weight by picker, e.g. `picker_weights(bias)`.
+            Pickers without a weight get 0. Equal weights if None.
+        trim: Proportion of the lowest and highest ratings cut from each end
+            for the trimmed mean
+
+    Returns:
+        DataFrame indexed by (week, team) with mean, median, trimmed_mean,
+        weighted_mean, std, spread and n_pickers columns
+    """
+    values = cube.values
+
+    if weights is None:
+        weight_array = np.ones(len(cube.pickers))
+    else:
+        weight_array = (
+            pd.Series(weights, dtype=float).reindex(cube.pickers).fillna(0).to_numpy()
+        )
+
+    with warnings.catch_warnings():
+        # All-NaN cells (no picker rated the team that week) stay NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        composite = {
+            "mean": np.nanmean(values, axis=0),
+            "median": np.nanmedian(values, axis=0),
+            "trimmed_mean": _trimmed_mean(values, trim),
+            "weighted_mean": _weighted_mean(values, weight_array),
+            "std": np.nanstd(values, axis=0, ddof=1),
+            "spread": np.nanmax(values, axis=0) - np.nanmin(values, axis=0),
+        }
+    composite["n_pickers"] = np.sum(~np.isnan(values), axis=0)
+
+    index = pd.MultiIndex.from_product([cube.weeks, cube.teams], names=["week", "team"])
+    return pd.DataFrame(
+        {name: array.ravel() for name, array in composite.items()}, index=index
+    )
+
+
+def implied_lines(cube: RatingsCube, games: pd.DataFrame) -> np.ndarray:
+    """Line of every game implied by every picker's ratings
+
+    Args:
+        cube: Ratings array, see `ratings_cube`
+        games: Games with week, away_team and home_team columns
+
+    Returns:
+        Array (picker, game) of home minus away rating plus HFA, NaN for games
+        outside the cube
+    """
+    week_pos = pd.Index(cube.weeks).get_indexer(games["week"])
+    team_index = pd.Index(cube.teams)
+    away_pos = team_index.get_indexer(games["away_team"])
+    home_pos = team_index.get_indexer(games["home_team"])
+
+    lines = (
+        cube.values[:, week_pos, home_pos] - cube.values[:, week_pos, away_pos] + HFA
+    )
+    missing = (week_pos < 0) | (away_pos < 0) | (home_pos < 0)
+    lines[:, missing] = np.nan
+    return lines
+
+
+def picker_market_bias(cube: RatingsCube, games: pd.DataFrame) -> pd.DataFrame:
+    """Compare each picker's implied lines with the market over a season
+
+    Args:
+        cube: Ratings array, see `ratings_cube`
+        games: Games with week, away_team, home_team and spread_line columns,
+            e.g. `get_season_results`
+
+    Returns:
+        DataFrame indexed by picker with bias (mean implied minus market line,
+        positive when leaning to the home team), mae, rmse and n_games columns
+    """
+    market = pd.to_numeric(games["spread_line"], errors="coerce").to_numpy()
+    errors = implied_lines(cube, games) - market
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        bias = pd.DataFrame(
+            {
+                "bias": np.nanmean(errors, axis=1),
+                "mae": np.nanmean(np.abs(errors), axis=1),
+                "rmse": np.sqrt(np.nanmean(errors**2, axis=1)),
+                "n_games": np.sum(~np.isnan(errors), axis=1),
+            },
+            index=pd.Index(cube.pickers, name="picker"),
+        )
+    return bias
+
+
+def picker_weights(bias: pd.DataFrame) -> pd.Series:
+    """Confidence weights: inverse mean squared error against the market
+
+    Args:
+        bias: Output of `picker_market_bias`
+
+    Returns:
+        Weights by picker, summing to 1 (0 for pickers without games)
+    """
+    weights = (1 / bias["rmse"] ** 2).replace(np.inf, np.nan).fillna(0)
+    total = weights.sum()
+    return weights / total if total else weights
+
+
+def composite_power_df(
+    composite: pd.DataFrame, week: int, method: str = "mean"
+) -> pd.DataFrame:
+    """One week of a composite as a power rating frame for `guess_the_lines_ovr`
+
+    Args:
+        composite: Output of `composite_ratings`
+        week: Week to extract
+        method: One of COMPOSITE_METHODS
+
+    Returns:
+        DataFrame indexed by team with a net_gpf column
+    """
+    if method not in COMPOSITE_METHODS:
+        raise ValueError(
+            f"Unknown method '{method}', use one of: {', '.join(COMPOSITE_METHODS)}"
+        )
+    return composite.loc[week, [method]].rename(columns={method: RATING_COLUMN})
+
+
+def aggregate_power_ratings(
+    stacked: pd.DataFrame,
+    games: Optional[pd.DataFrame] = None,
+    column: str = RATING_COLUMN,
+    trim: float = 0.2,
+) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """Composite ratings and picker bias for every week in one call
+
+    Args:
+        stacked: Ratings indexed by (picker, week, team), e.g.
+            `get_all_power_ratings(range(1, 19))`
+        games: Optional games with market lines (e.g. `get_season_results`).
+            When given, pickers are confidence-weighted by their error
+            against the market; otherwise weights are equal.
+        column: Rating column to aggregate
+        trim: Proportion cut from each end for the trimmed mean
+
+    Returns:
+        Tuple of the composite (see `composite_ratings`) and the picker bias
+        (see `picker_market_bias`, None without games)
+    """
+    cube = ratings_cube(stacked, column)
+    if games is None:
+        return composite_ratings(cube, trim=trim), None
+
+    bias = picker_market_bias(cube, games)
+    composite = composite_ratings(cube, weights=picker_weights(bias), trim=trim)
+    return composite, bias
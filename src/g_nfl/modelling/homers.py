@@ -1,11 +1,18 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 import pandas as pd
 import scipy.stats as stats
-from gspread.exceptions import SpreadsheetNotFound, WorksheetNotFound
+from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from gspread.spreadsheet import Spreadsheet
 
 from g_nfl.modelling.utils import guess_the_lines_ovr
 from g_nfl.scraping.google_sheets import col_to_int
+from g_nfl.scraping.sheets_cache import get_sheets_cache
 from g_nfl.utils.config import CUR_SEASON
-from g_nfl.utils.connections import load_service_account
+from g_nfl.utils.connections import get_service_account
 from g_nfl.utils.teams import standardize_teams
 
 pickers = ["Griffin", "Harry", "Chuck", "Hunter", "Jacko"]
@@ -20,8 +27,12 @@ google_sheet_names = {
 
 master_google_sheet = "Picks Pool 24"
 
-# Load the service acount from the google_config.json file
-sa = load_service_account()
+# Header row and the 32 team rows of a 'Wk N' tab
+POWER_RATING_RANGE = "A1:P33"
+
+# Open spreadsheets by (service account, sheet name)
+_spreadsheets: Dict[Tuple[int, str], Spreadsheet] = {}
+_spreadsheets_lock = threading.Lock()
 
 
 def calc_percentile_to_gpf(percentile: float, stdev=11.5) -> float:
@@ -32,29 +43,59 @@ def calc_percentile_to_gpf(percentile: float, stdev=11.5) -> float:
     return gpf
 
 
-def get_power_ratings(
-    week: int, picker: str = "Griffin", season: int = CUR_SEASON
-) -> pd.DataFrame:
+def open_picker_sheet(picker: str) -> Spreadsheet:
+    """Open a picker's power rating spreadsheet, reusing an already open handle
+
+    Opening a spreadsheet by name costs a Drive search and a metadata request,
+    so handles are kept for the life of the process (per service account).
+    """
     sheet_name = google_sheet_names[picker]
-    tab_name = f"Wk {week}"
+    client = get_service_account()
+    key = (id(client), sheet_name)
+
+    with _spreadsheets_lock:
+        gsheet = _spreadsheets.get(key)
+    if gsheet is not None:
+        return gsheet
 
     try:
         # open the google sheet
-        gsheet = sa.open(sheet_name)
+        gsheet = client.open(sheet_name)
     except SpreadsheetNotFound as e:
         print(
             f"WARNING: google sheet '{sheet_name}' not found, ensure it is shared with the service account"
         )
         raise e
-    # open power ratings for this week
+
+    with _spreadsheets_lock:
+        return _spreadsheets.setdefault(key, gsheet)
+
+
+def _fetch_power_rating_values(
+    picker: str, weeks: List[int], gsheet: Optional[Spreadsheet] = None
+) -> List[List]:
+    """Read the power rating range of several weeks in one batchGet request
+
+    Ranges unchanged since the last read are served from the sheets cache.
+    """
+    ranges = [f"'Wk {week}'!{POWER_RATING_RANGE}" for week in weeks]
     try:
-        work_sheet = gsheet.worksheet(tab_name)
-        # gsheet.worksheet(f"Wk {week} fail")
-    except WorksheetNotFound as e:
-        print(f"WARNING: tab '{tab_name}' not found")
+        return get_sheets_cache().get_values(
+            google_sheet_names[picker],
+            ranges,
+            lambda: gsheet or open_picker_sheet(picker),
+        )
+    except APIError as e:
+        if "Unable to parse range" in str(e):
+            tabs = ", ".join(f"'Wk {week}'" for week in weeks)
+            print(f"WARNING: one of the tabs {tabs} not found")
+            raise WorksheetNotFound(str(e)) from e
         raise e
 
-    power_df = pd.DataFrame(work_sheet.get(range_name="A1:P33"))
+
+def _parse_power_ratings(values: List[List]) -> pd.DataFrame:
+    """Power rating frame, team as the index, from the raw sheet values"""
+    power_df = pd.DataFrame(values)
     # reset column names
     power_df.columns = power_df.iloc[0]
     power_df = power_df.drop(0)
@@ -65,6 +106,73 @@ def get_power_ratings(
     return power_df
 
 
+def get_power_ratings(
+    week: int,
+    picker: str = "Griffin",
+    season: int = CUR_SEASON,
+    gsheet: Optional[Spreadsheet] = None,
+) -> pd.DataFrame:
+    # open power ratings for this week
+    (values,) = _fetch_power_rating_values(picker, [week], gsheet)
+    return _parse_power_ratings(values)
+
+
+def get_all_power_ratings(
+    weeks: Union[int, Iterable[int]],
+    pickers: Optional[Iterable[str]] = None,
+    season: int = CUR_SEASON,
+) -> pd.DataFrame:
+    """Fetch every picker's power ratings concurrently
+
+    Each picker's spreadsheet is opened once (or reused) and all requested
+    weeks are read in a single batchGet, with the pickers fetched in parallel.
+    Weeks unchanged since the last read come from the sheets cache.
+
+    Args:
+        weeks: Week, or weeks, to fetch ('Wk N' tabs)
+        pickers: Pickers to fetch, defaults to every picker with a sheet
+        season: NFL season year
+
+    Returns:
+        Power ratings stacked by picker: indexed by (picker, team) for a single
+        week, or by (picker, week, team) when several weeks are requested
+    """
+    single_week = isinstance(weeks, int)
+    weeks = [weeks] if single_week else list(weeks)
+    pickers = list(pickers) if pickers is not None else list(google_sheet_names)
+
+    def fetch(picker: str) -> List[pd.DataFrame]:
+        values = _fetch_power_rating_values(picker, weeks)
+        return [_parse_power_ratings(week_values) for week_values in values]
+
+    with ThreadPoolExecutor(max_workers=max(len(pickers), 1)) as executor:
+        results = dict(zip(pickers, executor.map(fetch, pickers)))
+
+    frames = {
+        (picker, week): df
+        for picker, week_dfs in results.items()
+        for week, df in zip(weeks, week_dfs)
+    }
+    power_df = pd.concat(frames, names=["picker", "week"])
+    if single_week:
+        power_df = power_df.droplevel("week")
+    return power_df
+
+
+def _cell_data(value) -> Dict:
+    """Sheets API CellData of a value, entered as if typed (formulas evaluate)"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return {}
+    if isinstance(value, str):
+        kind = "formulaValue" if value.startswith("=") else "stringValue"
+        return {"userEnteredValue": {kind: value}}
+    if isinstance(value, (bool, np.bool_)):
+        return {"userEnteredValue": {"boolValue": bool(value)}}
+    if isinstance(value, (int, float, np.number)):
+        return {"userEnteredValue": {"numberValue": float(value)}}
+    return {"userEnteredValue": {"stringValue": str(value)}}
+
+
 # def run_picks
 def orchestrate_power_ratings_to_picks(
     week: int,
@@ -73,19 +181,10 @@ def orchestrate_power_ratings_to_picks(
     hide_cols: bool = True,
     season: int = CUR_SEASON,
 ):
-    sheet_name = google_sheet_names[picker]
     tab_name = f"Wk {week}"
 
-    try:
-        # open the google sheet
-        gsheet = sa.open(sheet_name)
-    except SpreadsheetNotFound as e:
-        print(
-            f"WARNING: google sheet '{sheet_name}' not found, ensure it is shared with the service account"
-        )
-        raise e
-
-    power_df = get_power_ratings(week, picker=picker, season=season)
+    gsheet = open_picker_sheet(picker)
+    power_df = get_power_ratings(week, picker=picker, season=season, gsheet=gsheet)
 
     gtl = (
         guess_the_lines_ovr(power_df, week=week, season=season)
@@ -99,73 +198,99 @@ def orchestrate_power_ratings_to_picks(
     gtl["confidence_pick"] = None
     gtl["confidence_rank"] = None
     col_char_mappings = {col: chr(65 + i) for i, col in enumerate(gtl.columns)}
+    c = col_char_mappings
 
-    adj_difference_formulas = []
-    adj_pick_formulas = []
-    adj_rank_formulas = []
-    confidence_pick_formulas = []
-    confidence_rank_formulas = []
+    # Sheet row of each game (row 1 is the header), formulas built per column
     n = len(gtl)
-    for index, row in gtl.iterrows():
-        i = int(index) + 2
-        adj_difference_formulas.append(
-            f"={col_char_mappings['adj_line']}{i}-{col_char_mappings['spread_line']}{i}"
-        )
-        adj_pick_formulas.append(
-            f"=IF({col_char_mappings['adj_difference']}{i}>0,{col_char_mappings['home_team']}{i}, {col_char_mappings['away_team']}{i})"
-        )
-        adj_rank_formulas.append(
-            f"=RANK(ABS({col_char_mappings['adj_difference']}{i}), ARRAYFORMULA(ABS(${col_char_mappings['adj_difference']}$2:${col_char_mappings['adj_difference']}${n+1})))"
-        )
-        confidence_pick_formulas.append(
-            f"=IF({col_char_mappings['adj_line']}{i}>0,{col_char_mappings['home_team']}{i}, {col_char_mappings['away_team']}{i})"
-        )
-        confidence_rank_formulas.append(
-            f"=RANK(ABS({col_char_mappings['pred_line']}{i}), ARRAYFORMULA(ABS(${col_char_mappings['pred_line']}$2:${col_char_mappings['pred_line']}${n+1})), 1)"
-        )
-    gtl["adj_difference"] = adj_difference_formulas
-    gtl["adj_pick"] = adj_pick_formulas
-    gtl["adj_rank"] = adj_rank_formulas
-    gtl["confidence_pick"] = confidence_pick_formulas
-    gtl["confidence_rank"] = confidence_rank_formulas
+    i = pd.Series(range(2, n + 2), index=gtl.index).astype(str)
+    gtl["adj_difference"] = "=" + c["adj_line"] + i + "-" + c["spread_line"] + i
+    gtl["adj_pick"] = (
+        f"=IF({c['adj_difference']}"
+        + i
+        + f">0,{c['home_team']}"
+        + i
+        + f", {c['away_team']}"
+        + i
+        + ")"
+    )
+    gtl["adj_rank"] = (
+        f"=RANK(ABS({c['adj_difference']}"
+        + i
+        + f"), ARRAYFORMULA(ABS(${c['adj_difference']}$2:${c['adj_difference']}${n+1})))"
+    )
+    gtl["confidence_pick"] = (
+        f"=IF({c['adj_line']}"
+        + i
+        + f">0,{c['home_team']}"
+        + i
+        + f", {c['away_team']}"
+        + i
+        + ")"
+    )
+    gtl["confidence_rank"] = (
+        f"=RANK(ABS({c['pred_line']}"
+        + i
+        + f"), ARRAYFORMULA(ABS(${c['pred_line']}$2:${c['pred_line']}${n+1})), 1)"
+    )
     pick_tab = tab_name + " - Picks"
 
-    try:
-        pick_worksheet = gsheet.worksheet(pick_tab)
-        if overwrite_tab:
-            gsheet.del_worksheet(pick_worksheet)
-        else:
+    # One metadata read, then the whole tab is written in a single batch_update
+    existing = {ws.title: ws.id for ws in gsheet.worksheets()}
+    requests = []
+    if pick_tab in existing:
+        if not overwrite_tab:
             print(f"Picks tab {pick_tab} already exists and overwrite_tab set to False")
             return None
-    except WorksheetNotFound:
-        pass
-
-    pick_worksheet = gsheet.add_worksheet(pick_tab, 100, 100)
-
-    data_to_upload = gtl.values.tolist()
-    data_to_upload.insert(0, gtl.columns.tolist())
-    data_to_upload = [
-        [round(val, 2) if isinstance(val, float) else val for val in row]
-        for row in data_to_upload
-    ]
-    # Update the worksheet with formulas
-    # If update is causing issues, ensure that the values are treated correctly
-    # by setting values explicitly as formulas
-    cell_range = (
-        f"A1:{chr(65 + len(gtl.columns) - 1)}{len(gtl) + 1}"  # Adjust range as needed
+        requests.append({"deleteSheet": {"sheetId": existing[pick_tab]}})
+
+    sheet_id = max(existing.values(), default=0) + 1
+    requests.append(
+        {
+            "addSheet": {
+                "properties": {
+                    "sheetId": sheet_id,
+                    "title": pick_tab,
+                    "gridProperties": {"rowCount": 100, "columnCount": 100},
+                }
+            }
+        }
+    )
+
+    upload = gtl.round(2)
+    rows = [gtl.columns.tolist()] + upload.values.tolist()
+    requests.append(
+        {
+            "updateCells": {
+                "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                "rows": [{"values": [_cell_data(val) for val in row]} for row in rows],
+                "fields": "userEnteredValue",
+            }
+        }
     )
-    pick_worksheet.update(values=data_to_upload, range_name=cell_range, raw=False)
 
     if hide_cols:
-        i = col_to_int(col_char_mappings["spread_line"])
-        pick_worksheet.hide_columns(i, i + 1)
-
-        i = col_to_int(col_char_mappings["difference"])
-        j = col_to_int(col_char_mappings["rank"])
-        pick_worksheet.hide_columns(i, j + 1)
-        i = col_to_int(col_char_mappings["adj_difference"])
-        j = col_to_int(col_char_mappings["confidence_rank"])
-        pick_worksheet.hide_columns(i, j + 1)
+        hidden = [
+            ("spread_line", "spread_line"),
+            ("difference", "rank"),
+            ("adj_difference", "confidence_rank"),
+        ]
+        for first, last in hidden:
+            requests.append(
+                {
+                    "updateDimensionProperties": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "dimension": "COLUMNS",
+                            "startIndex": col_to_int(c[first]),
+                            "endIndex": col_to_int(c[last]) + 1,
+                        },
+                        "properties": {"hiddenByUser": True},
+                        "fields": "hiddenByUser",
+                    }
+                }
+            )
+
+    gsheet.batch_update({"requests": requests})
 
     return gtl.drop(
         columns=[col for col in gtl.columns if "adj" in col or "confidence" in col]
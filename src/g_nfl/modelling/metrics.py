@@ -1,8 +1,6 @@
 from typing import List, Literal, Tuple
 
 import pandas as pd
-import statsmodels.api as sm
-import statsmodels.formula.api as smf
 
 success_rate_lambda = lambda x: 1 if x > 0 else 0
 
@@ -0,0 +1,162 @@
+"""Vectorized scoring of stored picks
+
+Picks for any number of weeks are joined with final scores and pool spreads
+and scored in one pass with array operations:
+
+- regular and MNF picks: 1 for a cover, 0.5 for a push
+- best bets: 2 for a cover, 1 for a push
+- survivor: 1 if the team wins outright
+- underdog: the size of the spread if the team wins outright
+
+Spreads follow the database convention: they are the away team's spread, so
+negative means the away team is favored. `result` is home minus away score.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Multiplier applied to the cover result of spread picks
+SPREAD_PICK_WEIGHTS = {"regular": 1, "best_bet": 2, "mnf": 1}
+
+PICK_TYPES = ["regular", "best_bet", "mnf", "survivor", "underdog"]
+
+
+def _normalize_game_ids(game_ids: pd.Series) -> pd.Series:
+    """Zero-pad the week in game ids, e.g. 2025_1_KC_LAC -> 2025_01_KC_LAC"""
+    return game_ids.astype(str).str.replace(
+        r"^(\d{4})_(\d)_", r"\g<1>_0\g<2>_", regex=True
+    )
+
+
+def score_picks(
+    picks: pd.DataFrame,
+    results: pd.DataFrame,
+    pool_spreads: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Score picks against final results
+
+    The line of each pick is the pool spread of the game if there is one,
+    otherwise the spread stored with the pick, otherwise the market spread
+    in `results`.
+
+    Args:
+        picks: Pick rows with picker, week, game_id, team_picked, pick_type and
+            spread columns (e.g. `PicksDatabase.get_season_picks`)
+        results: Final scores indexed by game_id with away_team, home_team,
+            result and spread_line columns (see `get_season_results`)
+        pool_spreads: Optional pool spread rows with game_id and spread columns
+
+    Returns:
+        Copy of `picks` with away_team, home_team, line, result, final, cover,
+        won and points columns. Picks on games without a final score have
+        final=False and NaN points.
+    """
+    scored = picks.copy()
+    if "pick_type" not in scored:
+        scored["pick_type"] = "regular"
+    if "spread" not in scored:
+        scored["spread"] = np.nan
+    scored["pick_type"] = scored["pick_type"].fillna("regular")
+    scored["game_id"] = _normalize_game_ids(scored["game_id"])
+
+    games = results[["away_team", "home_team", "result", "spread_line"]].copy()
+    games.index = _normalize_game_ids(games.index.to_series())
+    games = games[~games.index.duplicated(keep="last")]
+    scored = scored.join(games, on="game_id")
+
+    line = pd.to_numeric(scored["spread"], errors="coerce").combine_first(
+        scored["spread_line"]
+    )
+    if pool_spreads is not None and len(pool_spreads):
+        pool = pd.Series(
+            pd.to_numeric(pool_spreads["spread"], errors="coerce").to_numpy(),
+            index=_normalize_game_ids(pool_spreads["game_id"]),
+        )
+        pool = pool[~pool.index.duplicated(keep="last")]
+        line = scored["game_id"].map(pool).combine_first(line)
+    scored["line"] = line.astype(float)
+
+    result = scored["result"].to_numpy(dtype=float)
+    line = scored["line"].to_numpy(dtype=float)
+    is_away = (scored["team_picked"] == scored["away_team"]).to_numpy()
+    final = ~np.isnan(result)
+
+    # Away covers when the home margin is below the away spread
+    away_cover = np.where(result == line, 0.5, (result < line).astype(float))
+    cover = np.where(is_away, away_cover, 1 - away_cover)
+    won = np.where(is_away, result < 0, result > 0)
+
+    pick_type = scored["pick_type"].to_numpy()
+    spread_weight = scored["pick_type"].map(SPREAD_PICK_WEIGHTS).to_numpy(dtype=float)
+    points = np.select(
+        [
+            pick_type == "survivor",
+            pick_type == "underdog",
+        ],
+        [
+            won.astype(float),
+            np.where(won, np.abs(line), 0.0),
+        ],
+        # NaN weight for unknown pick types
+        cover * spread_weight,
+    )
+
+    scored["final"] = final
+    scored["cover"] = np.where(final, cover, np.nan)
+    scored["won"] = np.where(final, won, np.nan)
+    scored["points"] = np.where(final, points, np.nan)
+    return scored
+
+
+def weekly_points(scored: pd.DataFrame) -> pd.DataFrame:
+    """Picker x week table of points
+
+    Args:
+        scored: Output of `score_picks`
+
+    Returns:
+        DataFrame indexed by picker with one column per week
+    """
+    return scored.pivot_table(
+        index="picker", columns="week", values="points", aggfunc="sum", fill_value=0
+    )
+
+
+def season_leaderboard(scored: pd.DataFrame) -> pd.DataFrame:
+    """Season-to-date standings for all pickers
+
+    Args:
+        scored: Output of `score_picks`
+
+    Returns:
+        DataFrame indexed by picker, sorted by total points, with total points,
+        points per pick type, spread pick record (covers/pushes/losses),
+        weeks played and points per week
+    """
+    final = scored[scored["final"]]
+
+    by_type = final.pivot_table(
+        index="picker",
+        columns="pick_type",
+        values="points",
+        aggfunc="sum",
+        fill_value=0,
+    ).reindex(columns=PICK_TYPES, fill_value=0)
+
+    spread_picks = final[final["pick_type"].isin(SPREAD_PICK_WEIGHTS)]
+    record = spread_picks.groupby("picker")["cover"].agg(
+        covers=lambda cover: int((cover == 1).sum()),
+        pushes=lambda cover: int((cover == 0.5).sum()),
+        losses=lambda cover: int((cover == 0).sum()),
+    )
+
+    leaderboard = by_type.join(record).fillna(0)
+    leaderboard[record.columns] = leaderboard[record.columns].astype(int)
+    leaderboard.insert(0, "total", by_type.sum(axis=1))
+    leaderboard["weeks"] = final.groupby("picker")["week"].nunique()
+    leaderboard["points_per_week"] = leaderboard["total"] / leaderboard["weeks"]
+    leaderboard.columns.name = None
+
+    return leaderboard.sort_values("total", ascending=False)
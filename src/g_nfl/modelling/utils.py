@@ -1,16 +1,26 @@
-try:
-    import nfl_data_py as nfl
-
-    NFL_DATA_AVAILABLE = True
-except ImportError:
-    NFL_DATA_AVAILABLE = False
-
+import importlib.util
+import io
 import math
+from typing import List, Optional
 
 import pandas as pd
+import requests
 
 from g_nfl import AVG_POINTS, CUR_SEASON, HFA, SPREAD_STDEV
 
+# nfl_data_py is slow to import, so it is only imported when a schedule is loaded
+NFL_DATA_AVAILABLE = importlib.util.find_spec("nfl_data_py") is not None
+
+# nflverse schedule with final scores, the file behind nfl.import_schedules
+NFLVERSE_GAMES_URL = (
+    "https://raw.githubusercontent.com/nflverse/nfldata/master/data/games.csv"
+)
+
+
+class ScoresUnavailableError(RuntimeError):
+    """The schedule with final scores could not be downloaded"""
+
+
 predict_home_score = lambda row: AVG_POINTS + row.home_off - row.away_def + HFA / 2
 predict_away_score = lambda row: AVG_POINTS + row.away_off - row.home_def - HFA / 2
 
@@ -31,6 +41,8 @@ def get_week_spreads(week: int, season: int = CUR_SEASON) -> pd.DataFrame:
         return create_sample_schedule_data(week)
 
     try:
+        import nfl_data_py as nfl
+
         schedule_df = nfl.import_schedules([season])
         schedule_df = (
             schedule_df[
@@ -57,6 +69,81 @@ def get_week_spreads(week: int, season: int = CUR_SEASON) -> pd.DataFrame:
         return create_sample_schedule_data(week)
 
 
+def get_season_spreads(
+    season: int = CUR_SEASON, weeks: Optional[List[int]] = None
+) -> pd.DataFrame:
+    """Get spreads and totals for many weeks from a single schedule download
+
+    Args:
+        season: NFL season year
+        weeks: Weeks to keep, defaults to every week in the schedule
+
+    Returns:
+        DataFrame indexed by game_id with week, away_team, home_team,
+        spread_line and total_line columns
+    """
+    columns = ["week", "away_team", "home_team", "spread_line", "total_line"]
+
+    if not NFL_DATA_AVAILABLE:
+        # Return sample data if nfl_data_py is not available
+        return pd.concat(
+            [
+                create_sample_schedule_data(week).assign(week=week)[columns]
+                for week in (weeks or range(1, 19))
+            ]
+        )
+
+    import nfl_data_py as nfl
+
+    schedule_df = nfl.import_schedules([season]).set_index("game_id")[columns]
+    if weeks is not None:
+        schedule_df = schedule_df[schedule_df["week"].isin(weeks)]
+    return schedule_df
+
+
+def get_season_results(
+    season: int = CUR_SEASON, weeks: Optional[List[int]] = None
+) -> pd.DataFrame:
+    """Get final scores for a season from a single schedule download
+
+    The nflverse games CSV is read directly, so this works without
+    nfl_data_py (e.g. on Streamlit Cloud).
+
+    Args:
+        season: NFL season year
+        weeks: Weeks to keep, defaults to every week in the schedule
+
+    Returns:
+        DataFrame indexed by game_id with week, away_team, home_team,
+        away_score, home_score, result (home minus away score, NaN until the
+        game is final) and spread_line columns
+
+    Raises:
+        ScoresUnavailableError: The schedule could not be downloaded
+    """
+    columns = [
+        "week",
+        "away_team",
+        "home_team",
+        "away_score",
+        "home_score",
+        "result",
+        "spread_line",
+    ]
+
+    try:
+        response = requests.get(NFLVERSE_GAMES_URL, timeout=30)
+        response.raise_for_status()
+        games_df = pd.read_csv(io.StringIO(response.text))
+    except (requests.RequestException, pd.errors.ParserError) as e:
+        raise ScoresUnavailableError(f"Could not download the NFL schedule: {e}")
+
+    results_df = games_df[games_df["season"] == season].set_index("game_id")[columns]
+    if weeks is not None:
+        results_df = results_df[results_df["week"].isin(weeks)]
+    return results_df
+
+
 def create_sample_schedule_data(week: int) -> pd.DataFrame:
     """Create sample NFL schedule data for testing when nfl_data_py is not available"""
     sample_games = [
@@ -1,11 +1,6 @@
-import nfl_data_py as nfl
 import pandas as pd
 
-from g_nfl.utils.config import CUR_SEASON
-from g_nfl.utils.connections import load_service_account
-
-# Load the service acount from the google_config.json file
-sa = load_service_account()
+from g_nfl.utils.connections import get_service_account
 
 
 def col_to_int(col: str) -> int:
@@ -40,7 +35,7 @@ def get_power_ratings(file_name: str, week: int) -> pd.DataFrame:
         power rating dataframe with ovr, off, def ratings. team is the index.
     """
     # open the google sheet
-    gsheet = sa.open(file_name)
+    gsheet = get_service_account().open(file_name)
     # open power ratings for this week
     work_sheet = gsheet.worksheet(f"Wk {week}")
     power_df = pd.DataFrame(work_sheet.get(range_name="A1:P33"))
@@ -0,0 +1,198 @@
+"""Revision-aware local cache of Google Sheets values
+
+Power rating tabs are read on every notebook run, but are only edited once a
+week. `SheetsCache` keeps the last fetched values of each (spreadsheet, tab,
+range) on disk next to the spreadsheet's Drive modified time. A read checks
+the modified time (one small Drive request) and only fetches the ranges that
+are missing or older than the current revision.
+
+Settings come from the environment:
+
+- GNFL_SHEETS_CACHE_PATH: cache directory (default data/sheets_cache)
+- GNFL_SHEETS_OFFLINE=1: serve from disk without any request
+- GNFL_SHEETS_MAX_AGE_HOURS: in offline mode, refuse values fetched longer
+  ago than this (default 168, one week)
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from gspread.spreadsheet import Spreadsheet
+
+DEFAULT_SHEETS_CACHE_PATH = Path(
+    os.getenv("GNFL_SHEETS_CACHE_PATH", "data/sheets_cache")
+)
+
+
+class SheetsCacheMiss(LookupError):
+    """Offline read of a range that was never cached"""
+
+
+class StaleSheetsCache(RuntimeError):
+    """Offline read of a range fetched longer ago than the allowed age"""
+
+
+def _split_range(a1_range: str):
+    """'Wk 5'!A1:P33 -> ('Wk 5', 'A1:P33')"""
+    tab, _, cells = a1_range.rpartition("!")
+    return tab.strip("'"), cells
+
+
+def _cached_entry(cached: Dict, a1_range: str) -> Optional[Dict]:
+    """Cached values of a range, if any"""
+    tab, cells = _split_range(a1_range)
+    return cached.get(tab, {}).get(cells)
+
+
+class SheetsCache:
+    """Disk cache of sheet values, invalidated by the spreadsheet revision
+
+    Args:
+        path: Cache directory, one JSON file per spreadsheet
+        offline: Never contact Google, serve cached values only. Defaults to
+            GNFL_SHEETS_OFFLINE.
+        max_age: Oldest cached values served offline. Defaults to
+            GNFL_SHEETS_MAX_AGE_HOURS.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        offline: Optional[bool] = None,
+        max_age: Optional[timedelta] = None,
+    ):
+        self.path = Path(path or DEFAULT_SHEETS_CACHE_PATH)
+        self.offline = (
+            os.getenv("GNFL_SHEETS_OFFLINE", "0") == "1" if offline is None else offline
+        )
+        self.max_age = max_age or timedelta(
+            hours=float(os.getenv("GNFL_SHEETS_MAX_AGE_HOURS", "168"))
+        )
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _file(self, sheet_name: str) -> Path:
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", sheet_name).strip("_")
+        return self.path / f"{slug}.json"
+
+    def _load(self, sheet_name: str) -> Dict:
+        file = self._file(sheet_name)
+        if not file.exists():
+            return {"sheet": sheet_name, "ranges": {}}
+        with open(file) as f:
+            return json.load(f)
+
+    def _save(self, sheet_name: str, entry: Dict):
+        file = self._file(sheet_name)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and swap, so readers never see a partial file
+        tmp_file = file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_file, file)
+
+    def _read_offline(self, sheet_name: str, ranges: List[str]) -> List[List[List]]:
+        cached = self._load(sheet_name)["ranges"]
+        now = datetime.now(timezone.utc)
+
+        values = []
+        for a1_range in ranges:
+            entry = _cached_entry(cached, a1_range)
+            if entry is None:
+                raise SheetsCacheMiss(
+                    f"{sheet_name} {a1_range} is not cached, run once online first"
+                )
+            age = now - datetime.fromisoformat(entry["fetched_at"])
+            if age > self.max_age:
+                raise StaleSheetsCache(
+                    f"{sheet_name} {a1_range} was fetched {age} ago, more than "
+                    f"the allowed {self.max_age} (GNFL_SHEETS_MAX_AGE_HOURS)"
+                )
+            values.append(entry["values"])
+
+        self.hits += len(ranges)
+        return values
+
+    def get_values(
+        self,
+        sheet_name: str,
+        ranges: List[str],
+        open_sheet: Callable[[], Spreadsheet],
+    ) -> List[List[List]]:
+        """Values of several ranges of a spreadsheet, from disk when unchanged
+
+        Args:
+            sheet_name: Spreadsheet name, identifies the cache file
+            ranges: A1 ranges including the tab, e.g. "'Wk 5'!A1:P33"
+            open_sheet: Returns the opened spreadsheet (not called offline)
+
+        Returns:
+            Values (list of rows) of each range, in the order of `ranges`
+
+        Raises:
+            SheetsCacheMiss: Offline and a range was never cached
+            StaleSheetsCache: Offline and a range is older than `max_age`
+        """
+        if self.offline:
+            return self._read_offline(sheet_name, ranges)
+
+        gsheet = open_sheet()
+        revision = gsheet.get_lastUpdateTime()
+
+        with self._lock:
+            entry = self._load(sheet_name)
+            cached = entry["ranges"]
+            stale = [
+                a1_range
+                for a1_range in ranges
+                if (_cached_entry(cached, a1_range) or {}).get("revision") != revision
+            ]
+
+        if stale:
+            response = gsheet.values_batch_get(stale)
+            fetched_at = datetime.now(timezone.utc).isoformat()
+            with self._lock:
+                # Re-read, another thread may have cached other ranges meanwhile
+                entry = self._load(sheet_name)
+                for a1_range, value_range in zip(stale, response["valueRanges"]):
+                    tab, cells = _split_range(a1_range)
+                    entry["ranges"].setdefault(tab, {})[cells] = {
+                        "values": value_range.get("values", []),
+                        "revision": revision,
+                        "fetched_at": fetched_at,
+                    }
+                self._save(sheet_name, entry)
+            cached = entry["ranges"]
+
+        self.hits += len(ranges) - len(stale)
+        self.misses += len(stale)
+        return [_cached_entry(cached, a1_range)["values"] for a1_range in ranges]
+
+
+_default_cache: Optional[SheetsCache] = None
+
+
+def get_sheets_cache() -> SheetsCache:
+    """Shared cache configured from the environment"""
+    global _default_cache
+
+    if _default_cache is None:
+        _default_cache = SheetsCache()
+    return _default_cache
+
+
+def set_sheets_cache(cache: Optional[SheetsCache]):
+    """Replace the shared cache, e.g. `SheetsCache(offline=True)` in a notebook
+
+    Args:
+        cache: Cache to use, or None to configure from the environment again
+    """
+    global _default_cache
+
+    _default_cache = cache
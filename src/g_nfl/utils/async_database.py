@@ -0,0 +1,193 @@
+"""Async variants of the Supabase database handlers
+
+The sync handlers in `database.py` pay one round trip per query, one after the
+other. These classes issue the same read queries on an async client so that
+independent reads can be awaited together with `asyncio.gather`. Writes stay in
+the sync handlers since they are dependent (delete then insert) anyway.
+
+Streamlit scripts are synchronous, use `load_week_data` from there. It runs
+the queries with `run_async` on the shared event loop, where the async client
+and its connections are kept between loads. With the local SQLite backend
+(see `backend.py`) it reads through the sync handlers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from supabase import AsyncClient
+
+from .backend import get_backend_name
+from .singleflight import single_flight
+from .supabase_client import get_async_supabase, run_async
+
+
+class AsyncPicksDatabase:
+    """Async Supabase handler for reading NFL picks"""
+
+    def __init__(self, client: AsyncClient):
+        """Wrap an async Supabase client"""
+        self.client = client
+
+    async def get_picks(
+        self, season: int, week: int, picker: Optional[str] = None
+    ) -> List[Dict]:
+        """Retrieve picks from Supabase
+
+        Args:
+            season: NFL season year
+            week: Week number
+            picker: Optional picker name filter
+
+        Returns:
+            List of pick dictionaries
+        """
+        query = (
+            self.client.table("picks").select("*").eq("season", season).eq("week", week)
+        )
+
+        if picker:
+            query = query.eq("picker", picker)
+
+        query = query.order("created_at", desc=True)
+        result = await query.execute()
+
+        return result.data
+
+
+class AsyncMarketLinesDatabase:
+    """Async Supabase handler for reading market spread and total lines"""
+
+    def __init__(self, client: AsyncClient):
+        """Wrap an async Supabase client"""
+        self.client = client
+
+    async def get_market_lines(self, season: int, week: int) -> List[Dict]:
+        """Retrieve market lines from Supabase
+
+        Args:
+            season: NFL season year
+            week: Week number
+
+        Returns:
+            List of market line dictionaries
+        """
+        query = (
+            self.client.table("market_lines")
+            .select("*")
+            .eq("season", season)
+            .eq("week", week)
+        )
+
+        result = await query.execute()
+        return result.data
+
+    async def get_available_weeks(self, season: int) -> List[int]:
+        """Get all weeks that have market lines data for a given season
+
+        Args:
+            season: NFL season year
+
+        Returns:
+            List of week numbers that have market lines data, sorted ascending
+        """
+        query = self.client.table("market_lines").select("week").eq("season", season)
+
+        result = await query.execute()
+
+        if not result.data:
+            return []
+
+        return sorted(set(row["week"] for row in result.data if row["week"]))
+
+
+class AsyncPoolSpreadsDatabase:
+    """Async Supabase handler for reading pool/competition spread lines"""
+
+    def __init__(self, client: AsyncClient):
+        """Wrap an async Supabase client"""
+        self.client = client
+
+    async def get_pool_spreads(self, season: int, week: int) -> List[Dict]:
+        """Retrieve pool spreads from Supabase
+
+        Args:
+            season: NFL season year
+            week: Week number
+
+        Returns:
+            List of pool spread dictionaries
+        """
+        query = (
+            self.client.table("pool_spreads")
+            .select("*")
+            .eq("season", season)
+            .eq("week", week)
+        )
+
+        result = await query.execute()
+        return result.data
+
+
+async def fetch_week_data(
+    season: int, week: int, picker: Optional[str] = None
+) -> Dict[str, List[Dict]]:
+    """Fetch market lines, pool spreads and picks for a week concurrently
+
+    Run it with `run_async`, the async client lives on the shared loop.
+
+    Args:
+        season: NFL season year
+        week: Week number
+        picker: Optional picker name. Picks are only fetched when given.
+
+    Returns:
+        Dictionary with 'market_lines', 'pool_spreads' and 'picks' row lists
+    """
+    client = await get_async_supabase()
+
+    queries = [
+        AsyncMarketLinesDatabase(client).get_market_lines(season, week),
+        AsyncPoolSpreadsDatabase(client).get_pool_spreads(season, week),
+    ]
+    if picker:
+        queries.append(AsyncPicksDatabase(client).get_picks(season, week, picker))
+
+    results = await asyncio.gather(*queries)
+
+    return {
+        "market_lines": results[0],
+        "pool_spreads": results[1],
+        "picks": results[2] if picker else [],
+    }
+
+
+@single_flight
+def load_week_data(
+    season: int, week: int, picker: Optional[str] = None
+) -> Dict[str, List[Dict]]:
+    """Sync facade over `fetch_week_data` for Streamlit pages
+
+    Concurrent loads of the same week and picker share one set of queries.
+
+    Args:
+        season: NFL season year
+        week: Week number
+        picker: Optional picker name. Picks are only fetched when given.
+
+    Returns:
+        Dictionary with 'market_lines', 'pool_spreads' and 'picks' row lists
+    """
+    if get_backend_name() != "supabase":
+        # Local queries have no network latency to overlap
+        from .database import MarketLinesDatabase, PicksDatabase, PoolSpreadsDatabase
+
+        return {
+            "market_lines": MarketLinesDatabase().get_market_lines(season, week),
+            "pool_spreads": PoolSpreadsDatabase().get_pool_spreads(season, week),
+            "picks": PicksDatabase().get_picks(season, week, picker) if picker else [],
+        }
+
+    return run_async(fetch_week_data(season, week, picker))
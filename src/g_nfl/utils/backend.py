@@ -0,0 +1,86 @@
+"""Storage backend selection for the database handlers
+
+The handlers in `database.py` get their client from `get_database_client`.
+The backend is chosen with the GNFL_DB_BACKEND environment variable:
+
+- ``supabase`` (default): the hosted Supabase project, see `supabase_client.py`
+- ``sqlite``: a local file at GNFL_SQLITE_PATH (default ``gnfl.sqlite``),
+  see `sqlite_client.py`. Use ``:memory:`` for throwaway databases.
+
+Notebooks and tests can also switch with `configure_backend`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from supabase.client import Client
+
+    from .sqlite_client import SQLiteClient
+
+BACKENDS = ("supabase", "sqlite")
+
+_backend: Optional[str] = None
+_sqlite_path: Optional[str] = None
+_sqlite_client: Optional[SQLiteClient] = None
+_lock = threading.Lock()
+
+
+def get_backend_name() -> str:
+    """Name of the configured backend, 'supabase' or 'sqlite'"""
+    backend = (_backend or os.getenv("GNFL_DB_BACKEND", "supabase")).lower()
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown database backend '{backend}'. "
+            f"Set GNFL_DB_BACKEND to one of: {', '.join(BACKENDS)}"
+        )
+    return backend
+
+
+def configure_backend(backend: str, sqlite_path: Optional[str] = None):
+    """Select the backend in code instead of through environment variables
+
+    Args:
+        backend: 'supabase' or 'sqlite'
+        sqlite_path: SQLite database file, defaults to GNFL_SQLITE_PATH
+    """
+    global _backend, _sqlite_path, _sqlite_client
+
+    if backend.lower() not in BACKENDS:
+        raise ValueError(
+            f"Unknown database backend '{backend}', use one of: {', '.join(BACKENDS)}"
+        )
+
+    with _lock:
+        _backend = backend.lower()
+        _sqlite_path = sqlite_path
+        if _sqlite_client is not None:
+            _sqlite_client.close()
+        _sqlite_client = None
+
+
+def get_sqlite_client() -> SQLiteClient:
+    """Get or create the shared local SQLite client"""
+    global _sqlite_client
+
+    if _sqlite_client is None:
+        with _lock:
+            if _sqlite_client is None:
+                from .sqlite_client import SQLiteClient
+
+                path = _sqlite_path or os.getenv("GNFL_SQLITE_PATH", "gnfl.sqlite")
+                _sqlite_client = SQLiteClient(path)
+    return _sqlite_client
+
+
+def get_database_client() -> Union[Client, SQLiteClient]:
+    """Get the client of the configured backend"""
+    if get_backend_name() == "sqlite":
+        return get_sqlite_client()
+
+    from .supabase_client import get_supabase
+
+    return get_supabase()
@@ -1,15 +1,69 @@
-from gspread.auth import service_account
-from gspread.client import Client
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Optional
 
 from g_nfl.utils.paths import PROJECT_DIR
 
+if TYPE_CHECKING:
+    from gspread.client import Client
+
+_service_account: Optional[Client] = None
+_lock = threading.Lock()
+
 
 def load_service_account() -> Client:
     """Load the google service account from the json file
 
+    Requests go through `RateLimitedHTTPClient`, which throttles them to the
+    Sheets quota and retries rate limited ones.
+
     Returns
     -------
     Client
         google service account client
     """
-    return service_account(filename=PROJECT_DIR / "google_config.json")
+    from gspread.auth import service_account
+
+    from g_nfl.utils.sheets_rate_limit import RateLimitedHTTPClient
+
+    return service_account(
+        filename=PROJECT_DIR / "google_config.json",
+        http_client=RateLimitedHTTPClient,
+    )
+
+
+def get_service_account() -> Client:
+    """Get the shared google service account client, loading it on first use
+
+    Nothing is read from google_config.json until a sheet is actually opened,
+    so modules using the client can be imported without credentials.
+
+    Returns
+    -------
+    Client
+        google service account client, or the stand-in set with
+        `set_service_account`
+    """
+    global _service_account
+
+    if _service_account is None:
+        with _lock:
+            if _service_account is None:
+                _service_account = load_service_account()
+    return _service_account
+
+
+def set_service_account(client: Optional[Client]):
+    """Replace the shared client, e.g. with a stand-in for offline use
+
+    Parameters
+    ----------
+    client : Client, optional
+        any object with the gspread Client interface used here (`open`), or
+        None to load the real service account again on next use
+    """
+    global _service_account
+
+    with _lock:
+        _service_account = client
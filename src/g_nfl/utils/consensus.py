@@ -0,0 +1,155 @@
+"""Pick consensus for the View Picks page
+
+All picks of a week are pivoted once into a team x picker matrix of pick
+points, so consensus points, best-bet counts and net scores for every game are
+column sums and lookups instead of a scan over all picks per game and picker.
+
+The same per-team consensus is also stored in the weekly_consensus table
+(see consensus_schema.sql); `team_consensus_from_rows` reads it back.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Points per pick type, any other pick type is worth one point
+PICK_POINTS = {"best_bet": 2}
+
+# Pickers that are shown but left out of the consensus
+EXCLUDED_PICKERS = ("TEAM",)
+
+
+def build_pick_matrix(
+    picks: List[Dict], pickers: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
+    """Pivot pick rows into a team x picker matrix of pick points
+
+    A picker with several picks on the same team (e.g. regular and MNF) counts
+    once, with the points of the best one.
+
+    Args:
+        picks: Rows from the picks table
+        pickers: Columns to return, in order. Defaults to the sorted pickers
+            in `picks`.
+
+    Returns:
+        DataFrame indexed by team with one int column per picker:
+        0 = no pick, 1 = regular pick, 2 = best bet
+    """
+    if picks:
+        rows = pd.DataFrame(
+            {
+                "team": [pick["team_picked"] for pick in picks],
+                "picker": [pick["picker"] for pick in picks],
+                "points": [PICK_POINTS.get(pick.get("pick_type"), 1) for pick in picks],
+            }
+        )
+        matrix = rows.pivot_table(
+            index="team", columns="picker", values="points", aggfunc="max"
+        )
+    else:
+        matrix = pd.DataFrame()
+
+    if pickers is not None:
+        matrix = matrix.reindex(columns=list(pickers))
+
+    matrix = matrix.fillna(0).astype(int)
+    matrix.index.name = "team"
+    matrix.columns.name = "picker"
+    return matrix
+
+
+def pick_symbols(
+    matrix: pd.DataFrame, regular: str = "✅", best_bet: str = "⭐", empty: str = "—"
+) -> pd.DataFrame:
+    """Replace the points in a pick matrix with display symbols"""
+    points = matrix.to_numpy()
+    symbols = np.select(
+        [points >= PICK_POINTS["best_bet"], points > 0], [best_bet, regular], empty
+    )
+    return pd.DataFrame(symbols, index=matrix.index, columns=matrix.columns)
+
+
+def team_consensus(
+    matrix: pd.DataFrame, exclude: Iterable[str] = EXCLUDED_PICKERS
+) -> pd.DataFrame:
+    """Consensus points and best-bet counts per team
+
+    Args:
+        matrix: Pick matrix from `build_pick_matrix`
+        exclude: Pickers left out of the consensus
+
+    Returns:
+        DataFrame indexed by team with 'points' and 'best_bets' columns
+    """
+    consensus = matrix.drop(columns=list(exclude), errors="ignore")
+    return pd.DataFrame(
+        {
+            "points": consensus.sum(axis=1),
+            "best_bets": (consensus >= PICK_POINTS["best_bet"]).sum(axis=1),
+        },
+        index=matrix.index,
+    )
+
+
+def team_consensus_from_rows(rows: List[Dict]) -> pd.DataFrame:
+    """Per-team consensus from weekly_consensus table rows
+
+    Args:
+        rows: Rows from `PicksDatabase.get_weekly_consensus`
+
+    Returns:
+        DataFrame indexed by team with 'points' and 'best_bets' columns, see
+        `team_consensus`
+    """
+    teams = pd.DataFrame(
+        {
+            "points": [int(row.get("points") or 0) for row in rows],
+            "best_bets": [int(row.get("best_bets") or 0) for row in rows],
+        },
+        index=pd.Index([row["team"] for row in rows], name="team"),
+    )
+    # A team plays once a week, but sum in case of duplicate game ids
+    return teams.groupby(level="team").sum()
+
+
+def game_consensus(games_df: pd.DataFrame, teams: pd.DataFrame) -> pd.DataFrame:
+    """Consensus side of every game
+
+    Args:
+        games_df: Games with away_team and home_team columns
+        teams: Per-team consensus from `team_consensus` or
+            `team_consensus_from_rows`
+
+    Returns:
+        Copy of `games_df` with away/home points and best bets, 'net_score'
+        (absolute points difference), 'consensus_team' ('EVEN' on a tie),
+        'consensus_points', 'consensus_best_bets' and 'is_consensus_home'
+        (None on a tie), sorted by net_score descending
+    """
+    games = games_df.copy()
+    for side in ["away", "home"]:
+        side_teams = teams.reindex(games[f"{side}_team"]).fillna(0).astype(int)
+        games[f"{side}_points"] = side_teams["points"].to_numpy()
+        games[f"{side}_best_bets"] = side_teams["best_bets"].to_numpy()
+
+    # Positive = home consensus, negative = away consensus
+    net = (games["home_points"] - games["away_points"]).to_numpy()
+    home, away = net > 0, net < 0
+
+    games["net_score"] = np.abs(net)
+    games["consensus_team"] = np.select(
+        [home, away], [games["home_team"], games["away_team"]], "EVEN"
+    )
+    games["consensus_points"] = np.select(
+        [home, away], [games["home_points"], games["away_points"]], 0
+    )
+    games["consensus_best_bets"] = np.select(
+        [home, away], [games["home_best_bets"], games["away_best_bets"]], 0
+    )
+    games["is_consensus_home"] = pd.Series(home, index=games.index, dtype=object)
+    games.loc[net == 0, "is_consensus_home"] = None
+
+    # Stable sort keeps the schedule order between equal consensus
+    return games.sort_values("net_score", ascending=False, kind="stable")
@@ -2,21 +2,74 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 if TYPE_CHECKING:
     from supabase.client import Client
 
-from .supabase_client import get_supabase
+from .backend import get_database_client
+from .instrumentation import instrumented
+from .singleflight import invalidates_reads, single_flight_method
+from .supabase_client import execute_read
+
+
+def _line_value(value) -> Optional[float]:
+    """Normalize a spread/total for comparison, matching the DECIMAL(4,1) column"""
+    if value is None or value != value:  # None or NaN
+        return None
+    return round(float(value), 1)
+
+
+def _unpadded_game_id(game_id: str) -> str:
+    """Game ID with the week not zero-padded, the format of older rows
+
+    Converts formats like '2025_01_KC_LAC' to '2025_1_KC_LAC'
+    """
+    parts = game_id.split("_")
+    if len(parts) >= 4 and parts[1].isdigit():
+        parts[1] = str(int(parts[1]))
+    return "_".join(parts)
+
+
+# PostgREST caps a single response at this many rows by default
+MAX_ROWS_PER_REQUEST = 1000
+
+
+def read_all_rows(
+    build_query: Callable, page_size: int = MAX_ROWS_PER_REQUEST
+) -> List[Dict]:
+    """Read every row of a query a page at a time
+
+    Query builders are mutated by `.range()`, so `build_query` is called to get
+    a fresh builder for each page. It should order by a unique column (e.g. id)
+    so pages don't overlap.
+
+    Args:
+        build_query: Function returning a new (unexecuted) select query
+        page_size: Rows per request
+
+    Returns:
+        List of all row dictionaries
+    """
+    rows = []
+    start = 0
+    while True:
+        page = execute_read(build_query().range(start, start + page_size - 1)).data
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        start += page_size
 
 
 class PicksDatabase:
     """Supabase database handler for storing NFL picks"""
 
     def __init__(self):
-        """Initialize Supabase client"""
-        self.client: Client = get_supabase()
+        """Initialize the database client of the configured backend"""
+        self.client: Client = get_database_client()
 
+    @invalidates_reads
+    @instrumented
     def save_picks(
         self,
         season: int,
@@ -37,71 +90,54 @@ class PicksDatabase:
         Returns:
             Number of picks saved
         """
-        try:
-            # If replace is True, delete existing picks for this picker/season/week
-            if replace:
-                print(
-                    f"DEBUG: Deleting existing picks for season={season}, week={week}, picker={picker}"
-                )
-                delete_result = (
-                    self.client.table("picks")
-                    .delete()
-                    .eq("season", season)
-                    .eq("week", week)
-                    .eq("picker", picker)
-                    .execute()
-                )
-                print(f"DEBUG: Delete result: {delete_result}")
-
-            # Prepare picks data for insertion
-            picks_data = []
-            for pick_key, pick_data in picks.items():
-                # Handle special pick keys vs regular game_id keys
-                if pick_key.startswith(("survivor_", "underdog_", "mnf_")):
-                    # Special picks: extract game_id from after the prefix
-                    prefix, game_id = pick_key.split("_", 1)
-                else:
-                    # Regular picks: key is the game_id
-                    game_id = pick_key
-
-                pick_record = {
-                    "season": season,
-                    "week": week,
-                    "game_id": game_id,
-                    "team_picked": (
-                        pick_data.get("team_picked", pick_data)
-                        if isinstance(pick_data, dict)
-                        else pick_data
-                    ),
-                    "spread": (
-                        pick_data.get("spread") if isinstance(pick_data, dict) else None
-                    ),
-                    "pick_type": (
-                        pick_data.get("pick_type", "regular")
-                        if isinstance(pick_data, dict)
-                        else "regular"
-                    ),
-                    "picker": picker,
-                }
-                picks_data.append(pick_record)
-                print(f"DEBUG: Prepared pick record: {pick_record}")
-
-            print(f"DEBUG: Total picks to insert: {len(picks_data)}")
-
-            # Insert picks
-            print(f"DEBUG: Attempting to insert picks into 'picks' table")
-            result = self.client.table("picks").insert(picks_data).execute()
-            print(f"DEBUG: Insert result: {result}")
+        # If replace is True, delete existing picks for this picker/season/week
+        if replace:
+            self.client.table("picks").delete().eq("season", season).eq(
+                "week", week
+            ).eq("picker", picker).execute()
+
+        # Prepare picks data for insertion
+        picks_data = []
+        for pick_key, pick_data in picks.items():
+            # Handle special pick keys vs regular game_id keys
+            if pick_key.startswith(("survivor_", "underdog_", "mnf_")):
+                # Special picks: extract game_id from after the prefix
+                prefix, game_id = pick_key.split("_", 1)
+            else:
+                # Regular picks: key is the game_id
+                game_id = pick_key
+
+            pick_record = {
+                "season": season,
+                "week": week,
+                "game_id": game_id,
+                "team_picked": (
+                    pick_data.get("team_picked", pick_data)
+                    if isinstance(pick_data, dict)
+                    else pick_data
+                ),
+                "spread": (
+                    pick_data.get("spread") if isinstance(pick_data, dict) else None
+                ),
+                "pick_type": (
+                    pick_data.get("pick_type", "regular")
+                    if isinstance(pick_data, dict)
+                    else "regular"
+                ),
+                "picker": picker,
+            }
+            picks_data.append(pick_record)
 
-            return len(picks_data)
+        # Insert picks
+        self.client.table("picks").insert(picks_data).execute()
 
-        except Exception as e:
-            print(f"DEBUG: Exception in PicksDatabase.save_picks: {e}")
-            import traceback
+        # Rebuild the precomputed consensus of the saved week
+        self.refresh_weekly_consensus(season, week)
 
-            print(f"DEBUG: Traceback in save_picks: {traceback.format_exc()}")
-            raise  # Re-raise the exception so it can be caught by the calling function
+        return len(picks_data)
 
+    @single_flight_method
+    @instrumented
     def get_picks(
         self, season: int, week: int, picker: Optional[str] = None
     ) -> List[Dict]:
@@ -123,10 +159,82 @@ class PicksDatabase:
             query = query.eq("picker", picker)
 
         query = query.order("created_at", desc=True)
-        result = query.execute()
+        result = execute_read(query)
 
         return result.data
 
+    @invalidates_reads
+    @instrumented
+    def refresh_weekly_consensus(self, season: int, week: int) -> Optional[int]:
+        """Recompute the weekly_consensus rows of a week from its picks
+
+        Runs the refresh_weekly_consensus function from consensus_schema.sql.
+        Failures are printed, not raised, so saving picks never depends on it.
+
+        Args:
+            season: NFL season year
+            week: Week number
+
+        Returns:
+            Number of consensus rows written, or None if the refresh failed
+        """
+        try:
+            result = self.client.rpc(
+                "refresh_weekly_consensus", {"p_season": season, "p_week": week}
+            ).execute()
+            return result.data
+        except Exception as e:
+            print(f"Error refreshing weekly consensus: {e}")
+            return None
+
+    @single_flight_method
+    @instrumented
+    def get_weekly_consensus(self, season: int, week: int) -> List[Dict]:
+        """Retrieve the precomputed consensus of a week
+
+        Args:
+            season: NFL season year
+            week: Week number
+
+        Returns:
+            List of {'game_id', 'team', 'points', 'best_bets', 'pickers', ...}
+            dictionaries, one per picked team
+        """
+        query = (
+            self.client.table("weekly_consensus")
+            .select("*")
+            .eq("season", season)
+            .eq("week", week)
+        )
+
+        result = execute_read(query)
+        return result.data
+
+    @single_flight_method
+    @instrumented
+    def get_season_picks(
+        self, season: int, weeks: Optional[List[int]] = None
+    ) -> List[Dict]:
+        """Retrieve all pickers' picks for many weeks of a season
+
+        Args:
+            season: NFL season year
+            weeks: Optional list of weeks to filter to
+
+        Returns:
+            List of pick dictionaries
+        """
+
+        def build_query():
+            query = self.client.table("picks").select("*").eq("season", season)
+            if weeks:
+                query = query.in_("week", weeks)
+            return query.order("id")
+
+        return read_all_rows(build_query)
+
+    @single_flight_method
+    @instrumented
     def get_all_picks(self, limit: Optional[int] = None) -> List[Dict]:
         """Get all picks with optional limit
 
@@ -141,9 +249,11 @@ class PicksDatabase:
         if limit:
             query = query.limit(limit)
 
-        result = query.execute()
+        result = execute_read(query)
         return result.data
 
+    @invalidates_reads
+    @instrumented
     def delete_picks(self, season: int, week: int, picker: str) -> int:
         """Delete picks for a specific season/week/picker
 
@@ -163,8 +273,14 @@ class PicksDatabase:
             .eq("picker", picker)
             .execute()
         )
+
+        # Drop the deleted picks from the precomputed consensus of the week
+        self.refresh_weekly_consensus(season, week)
+
         return len(result.data) if result.data else 0
 
+    @single_flight_method
+    @instrumented
     def get_database_stats(self) -> Dict:
         """Get database statistics
 
@@ -172,8 +288,8 @@ class PicksDatabase:
             Dictionary with database stats
         """
         # Get all picks to calculate stats
-        all_picks_result = (
-            self.client.table("picks").select("season, week, picker").execute()
+        all_picks_result = execute_read(
+            self.client.table("picks").select("season, week, picker")
         )
         all_picks = all_picks_result.data
 
@@ -207,9 +323,11 @@ class MarketLinesDatabase:
     """Supabase database handler for storing market spread and total lines"""
 
     def __init__(self):
-        """Initialize Supabase client"""
-        self.client: Client = get_supabase()
+        """Initialize the database client of the configured backend"""
+        self.client: Client = get_database_client()
 
+    @invalidates_reads
+    @instrumented
     def save_market_lines(
         self,
         season: int,
@@ -254,6 +372,8 @@ class MarketLinesDatabase:
             return len(lines_data)
         return 0
 
+    @single_flight_method
+    @instrumented
     def get_market_lines(self, season: int, week: int) -> List[Dict]:
         """Retrieve market lines from Supabase
 
@@ -271,9 +391,98 @@ class MarketLinesDatabase:
             .eq("week", week)
         )
 
-        result = query.execute()
+        result = execute_read(query)
         return result.data
 
+    @single_flight_method
+    @instrumented
+    def get_season_market_lines(
+        self, season: int, weeks: Optional[List[int]] = None
+    ) -> List[Dict]:
+        """Retrieve market lines for many weeks of a season in one query
+
+        Args:
+            season: NFL season year
+            weeks: Optional list of weeks to filter to
+
+        Returns:
+            List of market line dictionaries
+        """
+        query = self.client.table("market_lines").select("*").eq("season", season)
+
+        if weeks:
+            query = query.in_("week", weeks)
+
+        result = execute_read(query)
+        return result.data
+
+    @invalidates_reads
+    @instrumented
+    def sync_market_lines(
+        self,
+        season: int,
+        lines: Dict[int, Dict[str, Dict[str, float]]],
+        dry_run: bool = False,
+    ) -> Dict[str, List]:
+        """Diff market lines against the database and upsert only the changes
+
+        All changed rows, across every week, are written in a single upsert.
+
+        Args:
+            season: NFL season year
+            lines: Dictionary mapping week to {game_id: {'spread': float, 'total': float}}
+            dry_run: If True, only report the diff without writing
+
+        Returns:
+            Dictionary with 'added' and 'changed' rows that were (or would be)
+            written, 'unchanged' (week, game_id) keys, and 'stale' keys that are
+            stored but no longer in the schedule (reported, not deleted)
+        """
+        stored = {
+            (row["week"], row["game_id"]): row
+            for row in self.get_season_market_lines(season, list(lines.keys()))
+        }
+
+        report = {"added": [], "changed": [], "unchanged": [], "stale": []}
+        for week, week_lines in lines.items():
+            for game_id, line_data in week_lines.items():
+                row = {
+                    "season": season,
+                    "week": week,
+                    "game_id": game_id,
+                    "spread": _line_value(line_data.get("spread")),
+                    "total": _line_value(line_data.get("total")),
+                }
+                current = stored.get((week, game_id))
+                if current is None:
+                    report["added"].append(row)
+                elif (
+                    _line_value(current.get("spread")) != row["spread"]
+                    or _line_value(current.get("total")) != row["total"]
+                ):
+                    report["changed"].append(row)
+                else:
+                    report["unchanged"].append((week, game_id))
+
+        incoming_keys = {
+            (week, game_id)
+            for week, week_lines in lines.items()
+            for game_id in week_lines
+        }
+        report["stale"] = sorted(set(stored) - incoming_keys)
+
+        rows = report["added"] + report["changed"]
+        if rows and not dry_run:
+            created_at = datetime.utcnow().isoformat()
+            self.client.table("market_lines").upsert(
+                [{**row, "created_at": created_at} for row in rows],
+                on_conflict="season,week,game_id",
+            ).execute()
+
+        return report
+
+    @single_flight_method
+    @instrumented
     def get_available_weeks(self, season: int) -> List[int]:
         """Get all weeks that have market lines data for a given season
 
@@ -285,7 +494,7 @@ class MarketLinesDatabase:
         """
         query = self.client.table("market_lines").select("week").eq("season", season)
 
-        result = query.execute()
+        result = execute_read(query)
 
         if not result.data:
             return []
@@ -294,6 +503,8 @@ class MarketLinesDatabase:
         weeks = list(set(row["week"] for row in result.data if row["week"]))
         return sorted(weeks)
 
+    @single_flight_method
+    @instrumented
     def get_max_week_for_season(self, season: int) -> Optional[int]:
         """Get the maximum week number that has market lines data for a given season
 
@@ -311,9 +522,11 @@ class PoolSpreadsDatabase:
     """Supabase database handler for storing pool/competition spread lines"""
 
     def __init__(self):
-        """Initialize Supabase client"""
-        self.client: Client = get_supabase()
+        """Initialize the database client of the configured backend"""
+        self.client: Client = get_database_client()
 
+    @invalidates_reads
+    @instrumented
     def save_pool_spreads(
         self,
         season: int,
@@ -362,6 +575,8 @@ class PoolSpreadsDatabase:
             return len(spreads_data)
         return 0
 
+    @single_flight_method
+    @instrumented
     def get_pool_spreads(self, season: int, week: int) -> List[Dict]:
         """Retrieve pool spreads from Supabase
 
@@ -379,9 +594,116 @@ class PoolSpreadsDatabase:
             .eq("week", week)
         )
 
-        result = query.execute()
+        result = execute_read(query)
         return result.data
 
+    @single_flight_method
+    @instrumented
+    def get_season_pool_spreads(
+        self, season: int, weeks: Optional[List[int]] = None
+    ) -> List[Dict]:
+        """Retrieve pool spreads for many weeks of a season
+
+        Args:
+            season: NFL season year
+            weeks: Optional list of weeks to filter to
+
+        Returns:
+            List of pool spread dictionaries
+        """
+
+        def build_query():
+            query = self.client.table("pool_spreads").select("*").eq("season", season)
+            if weeks:
+                query = query.in_("week", weeks)
+            return query.order("id")
+
+        return read_all_rows(build_query)
+
+    @invalidates_reads
+    @instrumented
+    def save_changed_pool_spreads(
+        self,
+        season: int,
+        week: int,
+        spreads: Dict[str, float],
+        current: Optional[Dict[str, Optional[float]]] = None,
+    ) -> Dict[str, Dict]:
+        """Save only the pool spreads that differ from the current state
+
+        Changed and new spreads are written in a single upsert, unchanged games
+        are not touched. Games without a spread (None) are skipped. Rows of the
+        written games stored under a non-zero-padded game_id are replaced.
+
+        Args:
+            season: NFL season year
+            week: Week number
+            spreads: Dictionary mapping game_id to spread value
+            current: Cached current spreads by game_id (None for games without
+                one). Fetched from the database if not provided.
+
+        Returns:
+            Dictionary mapping game_id to {'old': float, 'new': float,
+            'status': 'added' | 'changed' | 'unchanged'}
+        """
+        from g_nfl.utils.web_app import normalize_game_id
+
+        if current is None:
+            current = {
+                row["game_id"]: row.get("spread")
+                for row in self.get_pool_spreads(season, week)
+            }
+        current = {
+            normalize_game_id(game_id): spread for game_id, spread in current.items()
+        }
+
+        report = {}
+        rows = []
+        for game_id, spread in spreads.items():
+            normalized_id = normalize_game_id(game_id)
+            old = _line_value(current.get(normalized_id))
+            new = _line_value(spread)
+            if new is None:
+                # spread is NOT NULL, there is nothing to save for this game
+                continue
+
+            if old is None:
+                status = "added"
+            elif old != new:
+                status = "changed"
+            else:
+                status = "unchanged"
+            report[game_id] = {"old": old, "new": new, "status": status}
+
+            if status != "unchanged":
+                rows.append(
+                    {
+                        "season": season,
+                        "week": week,
+                        "game_id": normalized_id,
+                        "spread": new,
+                        "created_at": datetime.utcnow().isoformat(),
+                    }
+                )
+
+        if rows:
+            self.client.table("pool_spreads").upsert(
+                rows, on_conflict="season,week,game_id"
+            ).execute()
+
+            # Drop older rows of the same games the upsert didn't match
+            written_ids = {row["game_id"] for row in rows}
+            legacy_ids = {_unpadded_game_id(game_id) for game_id in written_ids}
+            legacy_ids -= written_ids
+            if legacy_ids:
+                self.client.table("pool_spreads").delete().eq("season", season).eq(
+                    "week", week
+                ).in_("game_id", sorted(legacy_ids)).execute()
+
+        return report
+
+    @invalidates_reads
+    @instrumented
     def update_pool_spread(
         self, season: int, week: int, game_id: str, spread: float
     ) -> bool:
@@ -397,34 +719,22 @@ class PoolSpreadsDatabase:
             True if successful
         """
         try:
-            # Try to update existing record
-            update_result = (
+            # Single round trip: insert, or update the existing row on conflict
+            result = (
                 self.client.table("pool_spreads")
-                .update({"spread": spread})
-                .eq("season", season)
-                .eq("week", week)
-                .eq("game_id", game_id)
+                .upsert(
+                    {
+                        "season": season,
+                        "week": week,
+                        "game_id": game_id,
+                        "spread": spread,
+                        "created_at": datetime.utcnow().isoformat(),
+                    },
+                    on_conflict="season,week,game_id",
+                )
                 .execute()
             )
-
-            # If no record was updated, insert a new one
-            if not update_result.data:
-                insert_result = (
-                    self.client.table("pool_spreads")
-                    .insert(
-                        {
-                            "season": season,
-                            "week": week,
-                            "game_id": game_id,
-                            "spread": spread,
-                            "created_at": datetime.utcnow().isoformat(),
-                        }
-                    )
-                    .execute()
-                )
-                return len(insert_result.data) > 0
-
-            return len(update_result.data) > 0
+            return len(result.data) > 0
         except Exception as e:
             print(f"Error updating pool spread: {e}")
             return False
@@ -0,0 +1,147 @@
+"""Concurrent file downloads with conditional requests
+
+Used to fetch the 32 team logos. Files are downloaded by a thread pool
+sharing one pooled `requests.Session`. The ETag and Last-Modified of every
+file are kept in a manifest next to the files, so the next run sends
+conditional requests and skips files the server reports as unchanged (304).
+
+Any HTTP server works as the source, e.g. ``python -m http.server`` over a
+directory of logos for tests or a CI cache.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+MANIFEST_NAME = ".download_manifest.json"
+
+
+def create_session(pool_size: int = 8) -> requests.Session:
+    """Session with a connection pool per host and retries of server errors
+
+    Args:
+        pool_size: Connections kept per host, match the number of workers
+
+    Returns:
+        requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _load_manifest(dest: Path) -> Dict[str, Dict]:
+    file = dest / MANIFEST_NAME
+    if not file.exists():
+        return {}
+    with open(file) as f:
+        return json.load(f)
+
+
+def _save_manifest(dest: Path, manifest: Dict[str, Dict]):
+    # Write next to the target and swap, so readers never see a partial file
+    tmp_file = dest / f"{MANIFEST_NAME}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, dest / MANIFEST_NAME)
+
+
+def _download(
+    session: requests.Session,
+    url: str,
+    file: Path,
+    cached: Optional[Dict],
+    timeout: float,
+) -> Dict:
+    """Download one file unless unchanged, returning its status and validators"""
+    headers = {}
+    # Only revalidate files that are still on disk and came from the same url
+    if cached and file.exists() and cached.get("url") == url:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = session.get(url, headers=headers, timeout=timeout)
+    except requests.RequestException as e:
+        return {"status": "failed", "error": str(e)}
+
+    if response.status_code == 304:
+        return {"status": "unchanged", **cached}
+    if response.status_code != 200:
+        return {"status": "failed", "error": f"HTTP {response.status_code}"}
+
+    tmp_file = file.with_name(file.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(response.content)
+    os.replace(tmp_file, file)
+
+    return {
+        "status": "downloaded",
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+
+def download_files(
+    files: Dict[str, str],
+    dest: Union[str, Path],
+    max_workers: int = 8,
+    session: Optional[requests.Session] = None,
+    timeout: float = 30,
+) -> Dict[str, List[str]]:
+    """Download files concurrently, skipping the ones that did not change
+
+    Args:
+        files: Dictionary mapping file name (in `dest`) to url
+        dest: Directory to save the files to, created if needed
+        max_workers: Concurrent downloads
+        session: Session to use, defaults to a new pooled session
+        timeout: Seconds to wait for each response
+
+    Returns:
+        Dictionary with the 'downloaded', 'unchanged' and 'failed' file names
+    """
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(dest)
+    own_session = session is None
+    session = session or create_session(max_workers)
+
+    def fetch(name: str) -> Dict:
+        return _download(session, files[name], dest / name, manifest.get(name), timeout)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(zip(files, executor.map(fetch, files)))
+    finally:
+        if own_session:
+            session.close()
+
+    report = {"downloaded": [], "unchanged": [], "failed": []}
+    for name, result in results.items():
+        status = result.pop("status")
+        report[status].append(name)
+        if status == "failed":
+            print(f"Failed to download {files[name]}: {result['error']}")
+        else:
+            manifest[name] = result
+
+    _save_manifest(dest, manifest)
+    return report
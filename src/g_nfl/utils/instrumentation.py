@@ -0,0 +1,226 @@
+"""Latency, row count and payload size instrumentation for database calls
+
+Every instrumented method records, per "Class.method":
+
+- calls and errors
+- the latest latencies (a bounded sample, for p50/p95)
+- rows returned
+- payload bytes (JSON size of the rows read or written), only when enabled
+  with GNFL_QUERY_PAYLOAD=1, as serializing every result is not free
+
+Calls slower than the slow-query threshold are printed and kept in a short
+log. Settings come from the environment:
+
+- GNFL_QUERY_STATS=0 turns recording off
+- GNFL_QUERY_PAYLOAD=1 also measures payload sizes (for debugging)
+- GNFL_SLOW_QUERY_MS sets the slow-query threshold (default 500)
+
+`query_stats()` returns a summary frame, shown on the Diagnostics page.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Latencies kept per method for the percentiles
+MAX_SAMPLES = 1000
+
+# Slow queries kept for the log
+MAX_SLOW_QUERIES = 100
+
+enabled: bool = os.getenv("GNFL_QUERY_STATS", "1") != "0"
+measure_payload: bool = os.getenv("GNFL_QUERY_PAYLOAD", "0") == "1"
+slow_query_ms: float = float(os.getenv("GNFL_SLOW_QUERY_MS", "500"))
+
+
+class MethodStats:
+    """Running statistics of one instrumented method"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.payload_bytes = 0
+        self.latencies_ms: Deque[float] = deque(maxlen=MAX_SAMPLES)
+
+
+_stats: Dict[str, MethodStats] = {}
+_slow_queries: Deque[Dict] = deque(maxlen=MAX_SLOW_QUERIES)
+_lock = threading.Lock()
+
+
+def _payload(args: tuple, kwargs: dict, result: Any) -> Any:
+    """Rows that went over the wire: the result of reads, the data of writes"""
+    if isinstance(result, (list, dict)):
+        return result
+    # Writes return counts, measure the rows that were sent instead
+    payloads = [v for v in (*args, *kwargs.values()) if isinstance(v, (list, dict))]
+    return max(payloads, key=len) if payloads else None
+
+
+def _row_count(result: Any) -> int:
+    """Rows read (list results) or written (writes return their count)"""
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, int) and not isinstance(result, bool):
+        return result
+    return 0
+
+
+def _payload_size(payload: Any) -> int:
+    if payload is None:
+        return 0
+    return len(json.dumps(payload, default=str).encode())
+
+
+def record(
+    name: str,
+    latency_ms: float,
+    rows: int = 0,
+    payload_bytes: int = 0,
+    error: bool = False,
+    detail: str = "",
+):
+    """Record one call, printing it if it was slow
+
+    Args:
+        name: Method name, e.g. 'PicksDatabase.get_picks'
+        latency_ms: Call duration in milliseconds
+        rows: Rows returned or written
+        payload_bytes: Size of the rows as JSON, 0 if not measured
+        error: Whether the call raised
+        detail: Short description of the arguments for the slow-query log
+    """
+    with _lock:
+        stats = _stats.setdefault(name, MethodStats())
+        stats.calls += 1
+        stats.errors += int(error)
+        stats.rows += rows
+        stats.payload_bytes += payload_bytes
+        stats.latencies_ms.append(latency_ms)
+
+        slow = latency_ms >= slow_query_ms
+        if slow:
+            _slow_queries.append(
+                {
+                    "time": datetime.now(),
+                    "method": name,
+                    "latency_ms": latency_ms,
+                    "rows": rows,
+                    "payload_bytes": payload_bytes,
+                    "detail": detail,
+                }
+            )
+
+    if slow:
+        print(
+            f"SLOW QUERY: {name}({detail}) took {latency_ms:.0f} ms, "
+            f"{rows} rows, {payload_bytes} bytes"
+        )
+
+
+def instrumented(fn: Callable) -> Callable:
+    """Record latency, rows and payload size of a database handler method"""
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if not enabled:
+            return fn(self, *args, **kwargs)
+
+        name = f"{type(self).__name__}.{fn.__name__}"
+        start = time.perf_counter()
+        try:
+            result = fn(self, *args, **kwargs)
+        except Exception:
+            record(
+                name,
+                (time.perf_counter() - start) * 1000,
+                error=True,
+                detail=_describe(args, kwargs),
+            )
+            raise
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        record(
+            name,
+            latency_ms,
+            rows=_row_count(result),
+            payload_bytes=(
+                _payload_size(_payload(args, kwargs, result)) if measure_payload else 0
+            ),
+            detail=_describe(args, kwargs),
+        )
+        return result
+
+    return wrapper
+
+
+def _describe(args: tuple, kwargs: dict) -> str:
+    """Scalar arguments of a call, skipping row payloads"""
+    parts = [repr(v) for v in args if not isinstance(v, (list, dict))]
+    parts += [
+        f"{k}={v!r}" for k, v in kwargs.items() if not isinstance(v, (list, dict))
+    ]
+    return ", ".join(parts)
+
+
+def query_stats() -> pd.DataFrame:
+    """Summary of every instrumented method
+
+    Returns:
+        DataFrame indexed by method with calls, errors, p50_ms, p95_ms,
+        max_ms, avg_rows and payload_kb (0 unless `measure_payload`) columns,
+        slowest p95 first
+    """
+    with _lock:
+        snapshot = {
+            name: (
+                stats.calls,
+                stats.errors,
+                stats.rows,
+                stats.payload_bytes,
+                np.array(stats.latencies_ms),
+            )
+            for name, stats in _stats.items()
+        }
+
+    rows = []
+    for name, (calls, errors, n_rows, n_bytes, latencies) in snapshot.items():
+        p50, p95 = np.percentile(latencies, [50, 95]) if len(latencies) else (0, 0)
+        rows.append(
+            {
+                "method": name,
+                "calls": calls,
+                "errors": errors,
+                "p50_ms": p50,
+                "p95_ms": p95,
+                "max_ms": latencies.max() if len(latencies) else 0,
+                "avg_rows": n_rows / calls if calls else 0,
+                "payload_kb": n_bytes / 1024,
+            }
+        )
+
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows).set_index("method").sort_values("p95_ms", ascending=False)
+
+
+def slow_queries() -> List[Dict]:
+    """Most recent slow calls, newest first"""
+    with _lock:
+        return list(reversed(_slow_queries))
+
+
+def reset_stats():
+    """Clear all recorded statistics and the slow-query log"""
+    with _lock:
+        _stats.clear()
+        _slow_queries.clear()
@@ -1,13 +1,16 @@
-import os
-import urllib.request
+from __future__ import annotations
 
-import nfl_data_py as nfl
-import numpy as np
-from matplotlib.offsetbox import OffsetImage
-from PIL import Image
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 
+from g_nfl.utils.downloads import download_files
 from g_nfl.utils.paths import LOGO_PATH
-from g_nfl.utils.teams import nfl_teams
+from g_nfl.utils.teams import logo_url, nfl_teams
+
+if TYPE_CHECKING:
+    import numpy as np
+    from matplotlib.offsetbox import OffsetImage
 
 espn_logo_url = "https://a.espncdn.com/i/teamlogos/nfl/500/{team}.png"
 
@@ -17,24 +20,104 @@ def get_logo_url(team: str, size: int = 25):
     return f'<img src="{espn_logo_url.format(team=team)}" style="width:auto;height:{size}px;">'
 
 
-def fetch_logos():
+def fetch_logos(refresh: bool = False, base_url: Optional[str] = None):
+    """Download every team logo to LOGO_PATH as <team>.tif
+
+    Args:
+        refresh: Re-check existing logos (unchanged ones are not downloaded
+            again) instead of skipping when the logo directory exists
+        base_url: Logo server, defaults to GNFL_LOGO_BASE_URL or ESPN's CDN
+    """
     # if the path to the logos directory does not exist, create it
-    if not os.path.exists(LOGO_PATH):
+    if refresh or not os.path.exists(LOGO_PATH):
         print("fetching team logos...")
-        os.makedirs(LOGO_PATH, exist_ok=True)
-        logos = nfl.import_team_desc()[["team_abbr", "team_logo_espn"]]
+        files = {f"{team}.tif": logo_url(team, base_url) for team in nfl_teams}
+        report = download_files(files, LOGO_PATH)
+        if report["downloaded"]:
+            clear_logo_cache()
+        print(
+            f"successfully retrieved logos ({len(report['downloaded'])} new, "
+            f"{len(report['unchanged'])} unchanged, {len(report['failed'])} failed)"
+        )
+
+
+@lru_cache(maxsize=None)
+def _logo_array(team: str, size: Tuple[int, int]) -> np.ndarray:
+    """Decoded and resized logo, read from disk once per (team, size)"""
+    # numpy and PIL are only needed for plots, not to import this module
+    import numpy as np
+    from PIL import Image
 
-        # get the logos for each team and store them to tif files in the logo path directory "<team>.tif"
-        for _, team, logo_url in logos.itertuples():
-            urllib.request.urlretrieve(logo_url, LOGO_PATH / f"{team}.tif")
-        print("successfully retrieved logos")
+    # Open the image with PIL and resize it
+    with Image.open(str(LOGO_PATH / f"{team}.tif")) as image:
+        image = image.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+    array = np.asarray(image)
+    # Shared by every chart, so it must not be modified in place
+    array.setflags(write=False)
+    return array
+
+
+def get_logo_array(team: str, size: Tuple[int, int] = (50, 50)) -> np.ndarray:
+    """RGBA pixels of a team logo, cached for the life of the process
+
+    Args:
+        team: Team abbreviation
+        size: (width, height) in pixels
+
+    Returns:
+        Read-only array of shape (height, width, 4)
+    """
+    return _logo_array(team.upper(), tuple(size))
 
 
 def get_team_logo(
     team: str, size: tuple[int, int] = (50, 50), alpha: float = 1.0
 ) -> OffsetImage:
-    team = team.upper()
-    # Open the image with PIL and resize it
-    image = Image.open(str(LOGO_PATH / f"{team}.tif"))
-    image = image.resize(size, Image.Resampling.LANCZOS)
-    return OffsetImage(np.asarray(image), alpha=alpha, zoom=1.0)
+    # matplotlib is only needed for plots, not to import this module
+    from matplotlib.offsetbox import OffsetImage
+
+    # An artist belongs to a single figure, so only the decoded pixels are
+    # cached. Alpha is applied when drawing, not to the pixels.
+    return OffsetImage(get_logo_array(team, size), alpha=alpha, zoom=1.0)
+
+
+def preload_team_logos(
+    sizes: Iterable[Tuple[int, int]] = ((50, 50),),
+    teams: Optional[Iterable[str]] = None,
+):
+    """Decode logos ahead of time, e.g. before rendering a batch of charts
+
+    Args:
+        sizes: Logo sizes to prepare
+        teams: Teams to prepare, defaults to every team with a logo file
+    """
+    teams = sorted(nfl_teams) if teams is None else list(teams)
+    for size in sizes:
+        for team in teams:
+            if (LOGO_PATH / f"{team.upper()}.tif").exists():
+                get_logo_array(team, size)
+
+
+def logo_atlas(
+    size: Tuple[int, int] = (50, 50), teams: Optional[Iterable[str]] = None
+) -> Tuple[np.ndarray, Dict[str, int]]:
+    """All logos of one size stacked in a single array (a sprite sheet)
+
+    Args:
+        size: (width, height) of each logo
+        teams: Teams to include, defaults to every team
+
+    Returns:
+        Tuple of an array of shape (teams, height, width, 4) and the position
+        of each team in it
+    """
+    import numpy as np
+
+    teams = sorted(nfl_teams) if teams is None else [team.upper() for team in teams]
+    atlas = np.stack([get_logo_array(team, size) for team in teams])
+    return atlas, {team: i for i, team in enumerate(teams)}
+
+
+def clear_logo_cache():
+    """Forget decoded logos, e.g. after fetching new logo files"""
+    _logo_array.cache_clear()
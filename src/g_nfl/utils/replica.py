@@ -0,0 +1,177 @@
+"""Local columnar replica of the Supabase tables for analytics
+
+Season analyses read `picks`, `market_lines` and `pool_spreads` from local
+Parquet files instead of paging through the REST API on every run.
+`sync_replica` pulls only the rows created or rewritten since the last sync,
+using the `created_at` column as a watermark (every write path in
+`database.py` stamps it), and merges them into the files.
+
+Deleted rows are handled per table:
+
+- picks are saved by replacing a picker's week, so new rows for a
+  (season, week, picker) replace every replica row of that key
+- market lines and pool spreads keep the latest row per
+  (season, week, game_id)
+
+Run `sync_replica(full=True)` to rebuild from scratch, e.g. after rows were
+deleted without a replacement.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+from .backend import get_database_client
+from .database import read_all_rows
+
+# Replicated tables and the columns identifying one logical row
+REPLICA_TABLES = {
+    "picks": ["season", "week", "picker"],
+    "market_lines": ["season", "week", "game_id"],
+    "pool_spreads": ["season", "week", "game_id"],
+}
+
+WATERMARK_COLUMN = "created_at"
+
+DEFAULT_REPLICA_PATH = Path(os.getenv("GNFL_REPLICA_PATH", "data/replica"))
+
+
+def replica_file(table: str, path: Optional[Union[str, Path]] = None) -> Path:
+    """Parquet file of a replicated table"""
+    return Path(path or DEFAULT_REPLICA_PATH) / f"{table}.parquet"
+
+
+def load_replica(
+    table: str,
+    path: Optional[Union[str, Path]] = None,
+    seasons: Optional[Iterable[int]] = None,
+) -> pd.DataFrame:
+    """Read a replicated table
+
+    Args:
+        table: 'picks', 'market_lines' or 'pool_spreads'
+        path: Replica directory, defaults to GNFL_REPLICA_PATH or data/replica
+        seasons: Optional seasons to keep
+
+    Returns:
+        DataFrame of the table rows, empty if the table was never synced
+    """
+    file = replica_file(table, path)
+    if not file.exists():
+        return pd.DataFrame()
+
+    df = pd.read_parquet(file)
+    if seasons is not None:
+        df = df[df["season"].isin(list(seasons))]
+    return df.reset_index(drop=True)
+
+
+def _watermark(df: pd.DataFrame) -> Optional[str]:
+    """Latest created_at of the replica as an ISO timestamp"""
+    if df.empty or WATERMARK_COLUMN not in df:
+        return None
+    latest = pd.to_datetime(df[WATERMARK_COLUMN], utc=True, format="ISO8601").max()
+    return None if pd.isna(latest) else latest.isoformat()
+
+
+def _fetch_rows(client, table: str, since: Optional[str]) -> List[Dict]:
+    """Read all rows created at or after `since` (all rows if None)"""
+
+    def build_query():
+        query = client.table(table).select("*")
+        if since is not None:
+            # gte, not gt: rows written in the same instant as the watermark
+            # may have arrived after the last sync. Duplicates are dropped.
+            query = query.gte(WATERMARK_COLUMN, since)
+        return query.order("id")
+
+    return read_all_rows(build_query)
+
+
+def _merge(table: str, existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Merge newly fetched rows into the replica rows of a table"""
+    if existing.empty:
+        merged = new
+    elif new.empty:
+        return existing
+    else:
+        keys = REPLICA_TABLES[table]
+        if table == "picks":
+            # A save replaces the picker's whole week: drop the old rows of
+            # every (season, week, picker) that has new rows
+            replaced = existing.set_index(keys).index.isin(
+                new.set_index(keys).index
+            ) & ~existing["id"].isin(new["id"])
+            existing = existing[~replaced]
+        merged = pd.concat([existing, new], ignore_index=True)
+
+    merged = merged.drop_duplicates(subset="id", keep="last")
+    if table != "picks":
+        # Delete-and-insert writes leave the old row under a different id
+        merged = merged.sort_values("id").drop_duplicates(
+            subset=REPLICA_TABLES[table], keep="last"
+        )
+    return merged.sort_values("id").reset_index(drop=True)
+
+
+def sync_table(
+    table: str,
+    path: Optional[Union[str, Path]] = None,
+    full: bool = False,
+    client=None,
+) -> Dict:
+    """Incrementally sync one table into its Parquet file
+
+    Args:
+        table: 'picks', 'market_lines' or 'pool_spreads'
+        path: Replica directory, defaults to GNFL_REPLICA_PATH or data/replica
+        full: Re-read the whole table instead of only new rows
+        client: Database client, defaults to the configured backend
+
+    Returns:
+        Dictionary with 'fetched' (rows read), 'rows' (rows in the replica)
+        and 'watermark' (latest created_at after the sync)
+    """
+    if table not in REPLICA_TABLES:
+        raise ValueError(
+            f"Unknown table '{table}', use one of: {', '.join(REPLICA_TABLES)}"
+        )
+
+    client = client or get_database_client()
+    existing = pd.DataFrame() if full else load_replica(table, path)
+
+    new = pd.DataFrame(_fetch_rows(client, table, _watermark(existing)))
+    merged = _merge(table, existing, new)
+
+    file = replica_file(table, path)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    # Write next to the target and swap, so readers never see a partial file
+    tmp_file = file.with_suffix(".parquet.tmp")
+    merged.to_parquet(tmp_file, index=False)
+    os.replace(tmp_file, file)
+
+    return {"fetched": len(new), "rows": len(merged), "watermark": _watermark(merged)}
+
+
+def sync_replica(
+    tables: Optional[Iterable[str]] = None,
+    path: Optional[Union[str, Path]] = None,
+    full: bool = False,
+) -> Dict[str, Dict]:
+    """Sync several tables, see `sync_table`
+
+    Args:
+        tables: Tables to sync, defaults to all of `REPLICA_TABLES`
+        path: Replica directory, defaults to GNFL_REPLICA_PATH or data/replica
+        full: Re-read the whole tables instead of only new rows
+
+    Returns:
+        Dictionary mapping table name to its sync report
+    """
+    client = get_database_client()
+    return {
+        table: sync_table(table, path, full=full, client=client)
+        for table in (tables or REPLICA_TABLES)
+    }
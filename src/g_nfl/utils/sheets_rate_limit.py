@@ -0,0 +1,193 @@
+"""Rate limiting and 429 backoff for all Google Sheets and Drive requests
+
+The Sheets API allows a fixed number of requests per minute per user, so a
+backfill across many weeks and pickers used to fail midway with 429 errors.
+`RateLimitedHTTPClient` is the gspread HTTP client of the shared service
+account (see `connections.py`): every request first takes a token from one
+process-wide token bucket, and quota or server errors are retried with
+exponential backoff, honouring Retry-After. Timeouts and server errors are
+only retried for reads, as a failed write may already have been applied.
+
+Combined with batched reads and writes (values batchGet, batch_update), a
+backfill runs at the highest rate the quota sustains. Settings come from the
+environment:
+
+- GNFL_SHEETS_REQUESTS_PER_MINUTE: sustained rate (default 60, the per-user
+  Sheets quota)
+- GNFL_SHEETS_BURST: requests allowed back to back (default 10)
+- GNFL_SHEETS_MAX_RETRIES: retries of a rate limited request (default 6)
+"""
+
+import os
+import random
+import threading
+import time
+from http import HTTPStatus
+from typing import Any, Dict, Optional
+
+from gspread.exceptions import APIError
+from gspread.http_client import HTTPClient
+from requests import Response
+
+MAX_BACKOFF_SECONDS = 64
+
+
+class TokenBucket:
+    """Thread-safe token bucket
+
+    Args:
+        rate_per_minute: Tokens added per minute (sustained request rate)
+        burst: Bucket size, the number of requests allowed back to back
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+_bucket = TokenBucket(
+    float(os.getenv("GNFL_SHEETS_REQUESTS_PER_MINUTE", "60")),
+    int(os.getenv("GNFL_SHEETS_BURST", "10")),
+)
+_max_retries = int(os.getenv("GNFL_SHEETS_MAX_RETRIES", "6"))
+
+_stats = {
+    "requests": 0,
+    "retries": 0,
+    "rate_limited": 0,
+    "failures": 0,
+    "throttled_seconds": 0.0,
+    "backoff_seconds": 0.0,
+}
+_stats_lock = threading.Lock()
+
+
+def configure_sheets_rate_limit(
+    requests_per_minute: Optional[float] = None,
+    burst: Optional[int] = None,
+    max_retries: Optional[int] = None,
+):
+    """Change the limits in code instead of through environment variables
+
+    Args:
+        requests_per_minute: Sustained request rate
+        burst: Requests allowed back to back
+        max_retries: Retries of a rate limited request
+    """
+    global _bucket, _max_retries
+
+    if requests_per_minute is not None or burst is not None:
+        _bucket = TokenBucket(
+            requests_per_minute or _bucket.rate * 60, burst or _bucket.burst
+        )
+    if max_retries is not None:
+        _max_retries = max_retries
+
+
+def _count(**increments):
+    with _stats_lock:
+        for key, value in increments.items():
+            _stats[key] += value
+
+
+def _should_retry(method: str, err: APIError) -> bool:
+    """Quota errors are retried, timeouts and server errors only for reads
+
+    A write that timed out or failed with a 5xx may already have been applied
+    (e.g. the addSheet of a pick tab), so retrying it could fail or apply it
+    twice. Quota errors are rejected before anything is applied.
+    """
+    code = err.code
+    if code == HTTPStatus.TOO_MANY_REQUESTS:
+        return True
+    if method.upper() == "GET" and (
+        code == HTTPStatus.REQUEST_TIMEOUT or code >= HTTPStatus.INTERNAL_SERVER_ERROR
+    ):
+        return True
+    # The Drive API reports quota errors as 403 usageLimits
+    errors = err.error.get("errors") if isinstance(err.error, dict) else None
+    return (
+        code == HTTPStatus.FORBIDDEN
+        and bool(errors)
+        and errors[0].get("domain") == "usageLimits"
+    )
+
+
+def _backoff(err: APIError, attempt: int) -> float:
+    """Seconds to wait before retry `attempt`: Retry-After, else exponential"""
+    retry_after = err.response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    # Jitter keeps concurrent threads from retrying in lockstep
+    return min(2**attempt, MAX_BACKOFF_SECONDS) + random.uniform(0, 1)
+
+
+class RateLimitedHTTPClient(HTTPClient):
+    """gspread HTTP client sharing one token bucket and retrying on quota errors
+
+    Pass it as ``service_account(..., http_client=RateLimitedHTTPClient)``.
+    """
+
+    def request(self, method: str, *args: Any, **kwargs: Any) -> Response:
+        attempt = 0
+        while True:
+            waited = _bucket.acquire()
+            _count(requests=1, throttled_seconds=waited)
+            try:
+                return super().request(method, *args, **kwargs)
+            except APIError as err:
+                if err.code == HTTPStatus.TOO_MANY_REQUESTS:
+                    _count(rate_limited=1)
+                if not _should_retry(method, err) or attempt >= _max_retries:
+                    _count(failures=1)
+                    raise err
+
+                attempt += 1
+                wait = _backoff(err, attempt)
+                _count(retries=1, backoff_seconds=wait)
+                print(
+                    f"WARNING: Google API error {err.code}, retry {attempt}/{_max_retries} in {wait:.1f}s"
+                )
+                time.sleep(wait)
+
+
+def sheets_request_stats() -> Dict[str, Any]:
+    """Counters of the Google requests made by this process
+
+    Returns:
+        Dictionary with requests (attempts sent), retries, rate_limited (429
+        responses), failures (errors raised), throttled_seconds (waiting for
+        the token bucket), backoff_seconds and requests_per_minute (the
+        configured rate)
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["requests_per_minute"] = _bucket.rate * 60
+    return stats
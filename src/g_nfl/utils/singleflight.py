@@ -0,0 +1,165 @@
+"""Single-flight coalescing of identical concurrent reads
+
+Streamlit runs every session in its own thread. On game day many sessions
+load the same (season, week) at once and would each send identical queries.
+With single flight, the first caller of a read runs it and every identical
+call that arrives while it is in flight waits for and shares its result, so
+the database sees one request per distinct read instead of one per session.
+
+Nothing is cached: once the read finishes the next call queries again. This
+complements TTL caches, which can still stampede when an entry expires.
+Writes made through this process start a new generation, so a read issued
+after a write never joins one that started before it.
+"""
+
+import copy
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """An in-flight call and its outcome"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time, sharing its result
+
+    Attributes:
+        calls: Number of calls that ran
+        shared: Number of calls that reused an in-flight result
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run `fn`, or wait for the in-flight call with the same key
+
+        Args:
+            key: Identifies identical calls
+            fn: Function to run if no identical call is in flight
+
+        Returns:
+            The result of `fn`. Waiting callers get a deep copy, so mutating a
+            shared result never affects another caller.
+
+        Raises:
+            The exception raised by `fn`, in the running and waiting callers
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        # No caller can join once the key is removed. With waiters, the
+        # original stays untouched while they copy it.
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+
+# Shared by all coalesced reads
+_reads = SingleFlight()
+
+# Bumped after every write, part of every read key
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable version of a call argument (lists become tuples, etc.)"""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        frozen = tuple(_freeze(v) for v in value)
+        return frozenset(frozen) if isinstance(value, (set, frozenset)) else frozen
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def single_flight(fn: Callable) -> Callable:
+    """Coalesce concurrent calls of a function with equal arguments"""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (
+            _generation,
+            fn.__module__,
+            fn.__qualname__,
+            _freeze(args),
+            _freeze(kwargs),
+        )
+        return _reads.do(key, lambda: fn(*args, **kwargs))
+
+    return wrapper
+
+
+def single_flight_method(fn: Callable) -> Callable:
+    """Coalesce concurrent calls of a database handler read method
+
+    Handlers are created per call site, so calls are identical when they use
+    the same client and arguments, whichever handler instance they go through.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            _generation,
+            fn.__module__,
+            fn.__qualname__,
+            id(self.client),
+            _freeze(args),
+            _freeze(kwargs),
+        )
+        return _reads.do(key, lambda: fn(self, *args, **kwargs))
+
+    return wrapper
+
+
+def invalidates_reads(fn: Callable) -> Callable:
+    """Mark a write: reads issued after it won't share earlier in-flight reads"""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        global _generation
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with _generation_lock:
+                _generation += 1
+
+    return wrapper
+
+
+def single_flight_stats() -> Dict[str, int]:
+    """Number of coalesced reads that ran and that shared an in-flight result"""
+    return {"calls": _reads.calls, "shared": _reads.shared}
@@ -0,0 +1,219 @@
+"""Precomputed per-week game slate for the Streamlit picks page
+
+The picks page used to re-derive spreads, the MNF game and opponents from the
+games DataFrame on every rerun. A `WeekSlate` is built once per (season, week)
+load and kept in session state, so reruns only do dictionary lookups.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SlateGame:
+    """A single game with its resolved lines
+
+    Spreads follow the database convention: they are the away team's spread,
+    so negative means the away team is favored.
+    """
+
+    game_id: str
+    away_team: str
+    home_team: str
+    spread_line: Optional[float]
+    total_line: Optional[float]
+    pool_spread: Optional[float]
+    market_spread: Optional[float]
+    market_total: Optional[float]
+    is_mnf: bool
+
+    @property
+    def effective_spread(self) -> Optional[float]:
+        """Pool spread if set, otherwise the market spread"""
+        return self.pool_spread if self.pool_spread is not None else self.market_spread
+
+    def opponent(self, team: str) -> str:
+        """Opponent of `team` in this game"""
+        return self.home_team if team == self.away_team else self.away_team
+
+    def location(self, team: str) -> str:
+        """'at' if `team` is the away team, otherwise 'vs'"""
+        return "at" if team == self.away_team else "vs"
+
+    def team_spread(self, team: str) -> Optional[float]:
+        """Market spread from the point of view of `team`"""
+        if self.spread_line is None:
+            return None
+        return -self.spread_line if team == self.home_team else self.spread_line
+
+    def pick_line(self, team: str) -> str:
+        """Format a pick as 'TEAM (SPREAD) at/vs OPPONENT'"""
+        spread = self.team_spread(team)
+        spread_text = f"({spread:+.1f})" if spread is not None else ""
+        return f"{team} {spread_text} {self.location(team)} {self.opponent(team)}"
+
+
+@dataclass(frozen=True)
+class WeekSlate:
+    """Immutable collection of a week's games with team and game_id lookups"""
+
+    season: int
+    week: int
+    games: Tuple[SlateGame, ...]
+    team_index: Mapping[str, int]
+    game_index: Mapping[str, int]
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def __iter__(self):
+        return iter(self.games)
+
+    def game(self, game_id: str) -> Optional[SlateGame]:
+        """Look up a game by game_id"""
+        i = self.game_index.get(game_id)
+        return self.games[i] if i is not None else None
+
+    def game_for_team(self, team: str) -> Optional[SlateGame]:
+        """Look up the game `team` plays in this week"""
+        i = self.team_index.get(team)
+        return self.games[i] if i is not None else None
+
+    @property
+    def mnf_game(self) -> Optional[SlateGame]:
+        """Monday night game (the last game of the week)"""
+        return self.games[-1] if self.games else None
+
+    def favorites(self, exclude: Iterable[str] = ()) -> List[Dict]:
+        """Favorite of every game with a spread, biggest favorite first
+
+        Args:
+            exclude: Teams to leave out (e.g. already used survivor teams)
+
+        Returns:
+            List of {'team', 'opponent', 'spread', 'game_id'} with the
+            favorite's (negative) spread
+        """
+        exclude = set(exclude)
+        favorites = []
+        for game in self.games:
+            spread = game.effective_spread
+            if spread is None:
+                continue
+            # Negative spread = away favorite, positive = home favorite
+            if spread < 0:
+                team, favorite_spread = game.away_team, spread
+            else:
+                team, favorite_spread = game.home_team, -spread
+            if team in exclude:
+                continue
+            favorites.append(
+                {
+                    "team": team,
+                    "opponent": game.opponent(team),
+                    "spread": favorite_spread,
+                    "game_id": game.game_id,
+                }
+            )
+        return sorted(favorites, key=lambda x: x["spread"])
+
+    def underdogs(self) -> List[Dict]:
+        """Underdog of every game with a spread, biggest underdog first
+
+        Returns:
+            List of {'team', 'opponent', 'spread', 'game_id'} with the
+            underdog's (positive) spread
+        """
+        underdogs = []
+        for game in self.games:
+            spread = game.effective_spread
+            if spread is None:
+                continue
+            # Negative spread = home underdog, positive = away underdog
+            if spread < 0:
+                team, underdog_spread = game.home_team, -spread
+            else:
+                team, underdog_spread = game.away_team, spread
+            underdogs.append(
+                {
+                    "team": team,
+                    "opponent": game.opponent(team),
+                    "spread": underdog_spread,
+                    "game_id": game.game_id,
+                }
+            )
+        return sorted(underdogs, key=lambda x: x["spread"], reverse=True)
+
+
+def _optional(value) -> Optional[float]:
+    """Convert NaN to None"""
+    return None if value is None or pd.isna(value) else value
+
+
+def build_week_slate(
+    season: int, week: int, games_df: pd.DataFrame, lines_data: Dict[str, Dict]
+) -> WeekSlate:
+    """Build the slate for a week
+
+    Args:
+        season: NFL season year
+        week: Week number
+        games_df: Games indexed by game_id with away_team, home_team,
+            spread_line and total_line columns, in kickoff order
+        lines_data: Dictionary mapping game_id to market/pool line data, the
+            `web_app.build_lines_frame` rows as a dict
+
+    Returns:
+        WeekSlate for the week
+    """
+    games = []
+    for i, (game_id, away_team, home_team, spread_line, total_line) in enumerate(
+        zip(
+            games_df.index,
+            games_df["away_team"],
+            games_df["home_team"],
+            games_df["spread_line"],
+            games_df["total_line"],
+        )
+    ):
+        lines = lines_data.get(game_id, {})
+        spread_line = _optional(spread_line)
+        total_line = _optional(total_line)
+
+        # Market lines fall back to the games data
+        market_spread = lines.get("market_spread")
+        if market_spread is None:
+            market_spread = spread_line
+        market_total = lines.get("market_total")
+        if market_total is None:
+            market_total = total_line
+
+        games.append(
+            SlateGame(
+                game_id=game_id,
+                away_team=away_team,
+                home_team=home_team,
+                spread_line=spread_line,
+                total_line=total_line,
+                pool_spread=lines.get("pool_spread"),
+                market_spread=market_spread,
+                market_total=market_total,
+                is_mnf=i == len(games_df) - 1,
+            )
+        )
+
+    team_index = {}
+    for i, game in enumerate(games):
+        team_index[game.away_team] = i
+        team_index[game.home_team] = i
+
+    return WeekSlate(
+        season=season,
+        week=week,
+        games=tuple(games),
+        team_index=MappingProxyType(team_index),
+        game_index=MappingProxyType({game.game_id: i for i, game in enumerate(games)}),
+    )
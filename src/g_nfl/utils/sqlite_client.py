@@ -0,0 +1,329 @@
+"""Embedded SQLite stand-in for the Supabase client
+
+Implements the subset of the Supabase/PostgREST query builder used by the
+database handlers in `database.py`:
+
+    client.table("picks").select("*").eq("season", 2025).order("id").execute()
+
+so the same handler code runs against a local file for development,
+notebooks, tests and local analytics. Select it with GNFL_DB_BACKEND=sqlite
+(see `backend.py`).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# Same tables as picks_schema.sql, update_picks_schema.sql,
+# scripts/database_schema.sql and consensus_schema.sql
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS picks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    picker TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    team_picked TEXT NOT NULL,
+    spread REAL,
+    pick_type TEXT DEFAULT 'regular'
+        CHECK (pick_type IN ('regular', 'best_bet', 'underdog', 'survivor', 'mnf')),
+    season INTEGER DEFAULT 2024,
+    week INTEGER,
+    created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    updated_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+CREATE INDEX IF NOT EXISTS idx_picks_picker_week ON picks(picker, season, week);
+CREATE INDEX IF NOT EXISTS idx_picks_game ON picks(game_id);
+
+CREATE TABLE IF NOT EXISTS market_lines (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    game_id TEXT NOT NULL,
+    spread REAL,
+    total REAL,
+    created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    UNIQUE(season, week, game_id)
+);
+CREATE INDEX IF NOT EXISTS idx_market_lines_season_week ON market_lines(season, week);
+
+CREATE TABLE IF NOT EXISTS pool_spreads (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    game_id TEXT NOT NULL,
+    spread REAL NOT NULL,
+    created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    UNIQUE(season, week, game_id)
+);
+CREATE INDEX IF NOT EXISTS idx_pool_spreads_season_week ON pool_spreads(season, week);
+
+CREATE TABLE IF NOT EXISTS weekly_consensus (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    game_id TEXT NOT NULL,
+    team TEXT NOT NULL,
+    points INTEGER NOT NULL DEFAULT 0,
+    best_bets INTEGER NOT NULL DEFAULT 0,
+    pickers INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    PRIMARY KEY (season, week, game_id, team)
+);
+"""
+
+# SQLite version of refresh_weekly_consensus in consensus_schema.sql
+REFRESH_WEEKLY_CONSENSUS = """
+INSERT INTO weekly_consensus (season, week, game_id, team, points, best_bets, pickers)
+SELECT :p_season, :p_week, game_id, team_picked,
+       SUM(points), SUM(points = 2), COUNT(*)
+FROM (
+    SELECT picker, game_id, team_picked,
+           MAX(CASE WHEN pick_type = 'best_bet' THEN 2 ELSE 1 END) AS points
+    FROM picks
+    WHERE season = :p_season
+      AND week = :p_week
+      AND picker <> 'TEAM'
+      AND COALESCE(pick_type, 'regular') NOT IN ('survivor', 'underdog')
+    GROUP BY picker, game_id, team_picked
+)
+GROUP BY game_id, team_picked
+"""
+
+
+@dataclass
+class SQLiteResponse:
+    """Query result with the same `data` attribute as a PostgREST response"""
+
+    data: Any
+    count: Optional[int] = None
+
+
+@dataclass
+class SQLiteQuery:
+    """Chainable query builder mirroring the PostgREST builder methods"""
+
+    client: SQLiteClient
+    table_name: str
+    operation: str = "select"
+    columns: str = "*"
+    values: List[Dict] = field(default_factory=list)
+    on_conflict: Optional[str] = None
+    filters: List[Tuple[str, str, Any]] = field(default_factory=list)
+    orders: List[Tuple[str, bool]] = field(default_factory=list)
+    limit_count: Optional[int] = None
+    offset_count: Optional[int] = None
+
+    # Operations
+
+    def select(self, columns: str = "*") -> SQLiteQuery:
+        self.operation = "select"
+        self.columns = columns
+        return self
+
+    def insert(self, rows: Union[Dict, List[Dict]]) -> SQLiteQuery:
+        self.operation = "insert"
+        self.values = [rows] if isinstance(rows, dict) else list(rows)
+        return self
+
+    def upsert(
+        self, rows: Union[Dict, List[Dict]], on_conflict: Optional[str] = None
+    ) -> SQLiteQuery:
+        self.operation = "upsert"
+        self.values = [rows] if isinstance(rows, dict) else list(rows)
+        self.on_conflict = on_conflict
+        return self
+
+    def update(self, values: Dict) -> SQLiteQuery:
+        self.operation = "update"
+        self.values = [values]
+        return self
+
+    def delete(self) -> SQLiteQuery:
+        self.operation = "delete"
+        return self
+
+    # Filters and modifiers
+
+    def _filter(self, column: str, operator: str, value: Any) -> SQLiteQuery:
+        self.filters.append((column, operator, value))
+        return self
+
+    def eq(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, "=", value)
+
+    def neq(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, "<>", value)
+
+    def gt(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, ">", value)
+
+    def gte(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, ">=", value)
+
+    def lt(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, "<", value)
+
+    def lte(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, "<=", value)
+
+    def in_(self, column: str, values: Sequence[Any]) -> SQLiteQuery:
+        return self._filter(column, "IN", list(values))
+
+    def order(self, column: str, desc: bool = False) -> SQLiteQuery:
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, size: int) -> SQLiteQuery:
+        self.limit_count = size
+        return self
+
+    def range(self, start: int, end: int) -> SQLiteQuery:
+        self.offset_count = start
+        self.limit_count = end - start + 1
+        return self
+
+    # SQL generation
+
+    def _where(self) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for column, operator, value in self.filters:
+            if operator == "IN":
+                if not value:
+                    clauses.append("0")
+                    continue
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                params.extend(value)
+            elif value is None:
+                clauses.append(f"{column} IS {'NOT ' if operator == '<>' else ''}NULL")
+            else:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def _select_sql(self) -> Tuple[str, List[Any]]:
+        columns = ", ".join(column.strip() for column in self.columns.split(","))
+        where, params = self._where()
+        sql = f"SELECT {columns} FROM {self.table_name}{where}"
+        if self.orders:
+            sql += " ORDER BY " + ", ".join(
+                f"{column} {'DESC' if desc else 'ASC'}" for column, desc in self.orders
+            )
+        if self.limit_count is not None or self.offset_count is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [
+                -1 if self.limit_count is None else self.limit_count,
+                self.offset_count or 0,
+            ]
+        return sql, params
+
+    def _write_sql(self) -> List[Tuple[str, List[Any]]]:
+        if self.operation == "delete":
+            where, params = self._where()
+            return [(f"DELETE FROM {self.table_name}{where} RETURNING *", params)]
+
+        if self.operation == "update":
+            values = self.values[0]
+            where, params = self._where()
+            assignments = ", ".join(f"{column} = ?" for column in values)
+            return [
+                (
+                    f"UPDATE {self.table_name} SET {assignments}{where} RETURNING *",
+                    list(values.values()) + params,
+                )
+            ]
+
+        statements = []
+        for row in self.values:
+            columns = list(row)
+            sql = (
+                f"INSERT INTO {self.table_name} ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})"
+            )
+            if self.operation == "upsert":
+                if self.on_conflict:
+                    conflict = [c.strip() for c in self.on_conflict.split(",")]
+                    updates = [c for c in columns if c not in conflict]
+                    sql += f" ON CONFLICT ({', '.join(conflict)}) DO " + (
+                        "UPDATE SET "
+                        + ", ".join(f"{c} = excluded.{c}" for c in updates)
+                        if updates
+                        else "NOTHING"
+                    )
+                else:
+                    sql = sql.replace("INSERT INTO", "INSERT OR REPLACE INTO", 1)
+            statements.append((sql + " RETURNING *", list(row.values())))
+        return statements
+
+    def execute(self) -> SQLiteResponse:
+        """Run the query and return its rows"""
+        if self.operation == "select":
+            return SQLiteResponse(self.client.fetch(*self._select_sql()))
+        return SQLiteResponse(self.client.write(self._write_sql()))
+
+
+class SQLiteClient:
+    """Local SQLite database with a Supabase-like `table`/`rpc` interface
+
+    One connection is shared by all Streamlit script threads and guarded by a
+    lock. Tables are created on first use.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Open (or create) the database at `path`"""
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock:
+            self._connection.executescript(SCHEMA)
+
+    def table(self, table_name: str) -> SQLiteQuery:
+        """Start a query on a table"""
+        return SQLiteQuery(self, table_name)
+
+    def fetch(self, sql: str, params: Sequence[Any] = ()) -> List[Dict]:
+        """Run a read query and return its rows as dictionaries"""
+        with self._lock:
+            return [dict(row) for row in self._connection.execute(sql, params)]
+
+    def write(self, statements: List[Tuple[str, Sequence[Any]]]) -> List[Dict]:
+        """Run write statements in one transaction and return the affected rows"""
+        with self._lock, self._connection:
+            rows = []
+            for sql, params in statements:
+                rows.extend(dict(row) for row in self._connection.execute(sql, params))
+            return rows
+
+    def rpc(self, function_name: str, params: Optional[Dict] = None) -> SQLiteRPC:
+        """Call a database function, see `SQLiteRPC`"""
+        return SQLiteRPC(self, function_name, params or {})
+
+    def close(self):
+        """Close the underlying connection"""
+        self._connection.close()
+
+
+@dataclass
+class SQLiteRPC:
+    """Python versions of the Postgres functions the handlers call over RPC"""
+
+    client: SQLiteClient
+    function_name: str
+    params: Dict
+
+    def execute(self) -> SQLiteResponse:
+        if self.function_name == "refresh_weekly_consensus":
+            return SQLiteResponse(self._refresh_weekly_consensus())
+        raise ValueError(
+            f"Unknown RPC function '{self.function_name}' for the SQLite backend"
+        )
+
+    def _refresh_weekly_consensus(self) -> int:
+        params = {key: self.params[key] for key in ["p_season", "p_week"]}
+        with self.client._lock, self.client._connection as connection:
+            connection.execute(
+                "DELETE FROM weekly_consensus WHERE season = :p_season AND week = :p_week",
+                params,
+            )
+            return connection.execute(REFRESH_WEEKLY_CONSENSUS, params).rowcount
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import TYPE_CHECKING, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Awaitable, Optional, TypeVar
 
-from supabase import create_client
+import httpx
+from supabase import AsyncClientOptions, ClientOptions, acreate_client, create_client
 
 if TYPE_CHECKING:
+    from supabase import AsyncClient
     from supabase.client import Client
 
+T = TypeVar("T")
+
 # Load environment variables from .env file (if available)
 try:
     from dotenv import load_dotenv
@@ -21,25 +28,120 @@ except ImportError:
 
 
 class SupabaseClient:
-    """Singleton Supabase client manager"""
+    """Singleton Supabase client manager
+
+    The client shares one keep-alive HTTP connection pool across every
+    database handler and Streamlit script thread, so TLS handshakes are only
+    paid when the pool grows. Pool size, timeout and read retries can be set
+    with `configure_http` or the SUPABASE_POOL_SIZE, SUPABASE_TIMEOUT and
+    SUPABASE_READ_RETRIES environment variables.
+
+    The async client is cached too, on one long-lived event loop running in a
+    daemon thread (see `run_async`), so async reads also reuse connections.
+    """
 
     _instance: Optional[Client] = None
+    _http_client: Optional[httpx.Client] = None
+    _async_instance: Optional[AsyncClient] = None
+    _async_lock: Optional[asyncio.Lock] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
     _url: Optional[str] = None
     _key: Optional[str] = None
+    _lock = threading.Lock()
+
+    # HTTP transport settings
+    pool_size: int = int(os.getenv("SUPABASE_POOL_SIZE", "10"))
+    timeout: float = float(os.getenv("SUPABASE_TIMEOUT", "10"))
+    keepalive_expiry: float = 60.0
+    read_retries: int = int(os.getenv("SUPABASE_READ_RETRIES", "2"))
+    retry_backoff: float = 0.25
+    # Seconds a replaced client stays open for requests still using it
+    retire_delay: float = 60.0
 
     @classmethod
     def get_client(cls) -> Client:
-        """Get or create Supabase client instance"""
+        """Get or create Supabase client instance (thread safe)"""
         if cls._instance is None:
-            cls._instance = cls._create_client()
+            with cls._lock:
+                # Another script thread may have created it while we waited
+                if cls._instance is None:
+                    cls._instance = cls._create_client()
         return cls._instance
 
     @classmethod
     def _create_client(cls) -> Client:
-        """Create new Supabase client"""
+        """Create new Supabase client on a pooled HTTP transport"""
         url = cls._get_url()
         key = cls._get_key()
-        return create_client(url, key)
+        cls._http_client = cls._create_http_client()
+        options = ClientOptions(
+            httpx_client=cls._http_client, postgrest_client_timeout=cls.timeout
+        )
+        return create_client(url, key, options=options)
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        """Event loop of the async client, started in a daemon thread on first use
+
+        Async clients are bound to the loop they were created on, so a single
+        loop that outlives every call keeps the async client and its
+        keep-alive connections across calls.
+        """
+        if cls._loop is None:
+            with cls._lock:
+                if cls._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever, name="supabase-async", daemon=True
+                    ).start()
+                    cls._loop = loop
+        return cls._loop
+
+    @classmethod
+    async def get_async_client(cls) -> AsyncClient:
+        """Get or create the async Supabase client, on the loop of `get_loop`"""
+        if asyncio.get_running_loop() is not cls._loop:
+            raise RuntimeError(
+                "The async Supabase client lives on SupabaseClient.get_loop(), "
+                "run coroutines using it with run_async"
+            )
+        # Only the loop thread gets here, so the lock needs no thread lock
+        if cls._async_lock is None:
+            cls._async_lock = asyncio.Lock()
+        async with cls._async_lock:
+            if cls._async_instance is None:
+                options = AsyncClientOptions(
+                    httpx_client=cls.create_async_http_client(),
+                    postgrest_client_timeout=cls.timeout,
+                )
+                cls._async_instance = await acreate_client(
+                    cls._get_url(), cls._get_key(), options=options
+                )
+        return cls._async_instance
+
+    @classmethod
+    def _http_limits(cls) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=cls.pool_size,
+            max_keepalive_connections=cls.pool_size,
+            keepalive_expiry=cls.keepalive_expiry,
+        )
+
+    @classmethod
+    def _create_http_client(cls) -> httpx.Client:
+        """Create the keep-alive HTTP client shared by all requests
+
+        Transport level retries only cover failed connection attempts, where
+        nothing has been sent yet, so they are safe for writes too.
+        """
+        transport = httpx.HTTPTransport(limits=cls._http_limits(), retries=1)
+        return httpx.Client(transport=transport, timeout=cls.timeout)
+
+    @classmethod
+    def create_async_http_client(cls) -> httpx.AsyncClient:
+        """Create an async HTTP client with the same pool and timeout settings"""
+        transport = httpx.AsyncHTTPTransport(limits=cls._http_limits(), retries=1)
+        return httpx.AsyncClient(transport=transport, timeout=cls.timeout)
 
     @classmethod
     def _get_url(cls) -> str:
@@ -89,17 +191,118 @@ class SupabaseClient:
         """Configure Supabase client with URL and key"""
         cls._url = url
         cls._key = key
-        cls._instance = None  # Reset instance to recreate with new config
+        cls._close()  # Reset instance to recreate with new config
+
+    @classmethod
+    def configure_http(
+        cls,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        read_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+    ):
+        """Configure the HTTP transport used by the Supabase client
+
+        Args:
+            pool_size: Maximum number of pooled keep-alive connections
+            timeout: Request timeout in seconds
+            read_retries: Retries for idempotent reads on network errors
+            retry_backoff: Base delay in seconds, doubled on every retry
+        """
+        if pool_size is not None:
+            cls.pool_size = pool_size
+        if timeout is not None:
+            cls.timeout = timeout
+        if read_retries is not None:
+            cls.read_retries = read_retries
+        if retry_backoff is not None:
+            cls.retry_backoff = retry_backoff
+        cls._close()  # Recreate the client on the new transport
 
     @classmethod
     def reset(cls):
         """Reset client instance (useful for testing)"""
-        cls._instance = None
+        cls._close()
         cls._url = None
         cls._key = None
 
+    @classmethod
+    def _close(cls):
+        # Other script threads may still be reading with the old clients, so
+        # they are swapped out here and only closed after `retire_delay`
+        with cls._lock:
+            http_client, cls._http_client = cls._http_client, None
+            cls._instance = None
+            async_client, cls._async_instance = cls._async_instance, None
+
+        if http_client is not None:
+            timer = threading.Timer(cls.retire_delay, http_client.close)
+            timer.daemon = True
+            timer.start()
+        if async_client is not None:
+            # Close on the client's own loop, once in-flight queries are done
+            cls._loop.call_soon_threadsafe(
+                cls._loop.call_later,
+                cls.retire_delay,
+                asyncio.ensure_future,
+                _aclose_async_client(async_client),
+            )
+
 
 # Convenience function for getting client
 def get_supabase() -> Client:
     """Get configured Supabase client"""
     return SupabaseClient.get_client()
+
+
+def execute_read(query):
+    """Execute an idempotent read query, retrying network errors with backoff
+
+    Only use this for SELECT queries: a retried write could be applied twice if
+    the first attempt reached the server.
+
+    Args:
+        query: Supabase query builder, e.g. `client.table("picks").select("*")`
+
+    Returns:
+        The query response
+    """
+    for attempt in range(SupabaseClient.read_retries + 1):
+        try:
+            return query.execute()
+        except httpx.TransportError:
+            if attempt == SupabaseClient.read_retries:
+                raise
+            time.sleep(SupabaseClient.retry_backoff * 2**attempt)
+
+
+async def get_async_supabase() -> AsyncClient:
+    """Get the configured async Supabase client
+
+    The client is bound to the shared event loop, so only await this in
+    coroutines run with `run_async`.
+    """
+    return await SupabaseClient.get_async_client()
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the shared Supabase event loop and wait for its result
+
+    Unlike `asyncio.run`, the loop and the async client's connections are kept
+    for the next call, so only the first call pays the TLS handshakes.
+
+    Args:
+        coro: Coroutine to run, e.g. `fetch_week_data(season, week)`
+
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, SupabaseClient.get_loop()).result()
+
+
+async def _aclose_async_client(client: AsyncClient):
+    """Close the postgrest session and HTTP connections of an async client"""
+    if client._postgrest is not None:
+        await client._postgrest.aclose()
+    if client.options.httpx_client is not None:
+        await client.options.httpx_client.aclose()
@@ -1,9 +1,17 @@
 import os
+from typing import Optional
 
-import requests
-
+from g_nfl.utils.downloads import download_files
 from g_nfl.utils.paths import LOGO_PATH
 
+# Where logos are downloaded from, set to a local server for tests or a CI cache
+LOGO_BASE_URL = os.getenv(
+    "GNFL_LOGO_BASE_URL", "https://a.espncdn.com/i/teamlogos/nfl/500/"
+)
+
+# ESPN logo file names that differ from our team abbreviations
+ESPN_LOGO_CODES = {"LA": "lar", "WAS": "wsh"}
+
 nfl_teams = {
     "ARI",
     "ATL",
@@ -63,23 +71,18 @@ def standardize_teams(team):
     return team
 
 
-def download_team_pngs():
-    # Base URL for the team logos and local directory
-    base_url = "https://a.espncdn.com/i/teamlogos/nfl/500/"
+def logo_url(team: str, base_url: Optional[str] = None) -> str:
+    """Url of a team's logo PNG, on ESPN's CDN unless another base url is given"""
+    team = team.upper()
+    return f"{base_url or LOGO_BASE_URL}{ESPN_LOGO_CODES.get(team, team.lower())}.png"
 
-    # Create the local directory if it doesn't exist
-    if not os.path.exists(LOGO_PATH):
-        os.makedirs(LOGO_PATH)
 
-    # Iterate through the list of teams, download logos, and save them locally
-    for team in nfl_teams:
-        team = team.lower()
-        url = f"{base_url}{team}.png"
-        response = requests.get(url)
-        if response.status_code == 200:
-            # Save the image to the local directory
-            with open(LOGO_PATH / f"{team}.png", "wb") as file:
-                file.write(response.content)
-        else:
-            print(f"Failed to download logo for {team}")
-    print(f"Logos downloaded to {LOGO_PATH}")
+def download_team_pngs(base_url: Optional[str] = None, max_workers: int = 8):
+    # Download every logo concurrently, unchanged files are skipped
+    files = {f"{team.lower()}.png": logo_url(team, base_url) for team in nfl_teams}
+    report = download_files(files, LOGO_PATH, max_workers=max_workers)
+    print(
+        f"Logos downloaded to {LOGO_PATH}: {len(report['downloaded'])} new, "
+        f"{len(report['unchanged'])} unchanged, {len(report['failed'])} failed"
+    )
+    return report
@@ -1,7 +1,15 @@
-from typing import Optional
+import copy
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
 
 from .database import MarketLinesDatabase, PicksDatabase, PoolSpreadsDatabase
 
+# Partitioned pick state per (season, week, picker), shared by all sessions
+_pick_state_cache: Dict[Tuple[int, int, str], Dict] = {}
+_pick_state_lock = threading.Lock()
+
 
 def get_team_logo(team_name):
     """Get team logo URL from ESPN CDN"""
@@ -29,12 +37,6 @@ def save_picks_data(season: int, week: int, picks: dict, picker: str) -> Optiona
         return None
 
     try:
-        print(
-            f"DEBUG: Attempting to save picks - season: {season}, week: {week}, picker: {picker}"
-        )
-        print(f"DEBUG: Number of picks to save: {len(picks)}")
-        print(f"DEBUG: Picks data: {picks}")
-
         # Transform picks data to use actual game_id as key for database save
         transformed_picks = {}
         for unique_key, pick_data in picks.items():
@@ -68,23 +70,15 @@ def save_picks_data(season: int, week: int, picks: dict, picker: str) -> Optiona
                 ),
             }
 
-        print(f"DEBUG: Transformed picks for database: {transformed_picks}")
-
         db = PicksDatabase()
-        print(f"DEBUG: PicksDatabase created successfully")
-
         picks_saved = db.save_picks(season, week, transformed_picks, picker)
-        print(f"DEBUG: save_picks returned: {picks_saved}")
+
+        invalidate_pick_state(season, week, picker)
 
         return f"Successfully saved {picks_saved} picks to database"
     except Exception as e:
-        error_msg = f"Error saving picks to database: {e}"
         error_type = type(e).__name__
-        print(f"DEBUG: {error_msg}")
-        print(f"DEBUG: Error type: {error_type}")
-        import traceback
-
-        print(f"DEBUG: Traceback: {traceback.format_exc()}")
+        print(f"Error saving picks to database: {error_type}: {e}")
 
         # Return error message so it can be displayed in Streamlit
         return f"ERROR: {error_type}: {str(e)}"
@@ -109,6 +103,97 @@ def get_picks_data(season: int, week: int, picker: Optional[str] = None):
         return []
 
 
+def partition_picks(picks_list: List[Dict]) -> Dict:
+    """Split pick rows into regular picks and the special picks
+
+    Args:
+        picks_list: Rows from the picks table
+
+    Returns:
+        Dictionary with 'picks' (game_id to {'team_picked', 'pick_type',
+        'spread'} for regular/best_bet picks) and 'survivor_pick',
+        'underdog_pick' and 'mnf_pick' team names (or None)
+    """
+    state = {
+        "picks": {},
+        "survivor_pick": None,
+        "underdog_pick": None,
+        "mnf_pick": None,
+    }
+
+    for pick in picks_list:
+        pick_type = pick.get("pick_type", "regular")
+        team_picked = pick["team_picked"]
+
+        if pick_type in ["regular", "best_bet"]:
+            state["picks"][pick["game_id"]] = {
+                "team_picked": team_picked,
+                "pick_type": pick_type,
+                "spread": pick.get("spread"),
+            }
+        elif pick_type in ["survivor", "underdog", "mnf"]:
+            state[f"{pick_type}_pick"] = team_picked
+
+    return state
+
+
+def count_picks(state: Dict) -> int:
+    """Total number of picks in a partitioned pick state"""
+    return len(state["picks"]) + sum(
+        1 for key in ["survivor_pick", "underdog_pick", "mnf_pick"] if state.get(key)
+    )
+
+
+def load_pick_state(
+    season: int, week: int, picker: str, picks_list: Optional[List[Dict]] = None
+) -> Dict:
+    """Load the partitioned picks of a picker, cached per (season, week, picker)
+
+    The cache is shared across sessions and invalidated by `save_picks_data`,
+    so switching between pickers only queries the database once per picker.
+
+    Args:
+        season: NFL season year
+        week: Week number
+        picker: Picker name
+        picks_list: Pick rows that were already fetched (e.g. alongside the
+            week's lines). They replace the cached entry instead of querying.
+
+    Returns:
+        Copy of the partitioned pick state, see `partition_picks`
+    """
+    key = (season, week, picker)
+
+    if picks_list is None:
+        with _pick_state_lock:
+            state = _pick_state_cache.get(key)
+        if state is None:
+            try:
+                picks_list = PicksDatabase().get_picks(season, week, picker)
+            except Exception as e:
+                print(f"Error loading existing picks: {e}")
+                # Don't cache failures so the next load retries
+                return partition_picks([])
+
+    if picks_list is not None:
+        state = partition_picks(picks_list)
+        with _pick_state_lock:
+            _pick_state_cache[key] = state
+
+    # Callers keep the picks dict in session state and mutate it
+    return copy.deepcopy(state)
+
+
+def invalidate_pick_state(season: int, week: int, picker: Optional[str] = None):
+    """Drop cached pick state for a season/week, for one or all pickers"""
+    with _pick_state_lock:
+        if picker is not None:
+            _pick_state_cache.pop((season, week, picker), None)
+        else:
+            for key in [k for k in _pick_state_cache if k[:2] == (season, week)]:
+                del _pick_state_cache[key]
+
+
 def load_existing_picks(season: int, week: int, picker: str) -> dict:
     """Load existing picks for a specific picker/season/week as a dictionary
 
@@ -120,30 +205,8 @@ def load_existing_picks(season: int, week: int, picker: str) -> dict:
     Returns:
         Dictionary mapping game_id to pick data {'team_picked': str, 'pick_type': str, 'spread': float}
     """
-    try:
-        db = PicksDatabase()
-        picks_list = db.get_picks(season, week, picker)
-
-        # Convert to dictionary format expected by streamlit session state
-        # Keep original format - only regular/best_bet picks go in picks dict
-        # Special picks (survivor, underdog, mnf) will be handled separately in main.py
-        picks_dict = {}
-        for pick in picks_list:
-            game_id = pick["game_id"]
-            pick_type = pick.get("pick_type", "regular")
-
-            # Only store regular/best_bet picks in the main picks dict
-            if pick_type in ["regular", "best_bet"]:
-                picks_dict[game_id] = {
-                    "team_picked": pick["team_picked"],
-                    "pick_type": pick_type,
-                    "spread": pick.get("spread"),
-                }
-
-        return picks_dict
-    except Exception as e:
-        print(f"Error loading existing picks: {e}")
-        return {}
+    # Only regular/best_bet picks, special picks are in the rest of the state
+    return load_pick_state(season, week, picker)["picks"]
 
 
 def get_database_stats():
@@ -248,41 +311,39 @@ def normalize_game_id(game_id: str) -> str:
     return game_id
 
 
-def get_all_lines_data(season: int, week: int) -> dict:
-    """Get combined market lines and pool spreads for a season/week
+def build_lines_frame(
+    market_lines: List[Dict], pool_spreads: List[Dict]
+) -> pd.DataFrame:
+    """Combine raw market line and pool spread rows into one frame
 
     Args:
-        season: NFL season year
-        week: Week number
+        market_lines: Rows from the market_lines table
+        pool_spreads: Rows from the pool_spreads table
 
     Returns:
-        Dictionary with combined line data
+        DataFrame indexed by normalized game_id with market_spread, market_total
+        and pool_spread columns. Missing values are None rather than NaN so the
+        rows can be used directly with `is None` checks.
     """
-    market_lines = get_market_lines(season, week)
-    pool_spreads = get_pool_spreads(season, week)
-
-    # Normalize all game IDs to use consistent format
-    normalized_market_lines = {}
-    for game_id, data in market_lines.items():
-        normalized_id = normalize_game_id(game_id)
-        normalized_market_lines[normalized_id] = data
-
-    normalized_pool_spreads = {}
-    for game_id, spread in pool_spreads.items():
-        normalized_id = normalize_game_id(game_id)
-        normalized_pool_spreads[normalized_id] = spread
-
-    # Combine data using normalized game IDs
-    combined = {}
-    all_game_ids = set(normalized_market_lines.keys()) | set(
-        normalized_pool_spreads.keys()
+    market = pd.DataFrame(
+        {
+            "market_spread": [line.get("spread") for line in market_lines],
+            "market_total": [line.get("total") for line in market_lines],
+        },
+        index=[normalize_game_id(line["game_id"]) for line in market_lines],
+        dtype=object,
+    )
+    pool = pd.DataFrame(
+        {"pool_spread": [spread.get("spread") for spread in pool_spreads]},
+        index=[normalize_game_id(spread["game_id"]) for spread in pool_spreads],
+        dtype=object,
     )
 
-    for game_id in all_game_ids:
-        combined[game_id] = {
-            "market_spread": normalized_market_lines.get(game_id, {}).get("spread"),
-            "market_total": normalized_market_lines.get(game_id, {}).get("total"),
-            "pool_spread": normalized_pool_spreads.get(game_id),
-        }
+    # Same game stored with and without a zero-padded week: keep the last row
+    market = market[~market.index.duplicated(keep="last")]
+    pool = pool[~pool.index.duplicated(keep="last")]
 
-    return combined
+    # Outer join keeps games that only have a market line or only a pool spread
+    combined = market.join(pool, how="outer")
+    combined.index.name = "game_id"
+    return combined.astype(object).where(combined.notna(), None)
@@ -0,0 +1,145 @@
+"""Render many charts to files in parallel
+
+A weekly report draws dozens of charts. `render_charts` takes a list of
+`ChartSpec` and renders them in a process pool. Each worker uses the
+non-interactive Agg backend, decodes the team logos once when it starts (see
+`preload_team_logos`), and writes its charts straight to PNG/SVG/PDF files.
+
+Every chart is drawn inside `plt.rc_context`, so the style and rcParams set
+by one plot function do not leak into the next chart of the same worker.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set, Tuple, Union
+
+import pandas as pd
+
+from g_nfl.utils.paths import LOGO_PATH
+
+ChartKind = Literal["scatter", "team_scatter", "bar"]
+
+# Logo sizes drawn by the plot functions by default
+DEFAULT_LOGO_SIZES = {(40, 40), (30, 30), (50, 50)}
+
+
+@dataclass
+class ChartSpec:
+    """One chart of a batch
+
+    Attributes:
+        kind: 'scatter' (plot_scatter), 'team_scatter' (plot_team_scatter) or
+            'bar' (plot_bar, plotly)
+        data: Data passed to the plot function
+        path: Output file, the format follows the suffix (.png, .svg, .pdf;
+            .html for bar charts). Image export of bar charts needs kaleido.
+        kwargs: Other arguments of the plot function (x, y, title, ...)
+        dpi: Resolution of matplotlib raster output
+    """
+
+    kind: ChartKind
+    data: pd.DataFrame
+    path: Union[str, Path]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    dpi: int = 150
+
+
+def _logo_sizes(specs: Iterable[ChartSpec]) -> Set[Tuple[int, int]]:
+    """Logo sizes the specs will draw, to decode them once per worker"""
+    sizes = set(DEFAULT_LOGO_SIZES)
+    for spec in specs:
+        logo_size = spec.kwargs.get("logo_size")
+        if logo_size:
+            sizes.add((logo_size, logo_size))
+    return sizes
+
+
+def _init_worker(logo_sizes: Set[Tuple[int, int]]):
+    """Select the Agg backend and decode the logos before the first chart"""
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+
+    if LOGO_PATH.exists():
+        from g_nfl.utils.logos import preload_team_logos
+
+        preload_team_logos(sizes=logo_sizes)
+
+
+def render_chart(spec: ChartSpec) -> Path:
+    """Draw one chart and write it to its file
+
+    Args:
+        spec: Chart to render
+
+    Returns:
+        Path of the written file
+    """
+    import matplotlib.pyplot as plt
+
+    from g_nfl.visualisation import plots
+
+    path = Path(spec.path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if spec.kind == "bar":
+        fig = plots.plot_bar(spec.data, show=False, **spec.kwargs)
+        if path.suffix == ".html":
+            fig.write_html(path)
+        else:
+            fig.write_image(path)
+        return path
+
+    plot = {"scatter": plots.plot_scatter, "team_scatter": plots.plot_team_scatter}
+    if spec.kind not in plot:
+        raise ValueError(
+            f"Unknown chart kind '{spec.kind}', use scatter, team_scatter or bar"
+        )
+
+    with plt.rc_context():
+        fig = plot[spec.kind](spec.data, show=False, **spec.kwargs)
+        try:
+            fig.savefig(path, dpi=spec.dpi)
+        finally:
+            plt.close(fig)
+    return path
+
+
+def render_charts(
+    specs: List[ChartSpec], max_workers: Optional[int] = None
+) -> List[Path]:
+    """Render charts in parallel worker processes
+
+    Args:
+        specs: Charts to render
+        max_workers: Worker processes, defaults to the number of CPUs (never
+            more than the number of charts)
+
+    Returns:
+        Paths of the written files, in the order of `specs`. Charts that failed
+        are printed and left out.
+    """
+    if not specs:
+        return []
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(specs))
+    written: Dict[int, Path] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(_logo_sizes(specs),),
+    ) as executor:
+        futures = {
+            executor.submit(render_chart, spec): i for i, spec in enumerate(specs)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                written[i] = future.result()
+            except Exception as e:
+                print(f"Error rendering chart {specs[i].path}: {e}")
+
+    return [written[i] for i in sorted(written)]
@@ -1,16 +1,21 @@
-from typing import Literal, Tuple, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, Tuple, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import plotly.express as px
-from adjustText import adjust_text
-from matplotlib.offsetbox import AnnotationBbox
 
 from g_nfl.utils.logos import get_team_logo
 from g_nfl.utils.paths import LOGO_PATH
 from g_nfl.visualisation import colors
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from matplotlib.figure import Figure
+
+# matplotlib, plotly and adjustText are imported inside the plot functions,
+# so importing this module stays fast
+
 """ Resources I found helpful
 
 Tej Seth great notebook on logos plotting basics - https://github.com/tejseth/nfl-tutorials-2022/blob/master/nfl_data_py_1.ipynb
@@ -36,7 +41,12 @@ def plot_scatter(
     flip_y: bool = False,
     custom_style: Union[dict, None] = None,
     max_marker_size=800,
-) -> None:
+    show: bool = True,
+) -> Figure:
+    import matplotlib.pyplot as plt
+    from adjustText import adjust_text
+    from matplotlib.offsetbox import AnnotationBbox
+
     # handle team columns
     if data.index.name in ["posteam", "defteam", "team"]:
         data = data.reset_index(level=0)
@@ -68,7 +78,7 @@ def plot_scatter(
 
     plt.rcParams["figure.figsize"] = [12, 8]
     plt.rcParams["figure.autolayout"] = True
-    _, ax = plt.subplots()
+    fig, ax = plt.subplots()
 
     # Add padding to the axis limits
     padding_percentage = 0.1  # Adjust this value as needed
@@ -107,39 +117,36 @@ def plot_scatter(
 
     marker_labels = []  # List to hold all text objects for adjustment
 
-    # Iterate over the DataFrame rows
-    for _, row in data.iterrows():
-        # Add the team logo
-        if add_logo:
+    # Add the team logos, one artist per team (decoded logos are cached)
+    if add_logo:
+        for xi, yi, team in zip(data[x], data[y], data["team"]):
             ab = AnnotationBbox(
-                get_team_logo(row["team"], size=(logo_size, logo_size), alpha=alpha),
-                (row[x], row[y]),
+                get_team_logo(team, size=(logo_size, logo_size), alpha=alpha),
+                (xi, yi),
                 frameon=False,
             )
             ax.add_artist(ab)
-        # if not adding a logo add a marker dot
-        else:
-            if marker_size != "":
-                size = row[marker_size] * scale_factor
-            else:
-                size = 40  # Default marker size if marker_size is not provided
-            ax.scatter(
-                row[x],
-                row[y],
-                s=size,
-                color=colors.team_unique_colors[row["team"]],
-                alpha=alpha,
-            )
-        if add_marker_label:
-            label = ax.text(
-                row[x],  # Initial offset for text placement
-                row[y],
-                row[marker],
-                fontsize=12,
-                ha="left",
-                va="center",
+    # if not adding a logo add a marker dot, all dots in a single call
+    else:
+        ax.scatter(
+            data[x],
+            data[y],
+            s=data[marker_size] * scale_factor,
+            color=[colors.team_unique_colors[team] for team in data["team"]],
+            alpha=alpha,
+        )
+    if add_marker_label:
+        for xi, yi, label in zip(data[x], data[y], data[marker]):
+            marker_labels.append(
+                ax.text(
+                    xi,  # Initial offset for text placement
+                    yi,
+                    label,
+                    fontsize=12,
+                    ha="left",
+                    va="center",
+                )
             )
-            marker_labels.append(label)
 
     # add a title
     if title:
@@ -163,7 +170,9 @@ def plot_scatter(
             force_text=0.4,  # Reduce the force to keep text closer
             lim=100,  # Limit the number of iterations
         )
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 
 def plot_team_scatter(
@@ -176,7 +185,11 @@ def plot_team_scatter(
     zero_reference: bool = True,
     flip_def: bool = False,
     alpha: float = 1.0,
-) -> None:
+    show: bool = True,
+) -> Figure:
+    import matplotlib.pyplot as plt
+    from matplotlib.offsetbox import AnnotationBbox
+
     print("deprecated, use plot_scatter() instead")
     # if team is the index of the df, turn it into a regular column
     if "team" not in data.columns:
@@ -235,7 +248,9 @@ def plot_team_scatter(
     plt.xlabel(ax_labels[0] or x)
     plt.ylabel(ax_labels[1] or y)
 
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 
 def plot_bar(
@@ -246,7 +261,10 @@ def plot_bar(
     ax_labels: Tuple[str, str] = ("", ""),
     citation: bool = True,
     dark_mode: bool = True,
-) -> None:
+    show: bool = True,
+) -> go.Figure:
+    import plotly.express as px
+
     fig = px.bar(
         data,
         x=x,
@@ -258,13 +276,13 @@ def plot_bar(
     )
     if "team" in data.columns:
         # Iterate through the data and add logos to the chart
-        for _, row in data.iterrows():
+        for team, xi, yi in zip(data["team"], data[x], data[y]):
             scale = 1.25
             fig.add_layout_image(
                 dict(
-                    source=f"https://a.espncdn.com/i/teamlogos/nfl/500/{row['team']}.png",
-                    x=row[x],
-                    y=row[y],
+                    source=f"https://a.espncdn.com/i/teamlogos/nfl/500/{team}.png",
+                    x=xi,
+                    y=yi,
                     xref="x",
                     yref="y",
                     sizex=scale,  # Adjust the size
@@ -312,4 +330,6 @@ def plot_bar(
 
     fig.update_traces(showlegend=False)
     # Show the chart
-    fig.show()
+    if show:
+        fig.show()
+    return fig